@@ -1,5 +1,10 @@
 """Accounts module."""
+import json
 import logging
+from threading import Lock
+
+from eth_account import Account as EthAccount
+from eth_account.messages import defunct_hash_message
 
 from squid_py.keeper import Keeper
 
@@ -9,16 +14,39 @@ logger = logging.getLogger('account')
 class Account:
     """Class representing an account."""
 
-    def __init__(self, address, password=None):
+    def __init__(self, address, password=None, key_file=None, private_key=None):
         """
         Hold account address, and update balances of Ether and Ocean token.
 
+        The account signs its transactions and hashes locally when it has a private key or a key
+        file, the keeper node is used to sign them otherwise.
+
         :param address: The address of this account
         :param password: account's password. This is necessary for unlocking account before doing
-            a transaction.
+            a transaction, or to decrypt the `key_file`.
+        :param key_file: path of the encrypted json keystore file of the account, str
+        :param private_key: private key of the account, hex str or bytes
         """
         self.address = address
         self.password = password
+        self.key_file = key_file
+        self._private_key = private_key
+        self._key_lock = Lock()
+
+    @property
+    def is_local(self):
+        """True if the account signs its transactions locally, bool."""
+        return bool(self._private_key or self.key_file)
+
+    @property
+    def private_key(self):
+        """Private key of the account, decrypted from the `key_file` on first use."""
+        with self._key_lock:
+            if self._private_key is None and self.key_file:
+                with open(self.key_file) as f:
+                    self._private_key = EthAccount.decrypt(json.load(f), self.password)
+
+            return self._private_key
 
     def unlock(self):
         """
@@ -26,7 +54,29 @@ class Account:
 
         :return: bool
         """
+        if self.is_local:
+            return True
+
         if self.password:
             return Keeper.unlock_account(self)
 
         return False
+
+    def sign_hash(self, msg_hash):
+        """
+        Sign a hash with the private key of the account, like `eth_sign` does.
+
+        :param msg_hash: hash to sign, bytes32
+        :return: signature, hex str
+        """
+        return EthAccount.signHash(
+            defunct_hash_message(primitive=msg_hash), self.private_key).signature.hex()
+
+    def sign_transaction(self, transaction):
+        """
+        Sign a transaction with the private key of the account.
+
+        :param transaction: dict of the transaction, with its nonce, gas and gas price
+        :return: the raw signed transaction, bytes
+        """
+        return EthAccount.signTransaction(transaction, self.private_key).rawTransaction
@@ -8,7 +8,11 @@ from squid_py.agreements.events import (
 )
 from squid_py.agreements.service_agreement import ServiceAgreement
 from squid_py.keeper import Keeper
-from .storage import get_service_agreements, record_service_agreement
+from .storage import (
+    get_service_agreements,
+    record_service_agreement,
+    update_service_agreement_status,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +54,7 @@ def register_service_agreement_consumer(storage_path, publisher_address, agreeme
 
 def process_agreement_events_consumer(publisher_address, agreement_id, did, service_agreement,
                                       price, consumer_account, condition_ids,
-                                      consume_callback):
+                                      consume_callback, from_block='latest'):
     """
 
 
@@ -62,6 +66,9 @@ def process_agreement_events_consumer(publisher_address, agreement_id, did, serv
     :param consumer_account:
     :param condition_ids:
     :param consume_callback:
+    :param from_block: first block to look for the agreement events, int. 'latest' starts after
+        the last block processed for each event, or at the current block. None resumes after
+        the last block processed for each event before a restart
     :return:
     """
     conditions_dict = service_agreement.condition_by_name
@@ -70,7 +77,8 @@ def process_agreement_events_consumer(publisher_address, agreement_id, did, serv
         agreement_id,
         60,
         lock_reward_condition.fulfillLockRewardCondition,
-        (agreement_id, price, consumer_account)
+        (agreement_id, price, consumer_account),
+        from_block=from_block
     )
 
     if consume_callback:
@@ -88,7 +96,8 @@ def process_agreement_events_consumer(publisher_address, agreement_id, did, serv
             conditions_dict['accessSecretStore'].timeout,
             escrow_reward_condition.consume_asset,
             (agreement_id, did, service_agreement, consumer_account, consume_callback),
-            _refund_callback(price, publisher_address, condition_ids)
+            _refund_callback(price, publisher_address, condition_ids),
+            from_block=from_block
         )
 
 
@@ -125,7 +134,7 @@ def register_service_agreement_publisher(storage_path, consumer_address, agreeme
 
 def process_agreement_events_publisher(publisher_account, agreement_id, did, service_agreement,
                                        price, consumer_address,
-                                       condition_ids):
+                                       condition_ids, from_block='latest'):
     """
 
     :param publisher_account:
@@ -135,6 +144,9 @@ def process_agreement_events_publisher(publisher_account, agreement_id, did, ser
     :param price:
     :param consumer_address:
     :param condition_ids:
+    :param from_block: first block to look for the agreement events, int. 'latest' starts after
+        the last block processed for each event, or at the current block. None resumes after
+        the last block processed for each event before a restart
     :return:
     """
     conditions_dict = service_agreement.condition_by_name
@@ -144,7 +156,8 @@ def process_agreement_events_publisher(publisher_account, agreement_id, did, ser
         conditions_dict['lockReward'].timeout,
         access_secret_store_condition.fulfillAccessSecretStoreCondition,
         (agreement_id, did, service_agreement,
-         consumer_address, publisher_account)
+         consumer_address, publisher_account),
+        from_block=from_block
     )
 
     keeper.access_secret_store_condition.subscribe_condition_fulfilled(
@@ -152,7 +165,8 @@ def process_agreement_events_publisher(publisher_account, agreement_id, did, ser
         conditions_dict['accessSecretStore'].timeout,
         escrow_reward_condition.fulfillEscrowRewardCondition,
         (agreement_id, service_agreement,
-         price, consumer_address, publisher_account, condition_ids)
+         price, consumer_address, publisher_account, condition_ids),
+        from_block=from_block
     )
 
     keeper.escrow_reward_condition.subscribe_condition_fulfilled(
@@ -160,7 +174,8 @@ def process_agreement_events_publisher(publisher_account, agreement_id, did, ser
         conditions_dict['escrowReward'].timeout,
         verify_reward_condition.verifyRewardTokens,
         (agreement_id, did, service_agreement,
-         price, consumer_address, publisher_account)
+         price, consumer_address, publisher_account),
+        from_block=from_block
     )
 
 
@@ -168,6 +183,9 @@ def execute_pending_service_agreements(storage_path, account, actor_type, did_re
     """
      Iterates over pending service agreements recorded in the local storage,
     fetches their service definitions, and subscribes to service agreement events.
+    The events are looked up from the last block processed before the restart, the listeners
+    completed before the restart are not resumed. The agreements whose conditions are all
+    fulfilled or aborted are marked as completed in the local storage and skipped.
 
     :param storage_path:
     :param account:
@@ -195,14 +213,23 @@ def execute_pending_service_agreements(storage_path, account, actor_type, did_re
             service_agreement = ServiceAgreement.from_service_dict(service.as_dictionary())
             condition_ids = service_agreement.generate_agreement_condition_ids(
                 agreement_id, did, consumer, provider, keeper)
+            if not _is_agreement_pending(keeper, condition_ids):
+                update_service_agreement_status(storage_path, agreement_id, 'completed')
+                continue
 
             if actor_type == 'consumer':
                 assert account.address == consumer
                 process_agreement_events_consumer(
                     provider, agreement_id, did, service_agreement,
-                    price, account, condition_ids, None)
+                    price, account, condition_ids, None, from_block=None)
             else:
                 assert account.address == provider
                 process_agreement_events_publisher(
                     account, agreement_id, did, service_agreement,
-                    price, consumer, condition_ids)
+                    price, consumer, condition_ids, from_block=None)
+
+
+def _is_agreement_pending(keeper, condition_ids):
+    # a condition that can not be read is considered unfulfilled
+    conditions = keeper.condition_manager.get_conditions(list(condition_ids))
+    return any(condition is None or condition.state == 1 for condition in conditions)
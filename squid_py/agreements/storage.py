@@ -79,3 +79,111 @@ def get_service_agreements(storage_path, status='pending'):
         ]
     finally:
         conn.close()
+
+
+def record_public_key(storage_path, address, public_key):
+    """
+    Records the public key of an account address.
+
+    :param storage_path:
+    :param address: Account address, str
+    :param public_key: hex str
+    :return:
+    """
+    conn = sqlite3.connect(storage_path)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''CREATE TABLE IF NOT EXISTS public_keys
+               (address VARCHAR PRIMARY KEY, public_key VARCHAR);'''
+        )
+        cursor.execute(
+            'INSERT OR REPLACE INTO public_keys VALUES (?,?)',
+            (address.lower(), public_key),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def get_public_key(storage_path, address):
+    """
+    Get the public key recorded for an account address.
+
+    :param storage_path:
+    :param address: Account address, str
+    :return: hex str, None if the public key of the address is not recorded
+    """
+    conn = sqlite3.connect(storage_path)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''CREATE TABLE IF NOT EXISTS public_keys
+               (address VARCHAR PRIMARY KEY, public_key VARCHAR);'''
+        )
+        row = cursor.execute(
+            'SELECT public_key FROM public_keys WHERE address=?;',
+            (address.lower(),)
+        ).fetchone()
+        return row[0] if row else None
+    finally:
+        conn.close()
+
+
+def record_published_asset(storage_path, batch_id, item_key, did, checksum, url, status):
+    """
+    Records the progress of an asset published by `OceanAssets.create_many`.
+
+    :param storage_path:
+    :param batch_id: id of the publishing batch, str
+    :param item_key: index of the asset in the batch, str
+    :param did: DID of the asset, str
+    :param checksum: checksum of the asset metadata, str
+    :param url: url of the asset DDO, str
+    :param status: 'published' once in aquarius, 'registered' once registered on-chain
+    :return:
+    """
+    conn = sqlite3.connect(storage_path)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''CREATE TABLE IF NOT EXISTS published_assets
+               (batch_id VARCHAR, item_key VARCHAR, did VARCHAR, checksum VARCHAR, url VARCHAR,
+                status VARCHAR(10), PRIMARY KEY (batch_id, item_key));'''
+        )
+        cursor.execute(
+            'INSERT OR REPLACE INTO published_assets VALUES (?,?,?,?,?,?)',
+            (batch_id, item_key, did, checksum, url, status),
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def get_published_assets(storage_path, batch_id):
+    """
+    Get the assets recorded for a publishing batch.
+
+    :param storage_path:
+    :param batch_id: id of the publishing batch, str
+    :return: dict of item key and tuple of (did, checksum, url, status)
+    """
+    conn = sqlite3.connect(storage_path)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''CREATE TABLE IF NOT EXISTS published_assets
+               (batch_id VARCHAR, item_key VARCHAR, did VARCHAR, checksum VARCHAR, url VARCHAR,
+                status VARCHAR(10), PRIMARY KEY (batch_id, item_key));'''
+        )
+        return {
+            row[0]: tuple(row[1:]) for row in cursor.execute(
+                '''
+                SELECT item_key, did, checksum, url, status
+                FROM published_assets
+                WHERE batch_id=?;
+                ''',
+                (batch_id,))
+        }
+    finally:
+        conn.close()
@@ -38,7 +38,8 @@ def get_sla_template_dict(path):
         return json.load(template_file)
 
 
-def make_public_key_and_authentication(did, publisher_address, web3):
+def make_public_key_and_authentication(did, publisher_address, web3, storage_path=None,
+                                       private_key=None):
     """Create a public key and authentication sections to include in a DDO (DID document).
     The public key is derived from the ethereum address by signing an arbitrary message
     then using ec recover to extract the public key.
@@ -47,10 +48,13 @@ def make_public_key_and_authentication(did, publisher_address, web3):
     :param did: DID, str
     :param publisher_address: Address, str
     :param web3: Web3 instance
+    :param storage_path: path of the sqlite database to persist the public key in, str
+    :param private_key: private key of the publisher when it signs locally, hex str or bytes
     :return: Tuple(str, str)
     """
     # set public key
-    public_key_value = get_public_key_from_address(web3, publisher_address).to_hex()
+    public_key_value = get_public_key_from_address(
+        web3, publisher_address, storage_path, private_key).to_hex()
     pub_key = PublicKeyHex('keys-1', **{'value': public_key_value, 'owner': publisher_address,
                                         'type': PUBLIC_KEY_TYPE_HEX})
     pub_key.assign_did(did)
@@ -4,11 +4,12 @@ Help to communicate with the metadata store.
 """
 import json
 import logging
-
-import requests
+from functools import partial
 
 from squid_py.aquarius.exceptions import AquariusGenericError
+from squid_py.aquarius.search_cache import SearchCache
 from squid_py.assets.asset import Asset
+from squid_py.http_session_provider import HttpSessionProvider
 
 logger = logging.getLogger('aquarius')
 
@@ -28,6 +29,8 @@ class Aquarius:
 
         self._base_url = f'{aquarius_url}/api/v1/aquarius/assets'
         self._headers = {'content-type': 'application/json'}
+        self._session = HttpSessionProvider.get_session()
+        self._search_cache = None
 
         logging.debug(f'Metadata Store connected at {aquarius_url}')
         logging.debug(f'Metadata Store API documentation at {aquarius_url}/api/v1/docs')
@@ -38,6 +41,19 @@ class Aquarius:
         """Base URL of the aquarius instance."""
         return f'{self._base_url}/ddo'
 
+    @property
+    def search_cache(self):
+        """SearchCache of the search responses, None if they are not cached."""
+        return self._search_cache
+
+    def set_search_cache(self, search_cache):
+        """
+        Cache the responses of `text_search` and `query_search`.
+
+        :param search_cache: SearchCache, None to stop caching
+        """
+        self._search_cache = search_cache
+
     def get_service_endpoint(self, did):
         """
         Retrieve the endpoint with the ddo for a given did.
@@ -53,7 +69,7 @@ class Aquarius:
 
         :return: List of DID string
         """
-        response = requests.get(self._base_url).content
+        response = self._session.get(self._base_url).content
         if not response:
             return {}
 
@@ -78,7 +94,7 @@ class Aquarius:
         :param did: Asset DID string
         :return: DDO instance
         """
-        response = requests.get(f'{self.url}/{did}').content
+        response = self._session.get(f'{self.url}/{did}').content
         if not response:
             return {}
         try:
@@ -91,6 +107,22 @@ class Aquarius:
             return {}
         return Asset(dictionary=parsed_response)
 
+    def asset_exists(self, did):
+        """
+        Check if an asset is registered for a given did, without downloading its ddo.
+
+        :param did: Asset DID string
+        :return: bool
+        """
+        response = self._session.head(f'{self.url}/{did}')
+        if response.status_code == 200:
+            return True
+        if response.status_code == 404:
+            return False
+
+        raise AquariusGenericError(
+            f'Unable to check if DID {did} exists: {response.status_code} {response.text}')
+
     def get_asset_metadata(self, did):
         """
         Retrieve asset metadata for a given did.
@@ -98,7 +130,7 @@ class Aquarius:
         :param did: Asset DID string
         :return: metadata key of the DDO instance
         """
-        response = requests.get(f'{self._base_url}/metadata/{did}').content
+        response = self._session.get(f'{self._base_url}/metadata/{did}').content
         if not response:
             return {}
         try:
@@ -117,7 +149,47 @@ class Aquarius:
 
         :return: List of DDO instance
         """
-        return json.loads(requests.get(self.url).content)
+        return json.loads(self._session.get(self.url).content)
+
+    def iter_assets_ddo(self, page_size=100):
+        """
+        Iterate over all the ddos registered in the aquarius instance.
+
+        The ddos are requested one page at a time, so only one page is held in memory.
+
+        :param page_size: Integer with the number of ddos requested per page.
+        :return: generator of Asset instances
+        """
+        page = 0
+        first_did = None
+        while True:
+            # the pages are not cached, to keep the memory bounded
+            ddo_list = self._search(
+                None, partial(self._post_query, {'query': {}, 'offset': page_size, 'page': page}))
+            if not ddo_list:
+                return
+
+            if ddo_list[0].get('id') == first_did:
+                # the instance ignores the paging and returns the first page again
+                return
+            first_did = ddo_list[0].get('id')
+
+            for ddo in ddo_list:
+                yield Asset(dictionary=ddo)
+
+            if len(ddo_list) < page_size:
+                return
+            page += 1
+
+    def iter_assets(self, page_size=100):
+        """
+        Iterate over the DIDs of all the assets registered in the aquarius instance.
+
+        :param page_size: Integer with the number of ddos requested per page.
+        :return: generator of DID strings
+        """
+        for asset in self.iter_assets_ddo(page_size):
+            yield asset.did
 
     def publish_asset_ddo(self, ddo):
         """
@@ -128,8 +200,8 @@ class Aquarius:
         """
         try:
             asset_did = ddo.did
-            response = requests.post(self.url, data=ddo.as_text(),
-                                     headers=self._headers)
+            response = self._session.post(self.url, data=ddo.as_text(),
+                                          headers=self._headers)
         except AttributeError:
             raise AttributeError('DDO invalid. Review that all the required parameters are filled.')
         if response.status_code == 500:
@@ -139,6 +211,7 @@ class Aquarius:
             raise Exception(f'{response.status_code} ERROR Full error: \n{response.text}')
         elif response.status_code == 201:
             response = json.loads(response.content)
+            self._clear_search_cache()
             logger.debug(f'Published asset DID {asset_did}')
             return response
         else:
@@ -153,9 +226,10 @@ class Aquarius:
         :param ddo: DDO instance
         :return: API response (depends on implementation)
         """
-        response = requests.put(f'{self.url}/{did}', data=ddo.as_text(),
-                                headers=self._headers)
+        response = self._session.put(f'{self.url}/{did}', data=ddo.as_text(),
+                                     headers=self._headers)
         if response.status_code == 200 or response.status_code == 201:
+            self._clear_search_cache()
             return json.loads(response.content)
         else:
             raise Exception(f'Unable to update DDO: {response.content}')
@@ -183,15 +257,10 @@ class Aquarius:
         :return: List of DDO instance
         """
         payload = {"text": text, "sort": sort, "offset": offset, "page": page}
-        response = requests.get(
-            f'{self.url}/query',
-            params=payload,
-            headers=self._headers
+        return self._search(
+            SearchCache.text_search_key(text, sort, offset, page),
+            partial(self._session.get, f'{self.url}/query', params=payload)
         )
-        if response.status_code == 200:
-            return self._parse_search_response(response.content)
-        else:
-            raise Exception(f'Unable to search for DDO: {response.content}')
 
     def query_search(self, search_query):
         """
@@ -208,11 +277,27 @@ class Aquarius:
         :param search_query: Python dictionary, query following mongodb syntax
         :return: List of DDO instance
         """
-        response = requests.post(
+        return self._search(SearchCache.query_search_key(search_query),
+                            partial(self._post_query, search_query))
+
+    def _post_query(self, search_query, headers):
+        return self._session.post(
             f'{self.url}/query',
             data=json.dumps(search_query),
-            headers=self._headers
+            headers=headers
         )
+
+    def _clear_search_cache(self):
+        # the cached results may include the assets changed by this client
+        if self._search_cache is not None:
+            self._search_cache.clear()
+
+    def _search(self, cache_key, request):
+        if self._search_cache is None or cache_key is None:
+            response = request(headers=self._headers)
+        else:
+            response = self._search_cache.get_response(cache_key, request, self._headers)
+
         if response.status_code == 200:
             return self._parse_search_response(response.content)
         else:
@@ -225,8 +310,9 @@ class Aquarius:
         :param did: Asset DID string
         :return: API response (depends on implementation)
         """
-        response = requests.delete(f'{self.url}/{did}', headers=self._headers)
+        response = self._session.delete(f'{self.url}/{did}', headers=self._headers)
         if response.status_code == 200:
+            self._clear_search_cache()
             logging.debug(f'Removed asset DID: {did} from metadata store')
             return response
 
@@ -239,7 +325,7 @@ class Aquarius:
         :param metadata: Json dict
         :return: bool
         """
-        response = requests.post(
+        response = self._session.post(
             f'{self.url}/validate',
             data=json.dumps(metadata),
             headers=self._headers
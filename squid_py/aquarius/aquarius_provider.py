@@ -5,11 +5,17 @@ from squid_py.aquarius.aquarius import Aquarius
 class AquariusProvider:
     """Provides the Aquarius instance."""
     _aquarius_class = Aquarius
+    _aquarius_instances = dict()
 
     @staticmethod
     def get_aquarius(url):
-        """ Get an Aquarius instance."""
-        return AquariusProvider._aquarius_class(url)
+        """ Get an Aquarius instance, the instances are reused for each url."""
+        aquarius = AquariusProvider._aquarius_instances.get(url)
+        if aquarius is None:
+            aquarius = AquariusProvider._aquarius_class(url)
+            AquariusProvider._aquarius_instances[url] = aquarius
+
+        return aquarius
 
     @staticmethod
     def set_aquarius_class(aquarius_class):
@@ -19,3 +25,4 @@ class AquariusProvider:
         :param aquarius_class: Aquarius or similar compatible class
         """
         AquariusProvider._aquarius_class = aquarius_class
+        AquariusProvider._aquarius_instances = dict()
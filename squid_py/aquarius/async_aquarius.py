@@ -0,0 +1,100 @@
+"""
+Aquarius module.
+Asyncio client of the metadata store.
+"""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from squid_py.aquarius.aquarius_provider import AquariusProvider
+from squid_py.config_provider import ConfigProvider
+
+logger = logging.getLogger('aquarius')
+
+
+class AsyncAquarius:
+    """
+    Asyncio counterpart of `Aquarius`.
+
+    This is not a native asyncio http client: the requests are sent by the `Aquarius` instance
+    of the url, with its pooled http session, from a thread pool, so several requests can run
+    concurrently without blocking the event loop. The pool is shared by the instances and has
+    `http.pool_size` threads, the number of connections kept alive to each host, so at most that
+    many requests run at the same time and the next ones wait for a thread. A request cancelled
+    by an asyncio timeout keeps its thread until it completes or reaches the `http.timeout` of
+    the session.
+    """
+    _shared_executor = None
+    _shared_executor_lock = Lock()
+
+    def __init__(self, aquarius_url, loop=None, executor=None):
+        """
+
+        :param aquarius_url: Url of the aquarius instance.
+        :param loop: asyncio event loop, defaults to the current event loop
+        :param executor: `concurrent.futures.Executor` sending the requests, defaults to the
+            executor shared by the instances, see `get_executor`
+        """
+        self._aquarius = AquariusProvider.get_aquarius(aquarius_url)
+        self._loop = loop
+        self._executor = executor
+
+    @staticmethod
+    def get_executor():
+        """Return the thread pool sending the requests of the instances (singleton)."""
+        with AsyncAquarius._shared_executor_lock:
+            if AsyncAquarius._shared_executor is None:
+                AsyncAquarius._shared_executor = ThreadPoolExecutor(
+                    max_workers=ConfigProvider.get_config().http_pool_size,
+                    thread_name_prefix='aquarius'
+                )
+            return AsyncAquarius._shared_executor
+
+    @property
+    def url(self):
+        """Base URL of the aquarius instance."""
+        return self._aquarius.url
+
+    async def get_asset_ddo(self, did):
+        """
+        Retrieve asset ddo for a given did.
+
+        :param did: Asset DID string
+        :return: DDO instance
+        """
+        return await self._run(self._aquarius.get_asset_ddo, did)
+
+    async def text_search(self, text, sort=None, offset=100, page=0):
+        """
+        Search in aquarius using text query, see `Aquarius.text_search`.
+
+        :param text: String to be search.
+        :param sort: 1/-1 to sort ascending or descending.
+        :param offset: Integer with the number of elements displayed per page.
+        :param page: Integer with the number of page.
+        :return: List of DDO instance
+        """
+        return await self._run(self._aquarius.text_search, text, sort, offset, page)
+
+    async def query_search(self, search_query):
+        """
+        Search using a query, see `Aquarius.query_search`.
+
+        :param search_query: Python dictionary, query following mongodb syntax
+        :return: List of DDO instance
+        """
+        return await self._run(self._aquarius.query_search, search_query)
+
+    async def publish_asset_ddo(self, ddo):
+        """
+        Register asset ddo in aquarius.
+
+        :param ddo: DDO instance
+        :return: API response (depends on implementation)
+        """
+        return await self._run(self._aquarius.publish_asset_ddo, ddo)
+
+    def _run(self, fn, *args):
+        loop = self._loop or asyncio.get_event_loop()
+        return loop.run_in_executor(self._executor or AsyncAquarius.get_executor(), fn, *args)
@@ -0,0 +1,91 @@
+"""
+Aquarius module.
+Cache of the search responses of the metadata store.
+"""
+import json
+import time
+from collections import namedtuple
+from threading import Lock
+
+from squid_py.utils.cache import LRUCache
+
+_Entry = namedtuple('_Entry', ('content', 'etag', 'fresh_until'))
+_CachedResponse = namedtuple('_CachedResponse', ('status_code', 'content'))
+
+
+class SearchCache:
+    """
+    Cache of the responses of the aquarius search requests, keyed by the normalised query.
+
+    A response is reused without any request during `ttl` seconds. After that it is revalidated
+    with its `ETag`, so an unchanged result costs one `304 Not Modified` response, and requested
+    again if aquarius did not send an `ETag`.
+    """
+
+    def __init__(self, max_size=1000, ttl=60):
+        """
+
+        :param max_size: max number of responses in the cache, int
+        :param ttl: float time in seconds a response is used without revalidating it
+        """
+        self.ttl = ttl
+        self._entries = LRUCache(max_size)
+        self._stats = {'hits': 0, 'revalidations': 0, 'misses': 0}
+        self._lock = Lock()
+
+    @staticmethod
+    def text_search_key(text, sort, offset, page):
+        """Return the cache key of a text search."""
+        return 'text', text, json.dumps(sort, sort_keys=True), offset, page
+
+    @staticmethod
+    def query_search_key(search_query):
+        """Return the cache key of a query search."""
+        return 'query', json.dumps(search_query, sort_keys=True)
+
+    def get_response(self, key, request, headers):
+        """
+        Return the cached response of a search, sending the request if it is not fresh.
+
+        :param key: cache key of the search, see `text_search_key` and `query_search_key`
+        :param request: function sending the search request with the `headers` keyword argument
+            and returning the `requests.Response`
+        :param headers: dict of the headers of the request
+        :return: the `requests.Response`, or an object with the same `status_code` and `content`
+        """
+        entry = self._entries.get(key)
+        if entry is not None and entry.fresh_until > time.monotonic():
+            self._count('hits')
+            return _CachedResponse(200, entry.content)
+
+        if entry is not None and entry.etag:
+            headers = dict(headers, **{'If-None-Match': entry.etag})
+        response = request(headers=headers)
+
+        if response.status_code == 304 and entry is not None:
+            self._count('revalidations')
+            self._entries.set(key, entry._replace(fresh_until=time.monotonic() + self.ttl))
+            return _CachedResponse(200, entry.content)
+
+        self._count('misses')
+        if response.status_code == 200:
+            self._entries.set(key, _Entry(response.content, response.headers.get('ETag'),
+                                          time.monotonic() + self.ttl))
+        return response
+
+    def clear(self):
+        """Remove all the cached responses."""
+        self._entries.clear()
+
+    def get_stats(self):
+        """
+        Return the counters of the cache.
+
+        :return: dict with the number of `hits`, `revalidations` and `misses`, and the `size`
+        """
+        with self._lock:
+            return dict(self._stats, size=len(self._entries))
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
@@ -3,11 +3,11 @@ import json
 import logging
 import os
 
-import requests
 from tqdm import tqdm
 
 from squid_py.agreements.service_agreement import ServiceAgreement
 from squid_py.exceptions import OceanInitializeServiceAgreementError
+from squid_py.http_session_provider import HttpSessionProvider
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +22,17 @@ class Brizo:
     - run_compute_service (not implemented yet)
 
     """
-    _http_client = requests
+    _http_client = None
 
     @staticmethod
     def set_http_client(http_client):
-        """Set the http client to something other than the default `requests`"""
+        """Set the http client to something other than the default shared `requests` session"""
         Brizo._http_client = http_client
 
+    @staticmethod
+    def _get_http_client():
+        return Brizo._http_client or HttpSessionProvider.get_session()
+
     @staticmethod
     def initialize_service_agreement(did, agreement_id, service_definition_id, signature,
                                      account_address,
@@ -48,7 +52,7 @@ class Brizo:
         payload = Brizo._prepare_purchase_payload(
             did, agreement_id, service_definition_id, signature, account_address
         )
-        response = Brizo._http_client.post(
+        response = Brizo._get_http_client().post(
             purchase_endpoint, data=payload,
             headers={'content-type': 'application/json'}
         )
@@ -86,7 +90,7 @@ class Brizo:
                            f'{service_agreement_id}&consumerAddress={account_address}'
                            )
             logger.info(f'invoke consume endpoint with this url: {consume_url}')
-            response = Brizo._http_client.get(consume_url, stream=True)
+            response = Brizo._get_http_client().get(consume_url, stream=True)
 
             file_name = os.path.basename(url)
             total_size = response.headers.get('content-length', 0)
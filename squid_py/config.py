@@ -10,15 +10,33 @@ DEFAULT_KEEPER_HOST = 'localhost'
 DEFAULT_KEEPER_PORT = 8545
 DEFAULT_KEEPER_URL = 'http://localhost:8545'
 DEFAULT_KEEPER_PATH = 'artifacts'
+DEFAULT_KEEPER_BATCH_SIZE = 0
+DEFAULT_KEEPER_BATCH_LATENCY = 0.0
 DEFAULT_GAS_LIMIT = 4000000
+DEFAULT_EVENT_CONFIRMATIONS = 0
+DEFAULT_EVENT_MAX_WORKERS = 32
+DEFAULT_DID_REGISTRY_INDEX = False
+DEFAULT_DID_REGISTRY_INDEX_FROM_BLOCK = 0
 DEFAULT_NAME_AQUARIUS_URL = 'http://localhost:5000'
 DEFAULT_STORAGE_PATH = 'squid_py.db'
+DEFAULT_HTTP_POOL_SIZE = 10
+DEFAULT_HTTP_MAX_RETRIES = 3
+DEFAULT_HTTP_TIMEOUT = 60
 
 NAME_KEEPER_URL = 'keeper.url'
 NAME_KEEPER_PATH = 'keeper.path'
+NAME_KEEPER_BATCH_SIZE = 'keeper.batch_size'
+NAME_KEEPER_BATCH_LATENCY = 'keeper.batch_latency'
 NAME_GAS_LIMIT = 'gas_limit'
+NAME_EVENT_CONFIRMATIONS = 'event.confirmations'
+NAME_EVENT_MAX_WORKERS = 'event.max_workers'
+NAME_DID_REGISTRY_INDEX = 'did_registry.index'
+NAME_DID_REGISTRY_INDEX_FROM_BLOCK = 'did_registry.index_from_block'
 NAME_AQUARIUS_URL = 'aquarius.url'
 NAME_STORAGE_PATH = 'storage.path'
+NAME_HTTP_POOL_SIZE = 'http.pool_size'
+NAME_HTTP_MAX_RETRIES = 'http.max_retries'
+NAME_HTTP_TIMEOUT = 'http.timeout'
 
 NAME_SECRET_STORE_URL = 'secret_store.url'
 NAME_PARITY_URL = 'parity.url'
@@ -28,7 +46,11 @@ NAME_PARITY_PASSWORD = 'parity.password'
 environ_names = {
     NAME_KEEPER_URL: ['KEEPER_URL', 'Keeper URL'],
     NAME_KEEPER_PATH: ['KEEPER_PATH', 'Path to the keeper contracts'],
+    NAME_KEEPER_BATCH_SIZE: ['KEEPER_BATCH_SIZE', 'Max number of keeper calls in one batch'],
+    NAME_KEEPER_BATCH_LATENCY: ['KEEPER_BATCH_LATENCY', 'Max seconds to wait to batch calls'],
     NAME_GAS_LIMIT: ['GAS_LIMIT', 'Gas limit'],
+    NAME_EVENT_CONFIRMATIONS: ['EVENT_CONFIRMATIONS', 'Blocks to wait before handling an event'],
+    NAME_EVENT_MAX_WORKERS: ['EVENT_MAX_WORKERS', 'Max number of event callbacks running'],
     NAME_AQUARIUS_URL: ['AQUARIUS_URL', 'Aquarius URL'],
     NAME_STORAGE_PATH: ['STORAGE_PATH', 'Path to the local database file'],
     NAME_SECRET_STORE_URL: ['SECRET_STORE_URL', 'Secret Store URL'],
@@ -41,7 +63,13 @@ config_defaults = {
     'keeper-contracts': {
         NAME_KEEPER_URL: DEFAULT_KEEPER_URL,
         NAME_KEEPER_PATH: DEFAULT_KEEPER_PATH,
+        NAME_KEEPER_BATCH_SIZE: DEFAULT_KEEPER_BATCH_SIZE,
+        NAME_KEEPER_BATCH_LATENCY: DEFAULT_KEEPER_BATCH_LATENCY,
         NAME_GAS_LIMIT: DEFAULT_GAS_LIMIT,
+        NAME_EVENT_CONFIRMATIONS: DEFAULT_EVENT_CONFIRMATIONS,
+        NAME_EVENT_MAX_WORKERS: DEFAULT_EVENT_MAX_WORKERS,
+        NAME_DID_REGISTRY_INDEX: DEFAULT_DID_REGISTRY_INDEX,
+        NAME_DID_REGISTRY_INDEX_FROM_BLOCK: DEFAULT_DID_REGISTRY_INDEX_FROM_BLOCK,
         NAME_SECRET_STORE_URL: '',
         NAME_PARITY_URL: '',
         NAME_PARITY_ADDRESS: '',
@@ -49,7 +77,10 @@ config_defaults = {
     },
     'resources': {
         NAME_AQUARIUS_URL: DEFAULT_NAME_AQUARIUS_URL,
-        NAME_STORAGE_PATH: DEFAULT_STORAGE_PATH
+        NAME_STORAGE_PATH: DEFAULT_STORAGE_PATH,
+        NAME_HTTP_POOL_SIZE: DEFAULT_HTTP_POOL_SIZE,
+        NAME_HTTP_MAX_RETRIES: DEFAULT_HTTP_MAX_RETRIES,
+        NAME_HTTP_TIMEOUT: DEFAULT_HTTP_TIMEOUT
     }
 }
 
@@ -66,6 +97,12 @@ class Config(configparser.ConfigParser):
         [keeper-contracts]
         keeper.url = http://localhost:8545                            # Keeper-contracts url.
         keeper.path = artifacts                                       # Path of json abis.
+        keeper.batch_size = 0                                         # Calls per batch, 0 disables.
+        keeper.batch_latency = 0.0                                    # Max wait to batch calls.
+        event.confirmations = 0                                       # Blocks on top of events.
+        event.max_workers = 32                                        # Event callbacks running.
+        did_registry.index = false                                    # Index DIDs in storage.path.
+        did_registry.index_from_block = 0                             # First block indexed.
         secret_store.url = http://localhost:12001                     # Secret store url.
         parity.url = http://localhost:8545                            # Parity client url.
         parity.address = 0x00bd138abd70e2f00903268f3db08f2d25677c9e   # Partity account address.
@@ -74,6 +111,9 @@ class Config(configparser.ConfigParser):
         aquarius.url = http://localhost:5000                          # Aquarius url.
         brizo.url = http://localhost:8030                             # Brizo url.
         storage.path = squid_py.db                                    # Path of sla back-up storage.
+        http.pool_size = 10                                           # Connections kept per host.
+        http.max_retries = 3                                          # Retries of failed requests.
+        http.timeout = 60                                             # Http timeout in seconds.
 
         :param filename: Path of the config file, str.
         :param options_dict: Python dict with the config, dict.
@@ -130,16 +170,61 @@ class Config(configparser.ConfigParser):
         """Path to save the current execution of the service agreements and restart if needed."""
         return self.get('resources', NAME_STORAGE_PATH)
 
+    @property
+    def http_pool_size(self):
+        """Max number of http connections kept alive to each host."""
+        return int(self.get('resources', NAME_HTTP_POOL_SIZE))
+
+    @property
+    def http_max_retries(self):
+        """Number of retries of the idempotent http requests failing to connect."""
+        return int(self.get('resources', NAME_HTTP_MAX_RETRIES))
+
+    @property
+    def http_timeout(self):
+        """Timeout in seconds of the http requests, 0 for no timeout."""
+        return float(self.get('resources', NAME_HTTP_TIMEOUT))
+
     @property
     def keeper_url(self):
         """URL of the keeper. (e.g.): http://mykeeper:8545."""
         return self.get(self._section_name, NAME_KEEPER_URL)
 
+    @property
+    def keeper_batch_size(self):
+        """Max number of concurrent keeper calls in one JSON-RPC batch, 0 disables batching."""
+        return int(self.get(self._section_name, NAME_KEEPER_BATCH_SIZE))
+
+    @property
+    def keeper_batch_latency(self):
+        """Max time in seconds to wait for concurrent keeper calls to join a batch."""
+        return float(self.get(self._section_name, NAME_KEEPER_BATCH_LATENCY))
+
+    @property
+    def did_registry_index(self):
+        """True to look up the DIDRegistry attributes in a local index at `storage_path`."""
+        return self.getboolean(self._section_name, NAME_DID_REGISTRY_INDEX)
+
+    @property
+    def did_registry_index_from_block(self):
+        """Block the DIDRegistry index starts from, the block the DIDRegistry was deployed in."""
+        return int(self.get(self._section_name, NAME_DID_REGISTRY_INDEX_FROM_BLOCK))
+
     @property
     def gas_limit(self):
         """Ethereum gas limit."""
         return int(self.get(self._section_name, NAME_GAS_LIMIT))
 
+    @property
+    def event_confirmations(self):
+        """Number of blocks mined on top of an event before its callbacks are called."""
+        return int(self.get(self._section_name, NAME_EVENT_CONFIRMATIONS))
+
+    @property
+    def event_max_workers(self):
+        """Max number of event callbacks running at the same time."""
+        return int(self.get(self._section_name, NAME_EVENT_MAX_WORKERS))
+
     @property
     def aquarius_url(self):
         """URL of aquarius component. (e.g.): http://myaquarius:5000."""
@@ -23,6 +23,15 @@ from .service import Service
 logger = logging.getLogger('ddo')
 
 
+def generate_private_key():
+    """
+    Generate the RSA private key of a DDO signature.
+
+    :return: Private key pem, bytes
+    """
+    return RSA.generate(KEY_PAIR_MODULUS_BIT, e=65537).exportKey("PEM")
+
+
 class DDO:
     """DDO class to create, import, export, validate DDO objects."""
 
@@ -107,7 +116,8 @@ class DDO:
         logger.debug(f'Adding authentication {authentication}')
         self._authentications.append(authentication)
 
-    def add_signature(self, public_key_store_type=PUBLIC_KEY_STORE_TYPE_PEM, is_embedded=False):
+    def add_signature(self, public_key_store_type=PUBLIC_KEY_STORE_TYPE_PEM, is_embedded=False,
+                      private_key_pem=None):
         """
         Add signature.
 
@@ -116,12 +126,14 @@ class DDO:
 
         :param public_key_store_type: Public key store type, str
         :param is_embedded: bool
+        :param private_key_pem: Private key pem of the signature, see `generate_private_key`.
+            A new key is generated if None.
         :return Private key pem, str
         """
-
-        key_pair = RSA.generate(KEY_PAIR_MODULUS_BIT, e=65537)
+        if private_key_pem is None:
+            private_key_pem = generate_private_key()
+        key_pair = RSA.importKey(private_key_pem)
         public_key_raw = key_pair.publickey()
-        private_key_pem = key_pair.exportKey("PEM")
 
         # find the current public key count
         next_index = self._get_public_key_count() + 1
@@ -1,20 +1,36 @@
 """DID Resolver module."""
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from squid_py.aquarius.aquarius_provider import AquariusProvider
 from squid_py.did import did_to_id_bytes
+from squid_py.utils.cache import LRUCache
 
 logger = logging.getLogger('keeper')
 
+DEFAULT_CACHE_SIZE = 1000
+DEFAULT_CACHE_TTL = 300
+
 
 class DIDResolver:
     """
     DID Resolver class
     Resolve DID to a URL/DDO.
+
+    The resolved DDOs are cached with the block number the DID was last updated on-chain, so
+    resolving a DID again only reads that block number from the registry. The cache is shared
+    by the resolvers unless one is given.
     """
+    _ddo_cache = LRUCache(DEFAULT_CACHE_SIZE, DEFAULT_CACHE_TTL)
+
+    def __init__(self, did_registry, ddo_cache=None):
+        """
 
-    def __init__(self, did_registry):
+        :param did_registry: DIDRegistry
+        :param ddo_cache: LRUCache of the resolved DDOs
+        """
         self._did_registry = did_registry
+        self._cache = ddo_cache if ddo_cache is not None else DIDResolver._ddo_cache
 
     def resolve(self, did):
         """
@@ -35,18 +51,99 @@ class DIDResolver:
         if not isinstance(did_bytes, bytes):
             raise TypeError('Invalid did: a 32 Byte DID value required.')
 
+        block_number = self._did_registry.get_block_number_updated(did_bytes)
+        cache_key = (self._did_registry.address, did_bytes)
+        cached = self._cache.get(cache_key)
+        if cached and cached[0] == block_number:
+            return cached[1]
+
         # resolve a DID to a DDO
-        url = self.get_resolve_url(did_bytes)
+        url = self.get_resolve_url(did_bytes, block_number)
         logger.debug(f'found did {did} -> url={url}')
-        return AquariusProvider.get_aquarius(url).get_asset_ddo(did)
+        ddo = AquariusProvider.get_aquarius(url).get_asset_ddo(did)
+        if ddo and block_number:
+            self._cache.set(cache_key, (block_number, ddo))
+        return ddo
+
+    def resolve_many(self, dids, max_workers=10):
+        """
+        Resolve many DIDs to their DDOs.
+
+        The registry is read with one batch of `getBlockNumberUpdated` calls and one
+        `eth_getLogs` call for all the DIDs not cached, then the DDOs are fetched concurrently
+        from their Aquarius instances.
+
+        :param dids: list of DID strings
+        :param max_workers: max number of DDOs fetched at the same time, int
+        :return: list of DDOs in the order of `dids`, None for the DIDs that cannot be resolved
+        :raises ValueError: if a did is invalid
+        """
+        dids_bytes = [did_to_id_bytes(did) for did in dids]
+        block_numbers = self._did_registry.get_block_numbers_updated(dids_bytes)
+        ddos = dict()
+        unresolved = dict()
+        for did, did_bytes, block_number in zip(dids, dids_bytes, block_numbers):
+            if not block_number:
+                logger.debug(f'did {did} is not registered')
+                continue
+
+            cached = self._cache.get((self._did_registry.address, did_bytes))
+            if cached and cached[0] == block_number:
+                ddos[did] = cached[1]
+            else:
+                unresolved[did] = (did_bytes, block_number)
+
+        attributes = self._did_registry.get_registered_attributes(
+            [did_bytes for did_bytes, _ in unresolved.values()],
+            [block_number for _, block_number in unresolved.values()]
+        )
+        dids_by_url = dict()
+        for did, (did_bytes, _) in unresolved.items():
+            data = attributes.get(did_bytes)
+            if data and data.get('value'):
+                dids_by_url.setdefault(data['value'], []).append(did)
+
+        def _fetch(aquarius, did):
+            try:
+                return did, aquarius.get_asset_ddo(did)
+            except Exception as err:
+                logger.warning(f'Could not resolve did {did}: {str(err)}')
+                return did, None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_fetch, AquariusProvider.get_aquarius(url), did)
+                for url, url_dids in dids_by_url.items()
+                for did in url_dids
+            ]
+            for future in futures:
+                did, ddo = future.result()
+                if not ddo:
+                    continue
+
+                ddos[did] = ddo
+                did_bytes, block_number = unresolved[did]
+                self._cache.set((self._did_registry.address, did_bytes), (block_number, ddo))
+
+        return [ddos.get(did) for did in dids]
+
+    def invalidate(self, did):
+        """
+        Remove the DDO of a DID from the cache, to resolve it again from Aquarius.
+
+        :param did: DID, str
+        """
+        self._cache.pop((self._did_registry.address, did_to_id_bytes(did)))
 
-    def get_resolve_url(self, did_bytes):
+    def get_resolve_url(self, did_bytes, block_number=None):
         """Return a did value and value type from the block chain event record using 'did'.
 
         :param did_bytes: DID, hex-str
+        :param block_number: block number the did was last updated, read from the registry
+            if None
         :return url: Url, str
         """
-        data = self._did_registry.get_registered_attribute(did_bytes)
+        data = self._did_registry.get_registered_attribute(did_bytes, block_number)
         if not (data and data.get('value')):
             return None
 
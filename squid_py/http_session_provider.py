@@ -0,0 +1,67 @@
+"""Shared pool of http connections."""
+from threading import Lock
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from squid_py.config import DEFAULT_HTTP_MAX_RETRIES, DEFAULT_HTTP_POOL_SIZE, DEFAULT_HTTP_TIMEOUT
+from squid_py.config_provider import ConfigProvider
+
+
+class _Session(requests.Session):
+    """`requests.Session` with a default timeout."""
+
+    def __init__(self, timeout=None):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def create_session(pool_size=DEFAULT_HTTP_POOL_SIZE, max_retries=DEFAULT_HTTP_MAX_RETRIES,
+                   timeout=DEFAULT_HTTP_TIMEOUT):
+    """
+    Create a `requests` session keeping the connections to each host alive.
+
+    :param pool_size: max number of connections kept alive per host, int
+    :param max_retries: number of retries of the idempotent requests failing to connect or
+        getting a 502, 503 or 504 response, int
+    :param timeout: float timeout in seconds of the requests, no timeout if 0 or None
+    :return: requests.Session
+    """
+    session = _Session(timeout or None)
+    retry = Retry(total=max_retries, backoff_factor=0.1, status_forcelist=(502, 503, 504),
+                  raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+class HttpSessionProvider(object):
+    """Provides the `requests` session shared by the Aquarius, Brizo and keeper clients."""
+    _session = None
+    _lock = Lock()
+
+    @staticmethod
+    def get_session():
+        """Get the shared session, configured from the `http.*` options of the config."""
+        with HttpSessionProvider._lock:
+            if HttpSessionProvider._session is None:
+                config = ConfigProvider.get_config()
+                HttpSessionProvider._session = create_session(
+                    config.http_pool_size, config.http_max_retries, config.http_timeout)
+
+            return HttpSessionProvider._session
+
+    @staticmethod
+    def set_session(session):
+        """
+         Set the shared session.
+
+        :param session: requests.Session or a compatible object, None to create a new one
+        """
+        HttpSessionProvider._session = session
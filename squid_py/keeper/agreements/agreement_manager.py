@@ -49,7 +49,22 @@ class AgreementStoreManager(ContractBase):
         :param agreement_id: ID of the agreement, bytes32
         :return: the agreement attributes.
         """
-        agreement = self.contract_concise.getAgreement(agreement_id)
+        return self._to_agreement_values(self.contract_concise.getAgreement(agreement_id))
+
+    def get_agreements(self, agreement_ids, block_identifier='latest'):
+        """
+        Retrieve the agreements for a list of agreement_ids, in JSON-RPC batches.
+
+        :param agreement_ids: list of agreement ids, list of bytes32
+        :param block_identifier: block to read the agreements from, int or 'latest'
+        :return: list of the agreements attributes, None for the agreements that can not be read
+        """
+        agreements = self.call_many(
+            'getAgreement', [[agreement_id] for agreement_id in agreement_ids], block_identifier)
+        return [self._to_agreement_values(agreement) for agreement in agreements]
+
+    @staticmethod
+    def _to_agreement_values(agreement):
         if agreement and len(agreement) == 6:
             agreement = AgreementValues(*agreement)
             did = add_0x_prefix(agreement.did.hex())
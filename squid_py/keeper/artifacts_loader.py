@@ -0,0 +1,159 @@
+"""Keeper module to load the address and abi of the keeper contracts from their artifacts."""
+
+import json
+import logging
+import os
+from threading import Lock
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FILE_NAME = 'abi-bundle.{}.json'
+
+
+class ArtifactsLoader(object):
+    """
+    Loads the address and abi of the keeper contracts deployed in the keeper network.
+
+    The artifacts directory is listed once and the network name is resolved once, on the first
+    load. Only the address and abi of each artifact are kept, the rest of the truffle artifact
+    (bytecode, ast...) is dropped.
+
+    When the directory has a bundle written by `write_bundle` for the keeper network, all the
+    contracts are loaded from that single file instead of the artifacts. The bundle has to be
+    written again after the contracts are redeployed.
+    """
+    _loaders = dict()
+    _loaders_lock = Lock()
+
+    def __init__(self, artifacts_path, network_name=None):
+        """
+
+        :param artifacts_path: path of the directory of the keeper-contracts artifacts, str
+        :param network_name: name of the keeper network, str. Resolved from the network id of
+            the keeper on the first load if None.
+        """
+        self.artifacts_path = str(artifacts_path)
+        self._network_name = network_name.lower() if network_name else None
+        self._file_names = None
+        self._bundles = dict()
+        self._definitions = dict()
+        self._lock = Lock()
+
+    @staticmethod
+    def get_loader(artifacts_path):
+        """Return the ArtifactsLoader of the `artifacts_path` directory."""
+        artifacts_path = str(artifacts_path)
+        with ArtifactsLoader._loaders_lock:
+            if artifacts_path not in ArtifactsLoader._loaders:
+                ArtifactsLoader._loaders[artifacts_path] = ArtifactsLoader(artifacts_path)
+            return ArtifactsLoader._loaders[artifacts_path]
+
+    @staticmethod
+    def reset_loaders():
+        """Forget the loaders, e.g. to load the artifacts again after a redeployment."""
+        with ArtifactsLoader._loaders_lock:
+            ArtifactsLoader._loaders.clear()
+
+    @property
+    def network_name(self):
+        """Lower case name of the keeper network, str."""
+        if self._network_name is None:
+            from squid_py.keeper import Keeper
+            self._network_name = Keeper.get_network_name(Keeper.get_network_id()).lower()
+
+        return self._network_name
+
+    def get_contract_definition(self, contract_name):
+        """
+        Return the address and abi of a keeper contract.
+
+        The artifact of the keeper network is used if there is one, the artifact of the
+        `development` network otherwise.
+
+        :param contract_name: name of the solidity keeper contract, str
+        :return: dict with the `address` and `abi` of the contract
+        """
+        network_name = self.network_name
+        with self._lock:
+            definition = self._definitions.get(contract_name)
+            if definition is not None:
+                return definition
+
+            definition = self._get_bundle(network_name).get(contract_name)
+            if definition is None:
+                from squid_py.keeper import Keeper
+                path = (self._get_artifact_path(contract_name, network_name)
+                        or self._get_artifact_path(contract_name, Keeper.DEFAULT_NETWORK_NAME))
+                if not path:
+                    raise FileNotFoundError(
+                        f'Keeper contract {contract_name} file '
+                        f'not found in {self.artifacts_path} '
+                        f'using network name {network_name}'
+                    )
+                definition = _read_definition(path)
+
+            self._definitions[contract_name] = definition
+            return definition
+
+    def get_artifact_path(self, contract_name, network_name):
+        """
+        Return the path of the artifact of a contract, matching the file name case-insensitively.
+
+        :param contract_name: name of the solidity keeper contract, str
+        :param network_name: name of the keeper network, str
+        :return: path of the artifact, None if there is no artifact for the network
+        """
+        with self._lock:
+            return self._get_artifact_path(contract_name, network_name)
+
+    def write_bundle(self, path=None):
+        """
+        Write the address and abi of all the contracts of the keeper network in one json file.
+
+        :param path: path of the bundle, the artifacts directory bundle of the network if None
+        :return: path of the bundle, str
+        """
+        network_name = self.network_name
+        suffix = f'.{network_name}.json'
+        with self._lock:
+            bundle = {
+                name[:-len(suffix)]: _read_definition(os.path.join(self.artifacts_path, name))
+                for lower_name, name in self._get_file_names().items()
+                if lower_name.endswith(suffix) and lower_name != BUNDLE_FILE_NAME.format(
+                    network_name)
+            }
+
+        path = path or os.path.join(self.artifacts_path, BUNDLE_FILE_NAME.format(network_name))
+        with open(path, 'w') as f:
+            json.dump(bundle, f, separators=(',', ':'))
+        logger.info(f'Wrote the abi bundle of {len(bundle)} keeper contracts of the '
+                    f'{network_name} network to {path}')
+        return path
+
+    def _get_file_names(self):
+        if self._file_names is None:
+            self._file_names = {name.lower(): name for name in os.listdir(self.artifacts_path)}
+
+        return self._file_names
+
+    def _get_artifact_path(self, contract_name, network_name):
+        name = self._get_file_names().get(f'{contract_name}.{network_name}.json'.lower())
+        return os.path.join(self.artifacts_path, name) if name else None
+
+    def _get_bundle(self, network_name):
+        if network_name not in self._bundles:
+            name = self._get_file_names().get(BUNDLE_FILE_NAME.format(network_name))
+            if name:
+                with open(os.path.join(self.artifacts_path, name)) as f:
+                    self._bundles[network_name] = json.load(f)
+            else:
+                self._bundles[network_name] = dict()
+
+        return self._bundles[network_name]
+
+
+def _read_definition(path):
+    with open(path) as f:
+        artifact = json.load(f)
+
+    return {'address': artifact['address'], 'abi': artifact['abi']}
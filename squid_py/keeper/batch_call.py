@@ -0,0 +1,132 @@
+"""Keeper module to make many keeper calls with JSON-RPC batch requests."""
+
+import json
+import logging
+from itertools import count
+
+from hexbytes import HexBytes
+from web3 import HTTPProvider
+from web3.utils.contracts import find_matching_fn_abi
+
+from squid_py.http_session_provider import HttpSessionProvider
+from squid_py.keeper.compiled_function import CompiledFunction
+from squid_py.keeper.web3_provider import Web3Provider
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 200
+
+_ids = count()
+
+
+def batch_call(calls, block_identifier='latest', batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Call read-only contract functions sending `batch_size` `eth_call` requests per round trip.
+
+    When the keeper is not reached through an `HTTPProvider` the calls are made one by one.
+
+    :param calls: list of tuples (web3 contract, function name, list of args)
+    :param block_identifier: block to read the values from, int or 'latest'. Use a block
+        number to read all the values from the same block.
+    :param batch_size: max number of calls in one JSON-RPC batch request, int
+    :return: list of the values returned by the calls, in the same order as `calls`, None for
+        the calls that failed
+    """
+    web3 = Web3Provider.get_web3()
+    if isinstance(block_identifier, int):
+        block_identifier = web3.toHex(block_identifier)
+
+    compiled_functions = dict()
+    functions = []
+    transactions = []
+    for contract, function_name, args in calls:
+        key = (id(contract), function_name)
+        if key not in compiled_functions:
+            compiled_functions[key] = _compile(contract, function_name, args)
+        function = compiled_functions[key]
+        functions.append(function)
+        transactions.append({'to': contract.address, 'data': function.encode(web3, args)})
+
+    return_data = batch_request(
+        'eth_call',
+        [[transaction, block_identifier] for transaction in transactions],
+        batch_size
+    )
+    return [
+        function.decode(HexBytes(data)) if data is not None else None
+        for function, data in zip(functions, return_data)
+    ]
+
+
+def batch_request(method, params_list, batch_size=DEFAULT_BATCH_SIZE):
+    """
+    Make calls of a JSON-RPC method to the keeper, `batch_size` calls per request.
+
+    When the keeper is not reached through an `HTTPProvider` the calls are made one by one.
+
+    :param method: JSON-RPC method, str
+    :param params_list: list of the params of each call
+    :param batch_size: max number of calls in one JSON-RPC batch request, int
+    :return: list of the raw results of the calls, in the same order as `params_list`, None
+        for the calls that returned an error
+    :raises ValueError: if the keeper rejects the whole batch
+    """
+    web3 = Web3Provider.get_web3()
+    provider = _get_http_provider(web3)
+    results = []
+    for start in range(0, len(params_list), batch_size):
+        chunk = params_list[start:start + batch_size]
+        if provider:
+            results.extend(_send_batch(provider, method, chunk))
+        else:
+            for params in chunk:
+                response = web3.providers[0].make_request(method, params)
+                results.append(_get_result(method, params, response))
+
+    return results
+
+
+def _get_http_provider(web3):
+    for provider in web3.providers:
+        if isinstance(provider, HTTPProvider):
+            return provider
+
+    return None
+
+
+def _send_batch(provider, method, params_list):
+    requests = [
+        {'jsonrpc': '2.0', 'id': next(_ids), 'method': method, 'params': params}
+        for params in params_list
+    ]
+    response = HttpSessionProvider.get_session().post(
+        provider.endpoint_uri,
+        data=json.dumps(requests).encode('utf-8'),
+        **dict(provider.get_request_kwargs())
+    )
+    response.raise_for_status()
+    responses = response.json()
+    if isinstance(responses, dict):
+        raise ValueError(f'{method} batch failed: {responses.get("error", responses)}')
+
+    by_id = {response.get('id'): response for response in responses}
+    return [
+        _get_result(method, request['params'], by_id.get(request['id']))
+        for request in requests
+    ]
+
+
+def _get_result(method, params, response):
+    if response is None or 'error' in response:
+        error = response['error'] if response else 'no response'
+        logger.warning(f'{method} {params} failed: {error}')
+        return None
+
+    return response['result']
+
+
+def _compile(contract, function_name, args):
+    normalizers = getattr(contract, '_return_data_normalizers', ())
+    return (CompiledFunction.from_contract_abi(contract.abi, function_name, normalizers)
+            or CompiledFunction(find_matching_fn_abi(contract.abi, function_name, args),
+                                normalizers))
@@ -0,0 +1,130 @@
+"""Keeper module with a web3 provider sending concurrent calls in JSON-RPC batches."""
+
+import logging
+import time
+from threading import Condition, Event
+
+from web3.utils.encoding import FriendlyJsonSerde
+
+from squid_py.keeper.http_provider import KeeperHTTPProvider
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingRequest(object):
+    def __init__(self, method, params):
+        self.method = method
+        self.params = params
+        self.response = None
+        self.error = None
+        self.lead = False
+        self.ready = Event()
+
+
+class BatchingHTTPProvider(KeeperHTTPProvider):
+    """
+    `KeeperHTTPProvider` coalescing the calls made concurrently by several threads into JSON-RPC
+    batch requests.
+
+    The first caller sends the request, waiting up to `max_latency` seconds for other calls to
+    join its batch. The calls made while a request is in flight are sent together in the next
+    batch, by the first of them, so there is no added latency when the calls are not
+    concurrent and `max_latency` is 0.
+    """
+
+    def __init__(self, endpoint_uri=None, request_kwargs=None, max_batch_size=100,
+                 max_latency=0.0):
+        """
+
+        :param endpoint_uri: url of the keeper node, str
+        :param request_kwargs: dict of keyword args for `requests.post`
+        :param max_batch_size: max number of calls in one batch request, int
+        :param max_latency: float max time in seconds to wait for other calls before sending
+            a batch
+        """
+        super().__init__(endpoint_uri, request_kwargs)
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_latency = max_latency
+        self._condition = Condition()
+        self._queue = []
+        self._sending = False
+
+    def make_request(self, method, params):
+        request = _PendingRequest(method, params)
+        with self._condition:
+            self._queue.append(request)
+            if self._sending:
+                self._condition.notify_all()
+            else:
+                self._sending = True
+                request.lead = True
+
+        while request.response is None and request.error is None:
+            if request.lead:
+                request.lead = False
+                self._send_next_batch()
+            else:
+                request.ready.wait()
+                request.ready.clear()
+
+        if request.error is not None:
+            raise request.error
+        return request.response
+
+    def _send_next_batch(self):
+        deadline = time.monotonic() + self.max_latency
+        with self._condition:
+            while len(self._queue) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+
+            batch = self._queue[:self.max_batch_size]
+            del self._queue[:self.max_batch_size]
+
+        try:
+            for request, response in zip(batch, self._send(batch)):
+                request.response = response
+        except Exception as err:
+            for request in batch:
+                request.error = err
+
+        # hand over the sending of the calls queued meanwhile to the first of them
+        with self._condition:
+            next_leader = self._queue[0] if self._queue else None
+            if next_leader:
+                next_leader.lead = True
+            else:
+                self._sending = False
+
+        for request in batch + ([next_leader] if next_leader else []):
+            request.ready.set()
+
+    def _send(self, batch):
+        if len(batch) == 1:
+            request_data = self.encode_rpc_request(batch[0].method, batch[0].params)
+            return [self.decode_rpc_response(self._post(request_data))]
+
+        rpc_requests = [
+            {'jsonrpc': '2.0', 'method': request.method, 'params': request.params or [],
+             'id': next(self.request_counter)}
+            for request in batch
+        ]
+        logger.debug(f'Making JSON-RPC batch request of {len(batch)} calls to '
+                     f'{self.endpoint_uri}')
+        responses = self.decode_rpc_response(
+            self._post(FriendlyJsonSerde().json_encode(rpc_requests).encode('utf-8')))
+        if isinstance(responses, dict):
+            # the node does not support batches or rejected the whole batch
+            return [responses] * len(batch)
+
+        by_id = {response.get('id'): response for response in responses}
+        return [
+            by_id.get(rpc_request['id'], {
+                'jsonrpc': '2.0',
+                'id': rpc_request['id'],
+                'error': {'code': -32603, 'message': 'No response in the batch response'}
+            })
+            for rpc_request in rpc_requests
+        ]
@@ -0,0 +1,132 @@
+"""Keeper module with the pre-computed abi encoding of the contract functions."""
+
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.encoding import TupleEncoder
+from eth_abi.exceptions import DecodingError
+from eth_abi.registry import registry
+from eth_utils import encode_hex, function_abi_to_4byte_selector
+from web3.contract import ConciseMethod
+from web3.exceptions import BadFunctionCallOutput
+from web3.utils.abi import filter_by_name, get_abi_input_types, get_abi_output_types, map_abi_data
+from web3.utils.empty import empty
+from web3.utils.normalizers import (
+    BASE_RETURN_NORMALIZERS,
+    abi_address_to_hex,
+    abi_bytes_to_bytes,
+    abi_ens_resolver,
+    abi_string_to_text,
+)
+
+
+class CompiledFunction(object):
+    """Selector, arguments encoder and return data decoder of a contract function."""
+
+    def __init__(self, fn_abi, return_data_normalizers=()):
+        """
+
+        :param fn_abi: abi of the function, dict
+        :param return_data_normalizers: normalizers of the decoded values, on top of the web3
+            base ones
+        """
+        self.abi = fn_abi
+        self.selector = function_abi_to_4byte_selector(fn_abi)
+        self.input_types = get_abi_input_types(fn_abi)
+        self.output_types = get_abi_output_types(fn_abi)
+        self._encoder = TupleEncoder(
+            encoders=[registry.get_encoder(type_str) for type_str in self.input_types])
+        self._decoder = TupleDecoder(
+            decoders=[registry.get_decoder(type_str) for type_str in self.output_types])
+        self._return_data_normalizers = (
+            list(BASE_RETURN_NORMALIZERS) + list(return_data_normalizers))
+
+    @staticmethod
+    def from_contract_abi(contract_abi, function_name, return_data_normalizers=()):
+        """
+        Compile the function `function_name` of a contract.
+
+        :param contract_abi: abi of the contract, list
+        :param function_name: name of the function, str
+        :param return_data_normalizers: normalizers of the decoded values
+        :return: CompiledFunction, None if the function is overloaded or not in the abi
+        """
+        fn_abis = [abi for abi in filter_by_name(function_name, contract_abi)
+                   if abi['type'] == 'function']
+        if len(fn_abis) != 1:
+            return None
+
+        return CompiledFunction(fn_abis[0], return_data_normalizers)
+
+    def encode(self, web3, args):
+        """
+        Encode a call of the function.
+
+        :param web3: Web3 instance, used to resolve the ENS names
+        :param args: list of the args of the call
+        :return: the transaction data, hex str
+        """
+        if len(args) != len(self.input_types):
+            raise TypeError(f'{self.abi["name"]} expects {len(self.input_types)} arguments, '
+                            f'got {len(args)}')
+
+        normalized_args = map_abi_data(
+            [abi_ens_resolver(web3), abi_address_to_hex, abi_bytes_to_bytes, abi_string_to_text],
+            self.input_types,
+            args
+        )
+        return encode_hex(self.selector + self._encoder(normalized_args))
+
+    def decode(self, return_data):
+        """
+        Decode the data returned by a call of the function.
+
+        :param return_data: bytes
+        :return: the value returned by the function, a list if it returns several values
+        """
+        try:
+            values = self._decoder(ContextFramesBytesIO(return_data))
+        except DecodingError as e:
+            raise BadFunctionCallOutput(
+                f'Could not decode contract function call {self.abi["name"]} return data '
+                f'{return_data} for output_types {self.output_types}'
+            ) from e
+
+        values = map_abi_data(self._return_data_normalizers, self.output_types, values)
+        return values[0] if len(values) == 1 else values
+
+
+class CompiledConciseMethod(ConciseMethod):
+    """
+    `ConciseMethod` encoding the calls and transactions with the function compiled once, instead
+    of looking up the function abi and building its encoders on each invocation.
+
+    Overloaded functions and the `estimateGas` and `buildTransaction` modifiers go through
+    web3's generic `ConciseMethod`.
+    """
+
+    def __init__(self, function, normalizers=None):
+        super().__init__(function, normalizers)
+        self._compiled = CompiledFunction.from_contract_abi(
+            function.contract_abi, function.fn_name, normalizers or ())
+
+    def __call__(self, *args, **kwargs):
+        if len(kwargs) > 1:
+            return super().__call__(*args, **kwargs)
+
+        modifier, transaction = next(iter(kwargs.items())) if kwargs else ('call', None)
+        if (self._compiled is None or modifier not in ('call', 'transact')
+                or len(args) != len(self._compiled.input_types)):
+            return super().__call__(*args, **kwargs)
+
+        web3 = self._function.web3
+        transaction = dict(transaction or {})
+        if 'data' in transaction:
+            raise ValueError('Cannot set data in the transaction')
+        transaction.setdefault('to', self._function.address)
+        if web3.eth.defaultAccount is not empty:
+            transaction.setdefault('from', web3.eth.defaultAccount)
+        transaction['data'] = self._compiled.encode(web3, args)
+
+        if modifier == 'transact':
+            return web3.eth.sendTransaction(transaction)
+
+        return self._compiled.decode(web3.eth.call(transaction))
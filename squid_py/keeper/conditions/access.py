@@ -1,4 +1,3 @@
-from squid_py.config import DEFAULT_GAS_LIMIT
 from squid_py.keeper.conditions.condition_base import ConditionBase
 
 
@@ -22,7 +21,7 @@ class AccessSecretStoreCondition(ConditionBase):
             agreement_id,
             document_id,
             grantee_address,
-            transact={'from': account.address, 'gas': DEFAULT_GAS_LIMIT}
+            account=account
         )
 
     def hash_values(self, document_id, grantee_address):
@@ -21,25 +21,44 @@ class ConditionBase(ContractBase):
             [agreement_id, self.address, values_hash]
         )
 
-    def _fulfill(self, *args, **kwargs):
+    def _fulfill(self, *args, account=None):
         """
         Fulfill the condition.
 
         :param args:
-        :param kwargs:
+        :param account: Account sending the transaction
         :return: true if the condition was successfully fulfilled, bool
         """
-        tx_hash = self.contract_concise.fulfill(*args, **kwargs)
+        tx_hash = self.send_transaction('fulfill', args, account=account)
         receipt = self.get_tx_receipt(tx_hash)
         return receipt.status == 1
 
-    def abort_by_timeout(self, condition_id):
+    def submit_fulfill(self, args, account):
+        """
+        Send the transaction fulfilling the condition without waiting for it to be mined.
+
+        :param args: list of the args of the `fulfill` function of the condition contract
+        :param account: Account instance
+        :return: `concurrent.futures.Future` of the transaction receipt
+        """
+        account.unlock()
+        return self.submit_transaction(
+            'fulfill',
+            args,
+            account=account
+        )
+
+    def abort_by_timeout(self, condition_id, account=None):
         """
 
         :param condition_id:
+        :param account: Account sending the transaction, the default account of the keeper node
+            if None
         :return:
         """
-        tx_hash = self.contract_concise.abortByTimeOut(condition_id)
+        if account is not None:
+            account.unlock()
+        tx_hash = self.send_transaction('abortByTimeOut', [condition_id], account=account)
         receipt = self.get_tx_receipt(tx_hash)
         return receipt.status == 1
 
@@ -53,7 +72,7 @@ class ConditionBase(ContractBase):
         return self.contract_concise.hashValues(*args, **kwargs)
 
     def subscribe_condition_fulfilled(self, agreement_id, timeout, callback, args,
-                                      timeout_callback=None, wait=False):
+                                      timeout_callback=None, wait=False, from_block='latest'):
         """
         Subscribe to the condition fullfilled event.
 
@@ -63,6 +82,9 @@ class ConditionBase(ContractBase):
         :param args:
         :param timeout_callback:
         :param wait:
+        :param from_block: first block to look for the event, int. 'latest' starts after the
+            last block processed for this event, or at the current block. None resumes after the
+            last block processed for this event before a restart
         :return:
         """
         return self.subscribe_to_event(
@@ -72,5 +94,20 @@ class ConditionBase(ContractBase):
             callback=callback,
             timeout_callback=timeout_callback,
             args=args,
-            wait=wait
+            wait=wait,
+            from_block=from_block
+        )
+
+    async def subscribe_condition_fulfilled_async(self, agreement_id, timeout):
+        """
+        Wait for the condition fulfilled event without blocking the asyncio event loop.
+
+        :param agreement_id: Agreement id, str
+        :param timeout: float timeout in seconds
+        :return: the event dict, or None if the timeout expires
+        """
+        return await self.subscribe_to_event_async(
+            self.FULFILLED_EVENT,
+            timeout,
+            {'_agreementId': Web3Provider.get_web3().toBytes(hexstr=agreement_id)}
         )
@@ -25,6 +25,18 @@ class ConditionStoreManager(ContractBase):
 
         return None
 
+    def get_conditions(self, condition_ids, block_identifier='latest'):
+        """Retrieve the conditions for a list of condition_ids, in JSON-RPC batches.
+
+        :param condition_ids: list of condition ids, list of str
+        :param block_identifier: block to read the conditions from, int or 'latest'
+        :return: list of ConditionValues, None for the conditions that can not be read
+        """
+        conditions = self.call_many(
+            'getCondition', [[condition_id] for condition_id in condition_ids], block_identifier)
+        return [ConditionValues(*condition) if condition and len(condition) == 7 else None
+                for condition in conditions]
+
     def get_condition_state(self, condition_id):
         """Retrieve the condition state.
 
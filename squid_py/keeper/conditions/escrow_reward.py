@@ -1,4 +1,3 @@
-from squid_py.config import DEFAULT_GAS_LIMIT
 from squid_py.keeper.conditions.condition_base import ConditionBase
 
 
@@ -34,7 +33,7 @@ class EscrowRewardCondition(ConditionBase):
             sender_address,
             lock_condition_id,
             release_condition_id,
-            transact={'from': account.address, 'gas': DEFAULT_GAS_LIMIT}
+            account=account
         )
 
     def hash_values(self, amount, receiver_address, sender_address, lock_condition_id,
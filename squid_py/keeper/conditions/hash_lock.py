@@ -1,4 +1,3 @@
-from squid_py.config import DEFAULT_GAS_LIMIT
 from squid_py.keeper.conditions.condition_base import ConditionBase
 
 
@@ -17,7 +16,7 @@ class HashLockCondition(ConditionBase):
         return self._fulfill(
             agreement_id,
             preimage,
-            transact={'from': account.address, 'gas': DEFAULT_GAS_LIMIT}
+            account=account
         )
 
     def hash_values(self, preimage):
@@ -1,4 +1,3 @@
-from squid_py.config import DEFAULT_GAS_LIMIT
 from squid_py.keeper.conditions.condition_base import ConditionBase
 
 
@@ -20,7 +19,7 @@ class LockRewardCondition(ConditionBase):
             agreement_id,
             reward_address,
             amount,
-            transact={'from': account.address, 'gas': DEFAULT_GAS_LIMIT}
+            account=account
         )
 
     def hash_values(self, reward_address, amount):
@@ -1,4 +1,3 @@
-from squid_py.config import DEFAULT_GAS_LIMIT
 from squid_py.keeper.conditions.condition_base import ConditionBase
 
 
@@ -21,7 +20,7 @@ class SignCondition(ConditionBase):
             message,
             account_address,
             signature,
-            transact={'from': from_account.address, 'gas': DEFAULT_GAS_LIMIT}
+            account=from_account
         )
 
     def hash_values(self, message, account_address):
@@ -6,6 +6,9 @@
 
 import logging
 
+from squid_py.keeper.gas_strategy import GasStrategyProvider
+from squid_py.keeper.nonce_manager import NonceManager, is_nonce_error
+from squid_py.keeper.receipt_tracker import ReceiptTracker
 from squid_py.keeper.web3_provider import Web3Provider
 
 logger = logging.getLogger('keeper')
@@ -79,16 +82,100 @@ class ContractBase(object):
     @staticmethod
     def get_tx_receipt(tx_hash):
         """
-        Get the receipt of a tx.
+        Wait for the receipt of a tx.
 
         :param tx_hash:
         :return: Tx receipt
         """
-        Web3Provider.get_web3().eth.waitForTransactionReceipt(tx_hash)
-        return Web3Provider.get_web3().eth.getTransactionReceipt(tx_hash)
+        return ReceiptTracker.get_instance().track(tx_hash).result()
+
+    def send_transaction(self, function_name, args, transact=None, account=None):
+        """
+        Send a transaction calling a function of the contract.
+
+        The nonce of the transactions sent `from` an account is assigned by its `NonceManager`,
+        so the transactions of an account can be sent without waiting for the previous ones to
+        be mined. Their gas limit and gas price, when not given, are set by the `GasStrategy`.
+        The transactions of the accounts having a private key are signed locally and sent raw.
+
+        :param function_name: name of the contract function, str
+        :param args: list of the args of the function
+        :param transact: dict of the transaction parameters (from, gas...)
+        :param account: Account sending the transaction, it is the `from` of the transaction
+        :return: hash of the transaction
+        """
+        transact = dict(transact or {})
+        if account is not None:
+            transact.setdefault('from', account.address)
+        if 'from' not in transact:
+            return getattr(self.contract_concise, function_name)(*args, transact=transact)
+
+        gas_strategy = GasStrategyProvider.get_strategy()
+        transact = gas_strategy.fill_transaction(self, function_name, args, transact)
+        if 'nonce' in transact:
+            tx_hash = self._send(function_name, args, transact, account)
+        else:
+            nonce_manager = NonceManager.get_nonce_manager(transact['from'])
+            transact['nonce'] = nonce_manager.get_nonce()
+            try:
+                tx_hash = self._send(function_name, args, transact, account)
+            except Exception as err:
+                if is_nonce_error(err):
+                    logger.debug(f'Nonce {transact["nonce"]} of {transact["from"]} rejected, '
+                                 f'syncing the nonces with the keeper: {str(err)}')
+                    nonce_manager.reset()
+                else:
+                    nonce_manager.release_nonce(transact['nonce'])
+                raise
+
+        def _record_receipt(future):
+            if not future.exception():
+                gas_strategy.record_receipt(self, function_name, args, transact, future.result())
+
+        ReceiptTracker.get_instance().track(tx_hash).add_done_callback(_record_receipt)
+        return tx_hash
+
+    def submit_transaction(self, function_name, args, transact=None, account=None):
+        """
+        Send a transaction calling a function of the contract without waiting for it to be
+        mined.
+
+        :param function_name: name of the contract function, str
+        :param args: list of the args of the function
+        :param transact: dict of the transaction parameters (from, gas...)
+        :param account: Account sending the transaction, it is the `from` of the transaction
+        :return: `concurrent.futures.Future` of the transaction receipt
+        """
+        tx_hash = self.send_transaction(function_name, args, transact, account)
+        return ReceiptTracker.get_instance().track(tx_hash)
+
+    def _send(self, function_name, args, transact, account):
+        if account is None or not account.is_local:
+            return getattr(self.contract_concise, function_name)(*args, transact=transact)
+
+        transaction = getattr(self.contract.functions, function_name)(*args).buildTransaction(
+            transact)
+        return Web3Provider.get_web3().eth.sendRawTransaction(
+            account.sign_transaction(transaction))
+
+    def call_many(self, function_name, args_list, block_identifier='latest'):
+        """
+        Call a read-only function of the contract for every item of `args_list`, the calls are
+        sent to the keeper in JSON-RPC batches.
+
+        :param function_name: name of the contract function, str
+        :param args_list: list of the args of each call, list of lists
+        :param block_identifier: block to read the values from, int or 'latest'
+        :return: list of the values returned by each call, None for the calls that failed
+        """
+        from squid_py.keeper.batch_call import batch_call
+        return batch_call(
+            [(self.contract, function_name, list(args)) for args in args_list],
+            block_identifier
+        )
 
     def subscribe_to_event(self, event_name, timeout, event_filter, callback=False,
-                           timeout_callback=None, args=None, wait=False):
+                           timeout_callback=None, args=None, wait=False, from_block='latest'):
         """
 
         :param event_name:
@@ -98,6 +185,9 @@ class ContractBase(object):
         :param timeout_callback:
         :param args:
         :param wait:
+        :param from_block: first block to look for the event, int. 'latest' starts after the
+            last block processed for this event, or at the current block. None resumes after the
+            last block processed for this event before a restart
         :return:
         """
         from squid_py.keeper.event_listener import EventListener
@@ -105,6 +195,7 @@ class ContractBase(object):
             self.CONTRACT_NAME,
             event_name,
             args,
+            from_block=from_block,
             filters=event_filter
         ).listen_once(
             callback,
@@ -113,5 +204,21 @@ class ContractBase(object):
             blocking=wait
         )
 
+    async def subscribe_to_event_async(self, event_name, timeout, event_filter):
+        """
+        Wait for an event without blocking the asyncio event loop.
+
+        :param event_name: name of the contract event, str
+        :param timeout: float timeout in seconds
+        :param event_filter: dict of event argument names and expected values
+        :return: the event dict, or None if the timeout expires
+        """
+        from squid_py.keeper.event_listener import EventListener
+        return await EventListener(
+            self.CONTRACT_NAME,
+            event_name,
+            filters=event_filter
+        ).listen_once_async(timeout=timeout)
+
     def __str__(self):
         return f'{self.name} at {self.address}'
@@ -1,11 +1,12 @@
 import json
 import logging
-import os
 
 from web3.contract import ConciseContract
 
 from squid_py.config_provider import ConfigProvider
 from squid_py.keeper import Keeper
+from squid_py.keeper.artifacts_loader import ArtifactsLoader
+from squid_py.keeper.compiled_function import CompiledConciseMethod
 from squid_py.keeper.web3_provider import Web3Provider
 
 logger = logging.getLogger(__name__)
@@ -51,7 +52,8 @@ class ContractHandler(object):
         :param name: Contract name, str
         :param contract: Contract instance
         """
-        ContractHandler._contracts[name] = (contract, ConciseContract(contract))
+        ContractHandler._contracts[name] = (
+            contract, ConciseContract(contract, CompiledConciseMethod))
 
     @staticmethod
     def has(name):
@@ -63,6 +65,11 @@ class ContractHandler(object):
         """
         return name in ContractHandler._contracts
 
+    @staticmethod
+    def reset():
+        """Forget the loaded contracts, they are loaded again from the current config."""
+        ContractHandler._contracts.clear()
+
     @staticmethod
     def _load(contract_name):
         """Retrieve the contract instance for `contract_name` that represent the smart
@@ -71,22 +78,15 @@ class ContractHandler(object):
         :param contract_name: str name of the solidity keeper contract without the network name.
         :return: web3.eth.Contract instance
         """
-        contract_definition = ContractHandler.get_contract_dict_by_name(contract_name)
+        contract_definition = ArtifactsLoader.get_loader(
+            ConfigProvider.get_config().keeper_path).get_contract_definition(contract_name)
         address = Web3Provider.get_web3().toChecksumAddress(contract_definition['address'])
         abi = contract_definition['abi']
         contract = Web3Provider.get_web3().eth.contract(address=address, abi=abi)
-        ContractHandler._contracts[contract_name] = (contract, ConciseContract(contract))
+        ContractHandler._contracts[contract_name] = (
+            contract, ConciseContract(contract, CompiledConciseMethod))
         return ContractHandler._contracts[contract_name]
 
-    @staticmethod
-    def _get_contract_file_path(_base_path, _contract_name, _network_name):
-        contract_file_name = '{}.{}.json'.format(_contract_name, _network_name)
-        for name in os.listdir(_base_path):
-            if name.lower() == contract_file_name.lower():
-                contract_file_name = name
-                return os.path.join(ConfigProvider.get_config().keeper_path, contract_file_name)
-        return None
-
     @staticmethod
     def get_contract_dict_by_name(contract_name):
         """
@@ -95,27 +95,14 @@ class ContractHandler(object):
         :param contract_name: str
         :return: the smart contract's definition from the json abi file, dict
         """
-
-        network_name = Keeper.get_network_name(Keeper.get_network_id()).lower()
-        artifacts_path = ConfigProvider.get_config().keeper_path
-
-        # file_name = '{}.{}.json'.format(contract_name, network_name)
-        # path = os.path.join(keeper.artifacts_path, file_name)
-        path = ContractHandler._get_contract_file_path(
-            artifacts_path, contract_name, network_name)
-        if not (path and os.path.exists(path)):
-            path = ContractHandler._get_contract_file_path(
-                artifacts_path, contract_name, network_name.lower())
-
-        if not (path and os.path.exists(path)):
-            path = ContractHandler._get_contract_file_path(
-                artifacts_path, contract_name, Keeper.DEFAULT_NETWORK_NAME)
-
-        if not (path and os.path.exists(path)):
+        loader = ArtifactsLoader.get_loader(ConfigProvider.get_config().keeper_path)
+        path = (loader.get_artifact_path(contract_name, loader.network_name)
+                or loader.get_artifact_path(contract_name, Keeper.DEFAULT_NETWORK_NAME))
+        if not path:
             raise FileNotFoundError(
                 f'Keeper contract {contract_name} file '
-                f'not found in {artifacts_path} '
-                f'using network name {network_name}'
+                f'not found in {loader.artifacts_path} '
+                f'using network name {loader.network_name}'
             )
 
         with open(path) as f:
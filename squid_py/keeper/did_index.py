@@ -0,0 +1,184 @@
+"""Keeper module to index the DIDRegistry attributes in a local sqlite database."""
+import logging
+import sqlite3
+import time
+from threading import Lock, Thread
+
+from web3 import Web3
+
+from squid_py.keeper.event_cursors import get_event_cursor, record_event_cursors
+from squid_py.keeper.web3_provider import Web3Provider
+
+logger = logging.getLogger(__name__)
+
+_CURSOR_NAME = 'DIDAttributeRegistered:index'
+
+
+class DIDIndex(object):
+    """
+    Local index of the `DIDAttributeRegistered` events of the DIDRegistry.
+
+    The last attribute registered for each did is kept in the sqlite database at
+    `storage_path`. `update` only asks the keeper for the events of the blocks mined since the
+    last update, which is recorded with the keeper events cursors. The first update reads the
+    events from `from_block`, the block the DIDRegistry was deployed in, it can be run in the
+    background with `update_in_background`.
+
+    The index keeps one connection to the database and the last block indexed in memory, so a
+    lookup is a single sqlite query. The index is considered stale `refresh_interval` seconds
+    after its last update.
+    """
+    _indexes = dict()
+    _indexes_lock = Lock()
+
+    def __init__(self, did_registry, storage_path, from_block=0, blocks_per_query=10000,
+                 refresh_interval=5.0):
+        """
+
+        :param did_registry: DIDRegistry
+        :param storage_path: path of the sqlite database, str
+        :param from_block: first block to index, int
+        :param blocks_per_query: max number of blocks to get the events of in one
+            `eth_getLogs` call, int
+        :param refresh_interval: float time in seconds the index is used without updating it
+        """
+        self._did_registry = did_registry
+        self._storage_path = storage_path
+        self.from_block = from_block
+        self.blocks_per_query = blocks_per_query
+        self.refresh_interval = refresh_interval
+        self._lock = Lock()
+        self._conn = None
+        self._conn_lock = Lock()
+        self._last_block = None
+        self._updated_at = None
+        self._thread = None
+        self._thread_lock = Lock()
+
+    @staticmethod
+    def get_index(did_registry, storage_path, from_block=0):
+        """Return the DIDIndex of the did registry contract for `storage_path`."""
+        key = (did_registry.address, storage_path)
+        with DIDIndex._indexes_lock:
+            if key not in DIDIndex._indexes:
+                DIDIndex._indexes[key] = DIDIndex(did_registry, storage_path, from_block)
+            return DIDIndex._indexes[key]
+
+    @property
+    def last_block(self):
+        """Number of the last block indexed, None if nothing was indexed yet."""
+        with self._conn_lock:
+            self._connect()
+            return self._last_block
+
+    @property
+    def is_ready(self):
+        """True once the index was fully updated by this process."""
+        return self._updated_at is not None
+
+    @property
+    def is_stale(self):
+        """True if the index was not updated in the last `refresh_interval` seconds."""
+        return (self._updated_at is None
+                or time.monotonic() - self._updated_at > self.refresh_interval)
+
+    def update_in_background(self):
+        """
+        Start `update` in a daemon thread, unless it is already running in the background.
+
+        :return: Thread of the update
+        """
+        with self._thread_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = Thread(target=self._update_in_background, daemon=True)
+                self._thread.start()
+            return self._thread
+
+    def _update_in_background(self):
+        try:
+            self.update()
+        except Exception as err:
+            logger.warning(f'Could not update the DIDRegistry index: {str(err)}')
+
+    def update(self):
+        """
+        Index the attributes registered since the last update.
+
+        :return: number of the last block indexed, int
+        """
+        with self._lock:
+            last_block = self.last_block
+            block_number = Web3Provider.get_web3().eth.blockNumber
+            from_block = last_block + 1 if last_block is not None else self.from_block
+            while from_block <= block_number:
+                to_block = min(from_block + self.blocks_per_query - 1, block_number)
+                attributes = self._did_registry.get_attribute_events(from_block, to_block)
+                with self._conn_lock:
+                    _record_did_attributes(self._connect(), attributes)
+                    record_event_cursors(
+                        self._storage_path,
+                        [(self._did_registry.address, _CURSOR_NAME, to_block)]
+                    )
+                    self._last_block = to_block
+                from_block = to_block + 1
+
+            self._updated_at = time.monotonic()
+            return block_number
+
+    def get(self, did_bytes):
+        """
+        Return the last attribute indexed for a did.
+
+        :param did_bytes: DID, bytes32
+        :return: dict in the format returned by `DIDRegistry.get_registered_attribute`, None if
+            the did is not indexed
+        """
+        with self._conn_lock:
+            return _get_did_attribute(self._connect(), did_bytes)
+
+    def _connect(self):
+        # called with `_conn_lock` held
+        if self._conn is None:
+            conn = sqlite3.connect(self._storage_path, check_same_thread=False)
+            _create_table(conn.cursor())
+            conn.commit()
+            self._last_block = get_event_cursor(
+                self._storage_path, self._did_registry.address, _CURSOR_NAME)
+            self._conn = conn
+        return self._conn
+
+
+def _create_table(cursor):
+    cursor.execute(
+        '''CREATE TABLE IF NOT EXISTS did_attributes
+           (did VARCHAR PRIMARY KEY, url VARCHAR, checksum VARCHAR, owner VARCHAR,
+            block_number INTEGER);'''
+    )
+
+
+def _record_did_attributes(conn, attributes):
+    conn.cursor().executemany(
+        'INSERT OR REPLACE INTO did_attributes VALUES (?,?,?,?,?)',
+        [(Web3.toHex(attribute['did_bytes']), attribute['value'],
+          Web3.toHex(attribute['checksum']), attribute['owner'], attribute['block_number'])
+         for attribute in attributes]
+    )
+    conn.commit()
+
+
+def _get_did_attribute(conn, did_bytes):
+    row = conn.cursor().execute(
+        'SELECT url, checksum, owner, block_number FROM did_attributes WHERE did=?;',
+        (Web3.toHex(did_bytes),)
+    ).fetchone()
+    if not row:
+        return None
+
+    url, checksum, owner, block_number = row
+    return {
+        'checksum': Web3.toBytes(hexstr=checksum),
+        'value': url,
+        'block_number': block_number,
+        'did_bytes': did_bytes,
+        'owner': owner,
+    }
@@ -2,11 +2,16 @@
 import logging
 from urllib.parse import urlparse
 
+from eth_utils import event_abi_to_log_topic
 from web3 import Web3
+from web3.utils.events import get_event_data
 
+from squid_py.config_provider import ConfigProvider
 from squid_py.did import did_to_id_bytes
 from squid_py.exceptions import OceanDIDNotFound
 from squid_py.keeper.contract_base import ContractBase
+from squid_py.keeper.did_index import DIDIndex
+from squid_py.keeper.web3_provider import Web3Provider
 
 logger = logging.getLogger(__name__)
 
@@ -22,12 +27,27 @@ class DIDRegistry(ContractBase):
         Register or update a DID on the block chain using the DIDRegistry smart contract.
 
         :param did_source: DID to register/update, can be a 32 byte or hexstring
-        :param checksum: hex str hash of TODO
+        :param checksum: hash of the checksum of the DDO metadata, bytes32
         :param url: URL of the resolved DID
         :param account: instance of Account to use to register/update the DID
         :return: Receipt
         """
+        if account is not None:
+            account.unlock()
+        return self.submit_register(did_source, checksum, url, account).result()
 
+    def submit_register(self, did_source, checksum, url=None, account=None):
+        """
+        Send the transaction registering or updating a DID without waiting for it to be mined, so
+        several DIDs of an account can be registered in the same block. The account must be
+        unlocked.
+
+        :param did_source: DID to register/update, can be a 32 byte or hexstring
+        :param checksum: hash of the checksum of the DDO metadata, bytes32
+        :param url: URL of the resolved DID
+        :param account: instance of Account to use to register/update the DID
+        :return: `concurrent.futures.Future` of the transaction receipt
+        """
         did_source_id = did_to_id_bytes(did_source)
         if not did_source_id:
             raise ValueError(f'{did_source} must be a valid DID to register')
@@ -44,13 +64,14 @@ class DIDRegistry(ContractBase):
         if account is None:
             raise ValueError('You must provide an account to use to register a DID')
 
-        account.unlock()
-        transaction = self.register_attribute(did_source_id, checksum, url,
-                                              account.address)
-        receipt = self.get_tx_receipt(transaction)
-        return receipt
+        return self.submit_transaction(
+            'registerAttribute',
+            [did_source_id, checksum, url],
+            {'from': account.address},
+            account=account
+        )
 
-    def register_attribute(self, did_hash, checksum, value, account_address):
+    def register_attribute(self, did_hash, checksum, value, account_address, account=None):
         """Register an DID attribute as an event on the block chain.
 
             did_hash: 32 byte string/hex of the DID
@@ -58,18 +79,34 @@ class DIDRegistry(ContractBase):
             key: 32 byte string/hex free format
             value: string can be anything, probably DDO or URL
             account_address: owner of this DID registration record
+            account: Account of `account_address`, to sign the transaction locally
         """
-        return self.contract_concise.registerAttribute(
-            did_hash,
-            checksum,
-            value,
-            transact={'from': account_address}
+        return self.send_transaction(
+            'registerAttribute',
+            [did_hash, checksum, value],
+            {'from': account_address},
+            account=account
         )
 
     def get_block_number_updated(self, did):
         """Return the block number the last did was updated on the block chain."""
+        if isinstance(did, bytes):
+            attribute = self._get_indexed_attribute(did)
+            if attribute:
+                return attribute['block_number']
+
         return self.contract_concise.getBlockNumberUpdated(did)
 
+    def get_block_numbers_updated(self, dids):
+        """
+        Return the block numbers the dids were last updated, read in JSON-RPC batches.
+
+        :param dids: list of dids, bytes32
+        :return: list of block numbers, 0 for the dids that are not registered and None for the
+            dids that can not be read
+        """
+        return self.call_many('getBlockNumberUpdated', [[did] for did in dids])
+
     def get_did_owner(self, did):
         """
         Return the owner of the did.
@@ -77,9 +114,17 @@ class DIDRegistry(ContractBase):
         :param did: Asset did, did
         :return:
         """
+        if isinstance(did, str) and not did.startswith('did:'):
+            did_bytes = Web3.toBytes(hexstr=did)
+        else:
+            did_bytes = did_to_id_bytes(did)
+        attribute = self._get_indexed_attribute(did_bytes)
+        if attribute:
+            return attribute['owner']
+
         return self.contract_concise.getDIDOwner(did)
 
-    def get_registered_attribute(self, did_bytes):
+    def get_registered_attribute(self, did_bytes, block_number=None):
         """
 
         Example of event logs from event_filter.get_all_entries():
@@ -101,10 +146,15 @@ class DIDRegistry(ContractBase):
              '0xbbbe1046b737f33b2076cb0bb5ba85a840c836cf1ffe88891afd71193d677ba2'),
              'blockNumber': 1947})]
 
+        :param did_bytes: DID, bytes32
+        :param block_number: block number the did was last updated, as returned by
+            `get_block_number_updated`. It is read from the registry if None.
+        :return: dict with the registered attribute, None if the event can not be found
         """
         result = None
         did = Web3.toHex(did_bytes)
-        block_number = self.get_block_number_updated(did_bytes)
+        if block_number is None:
+            block_number = self.get_block_number_updated(did_bytes)
         logger.debug(f'got blockNumber {block_number} for did {did}')
         if block_number == 0:
             raise OceanDIDNotFound(
@@ -112,6 +162,10 @@ class DIDRegistry(ContractBase):
                 f'Please ensure assets are registered in the correct keeper contracts. '
                 f'The keeper-contracts DIDRegistry address is {self.address}')
 
+        attribute = self._get_indexed_attribute(did_bytes, block_number)
+        if attribute:
+            return attribute
+
         event = getattr(self.events, DIDRegistry.DID_REGISTRY_EVENT_NAME)
         block_filter = event().createFilter(
             fromBlock=block_number, toBlock=block_number, argument_filters={'did': did_bytes}
@@ -132,3 +186,121 @@ class DIDRegistry(ContractBase):
             logger.warning(f'Could not find {DIDRegistry.DID_REGISTRY_EVENT_NAME} event logs for '
                            f'did {did} at blockNumber {block_number}')
         return result
+
+    def get_registered_attributes(self, dids_bytes, block_numbers):
+        """
+        Return the registered attributes of many dids, looking up their events with one
+        `eth_getLogs` call.
+
+        :param dids_bytes: list of dids, bytes32
+        :param block_numbers: list of the block numbers the dids were last updated, as returned
+            by `get_block_numbers_updated`
+        :return: dict mapping each did (bytes32) to its registered attribute, in the format
+            returned by `get_registered_attribute`. The dids without event are not included.
+        """
+        if not dids_bytes:
+            return dict()
+
+        block_number_by_did = dict(zip(dids_bytes, block_numbers))
+        result = dict()
+        if self._get_index():
+            for did_bytes, block_number in block_number_by_did.items():
+                attribute = self._get_indexed_attribute(did_bytes, block_number)
+                if attribute:
+                    result[did_bytes] = attribute
+
+            block_number_by_did = {did_bytes: block_number
+                                   for did_bytes, block_number in block_number_by_did.items()
+                                   if did_bytes not in result}
+            if not block_number_by_did:
+                return result
+
+        for attribute in self.get_attribute_events(min(block_number_by_did.values()),
+                                                   max(block_number_by_did.values()),
+                                                   list(block_number_by_did)):
+            did_bytes = bytes(attribute['did_bytes'])
+            if attribute['block_number'] == block_number_by_did.get(did_bytes):
+                result[did_bytes] = attribute
+
+        return result
+
+    def get_attribute_events(self, from_block, to_block, dids_bytes=None):
+        """
+        Return the attributes registered in a range of blocks, with one `eth_getLogs` call.
+
+        :param from_block: int
+        :param to_block: int or 'latest'
+        :param dids_bytes: list of dids (bytes32) to look for, all the dids if None
+        :return: list of the registered attributes in the order of the events, in the format
+            returned by `get_registered_attribute`
+        """
+        event_abi = getattr(self.events, DIDRegistry.DID_REGISTRY_EVENT_NAME)().abi
+        topics = [Web3.toHex(event_abi_to_log_topic(event_abi))]
+        if dids_bytes is not None:
+            topics.append([Web3.toHex(did_bytes) for did_bytes in dids_bytes])
+
+        logs = Web3Provider.get_web3().eth.getLogs({
+            'fromBlock': from_block,
+            'toBlock': to_block,
+            'address': self.address,
+            'topics': topics
+        })
+        attributes = []
+        for log in logs:
+            log_item = get_event_data(event_abi, log).args
+            attributes.append({
+                'checksum': log_item['_checksum'],
+                'value': log_item['_value'],
+                'block_number': log_item['_blockNumberUpdated'],
+                'did_bytes': log_item['_did'],
+                'owner': Web3.toChecksumAddress(log_item['_owner']),
+            })
+
+        return attributes
+
+    def _get_index(self):
+        config = ConfigProvider.get_config()
+        if not config.did_registry_index:
+            return None
+
+        return DIDIndex.get_index(self, config.storage_path, config.did_registry_index_from_block)
+
+    def _get_indexed_attribute(self, did_bytes, block_number=None):
+        """
+        Return the attribute of the did from the local index, updating the index if the did is
+        not there or was updated after the indexed attribute.
+
+        The index is built in the background on the first lookup, the attributes are read from
+        the keeper events until it is ready. Then the attributes are read from the index without
+        calling the keeper, and the index follows the new blocks in the background.
+
+        :param did_bytes: DID, bytes32
+        :param block_number: block number the did was last updated, int
+        :return: the indexed attribute, None if the index is disabled, not ready or is missing
+            the attribute registered at `block_number`
+        """
+        index = self._get_index()
+        if not index:
+            return None
+
+        try:
+            if not index.is_ready:
+                index.update_in_background()
+                return None
+
+            if index.is_stale:
+                index.update_in_background()
+            attribute = index.get(did_bytes)
+            if not attribute or (block_number and attribute['block_number'] < block_number):
+                if block_number is None or index.last_block < block_number:
+                    # the did may be registered in the blocks not indexed yet
+                    index.update()
+                    attribute = index.get(did_bytes)
+        except Exception as err:
+            logger.warning(f'Could not read the DIDRegistry index: {str(err)}')
+            return None
+
+        if attribute and (block_number is None or attribute['block_number'] == block_number):
+            return attribute
+
+        return None
@@ -1,10 +1,8 @@
 """Keeper module to call keeper-contracts."""
 import logging
 
-from squid_py.config import DEFAULT_GAS_LIMIT
 from squid_py.exceptions import OceanInvalidTransaction
 from squid_py.keeper.contract_base import ContractBase
-from squid_py.keeper.web3_provider import Web3Provider
 
 
 class Dispenser(ContractBase):
@@ -25,12 +23,13 @@ class Dispenser(ContractBase):
         address = account.address
         try:
             account.unlock()
-            tx_hash = self.contract_concise.requestTokens(
-                amount,
-                transact={'from': address, 'gas': DEFAULT_GAS_LIMIT}
+            tx_hash = self.send_transaction(
+                'requestTokens',
+                [amount],
+                account=account
             )
             logging.debug(f'{address} requests {amount} tokens, returning receipt')
-            receipt = Web3Provider.get_web3().eth.waitForTransactionReceipt(tx_hash)
+            receipt = self.get_tx_receipt(tx_hash)
             logging.debug(f'requestTokens receipt: {receipt}')
             if not receipt:
                 return False
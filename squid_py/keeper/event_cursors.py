@@ -0,0 +1,82 @@
+import sqlite3
+
+
+def record_event_cursors(storage_path, cursors):
+    """
+    Records the last block processed for contract events.
+
+    :param storage_path:
+    :param cursors: list of tuples (contract_address, event_name, block_number)
+    :return:
+    """
+    conn = sqlite3.connect(storage_path)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''CREATE TABLE IF NOT EXISTS event_cursors
+               (address VARCHAR, event_name VARCHAR, block_number INTEGER,
+                PRIMARY KEY (address, event_name));'''
+        )
+        cursor.executemany(
+            'INSERT OR REPLACE INTO event_cursors VALUES (?,?,?)',
+            [(address.lower(), event_name, block_number)
+             for address, event_name, block_number in cursors],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def get_event_cursor(storage_path, contract_address, event_name):
+    """
+    Get the last block processed for a contract event.
+
+    :param storage_path:
+    :param contract_address:
+    :param event_name:
+    :return: block number, None if the event was never processed
+    """
+    conn = sqlite3.connect(storage_path)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''CREATE TABLE IF NOT EXISTS event_cursors
+               (address VARCHAR, event_name VARCHAR, block_number INTEGER,
+                PRIMARY KEY (address, event_name));'''
+        )
+        row = cursor.execute(
+            '''
+            SELECT block_number
+            FROM event_cursors
+            WHERE address=? AND event_name=?;
+            ''',
+            (contract_address.lower(), event_name)
+        ).fetchone()
+        return row[0] if row else None
+    finally:
+        conn.close()
+
+
+def delete_event_cursors(storage_path, cursors):
+    """
+    Delete the last block processed for contract events, once they are not listened to.
+
+    :param storage_path:
+    :param cursors: list of tuples (contract_address, event_name)
+    :return:
+    """
+    conn = sqlite3.connect(storage_path)
+    try:
+        cursor = conn.cursor()
+        cursor.execute(
+            '''CREATE TABLE IF NOT EXISTS event_cursors
+               (address VARCHAR, event_name VARCHAR, block_number INTEGER,
+                PRIMARY KEY (address, event_name));'''
+        )
+        cursor.executemany(
+            'DELETE FROM event_cursors WHERE address=? AND event_name=?;',
+            [(address.lower(), event_name) for address, event_name in cursors],
+        )
+        conn.commit()
+    finally:
+        conn.close()
@@ -1,104 +1,107 @@
+import asyncio
 import logging
-import time
-from datetime import datetime
-from threading import Thread
+from threading import Event
 
 from squid_py.keeper.contract_handler import ContractHandler
+from squid_py.keeper.event_poller import EventPoller, EventSubscription
 
 logger = logging.getLogger(__name__)
 
 
 class EventListener(object):
     """Class representing an event listener."""
-    def __init__(self, contract_name, event_name, args=None, from_block=0, to_block='latest',
-                 filters=None):
+    def __init__(self, contract_name, event_name, args=None, from_block='latest',
+                 to_block='latest', filters=None):
         contract = ContractHandler.get(contract_name)
+        self.event_name = event_name
         self.event = getattr(contract.events, event_name)
         self.filters = filters if filters else {}
-        self.event_filter = self.event().createFilter(
-            fromBlock=from_block, toBlock=to_block, argument_filters=self.filters
-        )
-        self.event_filter.poll_interval = 0.5
+        self.from_block = from_block
+        self.to_block = to_block
         self.timeout = 60  # seconds
         self.args = args
 
     def listen_once(self, callback, timeout=None, timeout_callback=None, start_time=None,
                     blocking=False):
         """
+        Watch for the event using the process wide `EventPoller`, no thread is started per
+        listener.
 
         :param callback: a callback function that takes one argument the event dict
         :param timeout: float timeout in seconds
         :param timeout_callback: a callback function when timeout expires
         :param start_time: float start time in seconds, defaults to current time and is used
             for calculating timeout
-        :param blocking: bool blocks this call until the event is detected
+        :param blocking: bool blocks this call until the event is detected, the callbacks are
+            then called in the calling thread
         :return: event if blocking is True and an event is received, otherwise returns None
         """
+        if not blocking:
+            EventPoller.get_instance().subscribe(self._make_subscription(
+                callback, timeout, timeout_callback, start_time))
+            return None
+
         events = []
-        original_callback = callback
+        received = Event()
 
-        def _callback(event):
+        def _wakeup(event):
             events.append(event)
-            original_callback(event)
-
-        if blocking:
-            callback = _callback
-        # TODO Review where to close this threads.
-        Thread(
-            target=EventListener.watch_one_event,
-            args=(self.event_filter,
-                  callback,
-                  timeout_callback,
-                  timeout if timeout is not None else self.timeout,
-                  self.args,
-                  start_time),
-            daemon=True,
-        ).start()
-        if blocking:
-            while not events:
-                time.sleep(0.2)
-
-            return events[0]
-
-        return None
-
-    @staticmethod
-    def watch_one_event(event_filter, callback, timeout_callback, timeout, args, start_time=None):
+            received.set()
+
+        EventPoller.get_instance().subscribe(self._make_subscription(
+            None, timeout, None, start_time, wakeup=_wakeup))
+        received.wait()
+
+        args = self.args or []
+        if events[0] is None and timeout_callback:
+            timeout_callback(*args)
+        elif callback:
+            callback(events[0], *args)
+        return events[0]
+
+    def listen_once_async(self, timeout=None, start_time=None, loop=None):
         """
-        Start to watch one event.
-
-        :param event_filter:
-        :param callback:
-        :param timeout_callback:
-        :param timeout:
-        :param args:
-        :param start_time:
-        :return:
+        Asyncio counterpart of `listen_once`, the returned future is resolved from the
+        process wide `EventPoller` so no thread is blocked while waiting for the event.
+
+        :param timeout: float timeout in seconds
+        :param start_time: float start time in seconds, defaults to current time and is used
+            for calculating timeout
+        :param loop: asyncio event loop, defaults to the current event loop
+        :return: asyncio.Future resolved with the event dict, or with None if the timeout expires
         """
-        if timeout and not start_time:
-            start_time = int(datetime.now().timestamp())
-
-        if not args:
-            args = []
-
-        while True:
-            try:
-                events = event_filter.get_all_entries()
-                if events:
-                    callback(events[0], *args)
-                    return
-
-            except ValueError as err:
-                # ignore error, but log it
-                logger.debug(f'Got error grabbing keeper events: {str(err)}')
-
-            time.sleep(0.1)
-            if timeout:
-                elapsed = int(datetime.now().timestamp()) - start_time
-                if elapsed > timeout:
-                    if timeout_callback:
-                        timeout_callback(*args)
-                    else:
-                        callback(None, *args)
-
-                    break
+        loop = loop or asyncio.get_event_loop()
+        future = loop.create_future()
+
+        def _resolve(event):
+            if not future.done():
+                future.set_result(event)
+
+        def _callback(event, *_):
+            loop.call_soon_threadsafe(_resolve, event)
+
+        poller = EventPoller.get_instance()
+        subscription_id = poller.subscribe(self._make_subscription(
+            _callback, timeout, None, start_time))
+
+        def _cancel(_future):
+            if _future.cancelled():
+                poller.unsubscribe(subscription_id)
+
+        future.add_done_callback(_cancel)
+        return future
+
+    def _make_subscription(self, callback, timeout, timeout_callback, start_time, wakeup=None):
+        return EventSubscription(
+            self.event.address,
+            self.event().abi,
+            callback,
+            filters=self.filters,
+            args=self.args,
+            from_block=self.from_block,
+            to_block=self.to_block,
+            timeout=timeout if timeout is not None else self.timeout,
+            timeout_callback=timeout_callback,
+            start_time=start_time,
+            wakeup=wakeup
+        )
@@ -0,0 +1,693 @@
+"""Keeper module to watch keeper-contracts events."""
+
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from itertools import count
+from threading import Lock, Thread
+
+import websockets
+from eth_utils import event_abi_to_log_topic
+from web3 import WebsocketProvider
+from web3.exceptions import MismatchedABI
+from web3.middleware.pythonic import log_entry_formatter
+from web3.utils.events import get_event_data
+
+from squid_py.config_provider import ConfigProvider
+from squid_py.keeper.event_cursors import (
+    delete_event_cursors,
+    get_event_cursor,
+    record_event_cursors,
+)
+from squid_py.keeper.web3_provider import Web3Provider
+
+logger = logging.getLogger(__name__)
+
+
+class EventSubscription(object):
+    """One-shot subscription to a contract event, dispatched by the `EventPoller`."""
+
+    def __init__(self, address, event_abi, callback, filters=None, args=None,
+                 from_block='latest', to_block='latest', timeout=None, timeout_callback=None,
+                 start_time=None, wakeup=None):
+        """
+
+        :param address: address of the contract emitting the event, hex str
+        :param event_abi: abi of the event, dict
+        :param callback: a callback function that takes the event dict followed by `args`
+        :param filters: dict of event argument names and expected values
+        :param args: list of extra arguments to pass to the callbacks
+        :param from_block: first block to look for the event, int. 'latest' starts after the
+            last block processed for this event and filters, as recorded in the `EventPoller`
+            storage, or at the current block if no block is recorded. None only resumes after
+            the recorded block: the subscription is dropped, without calling its callbacks, if
+            no block is recorded, because it completed or timed out before.
+        :param to_block: last block to look for the event, int or 'latest'
+        :param timeout: float timeout in seconds, no timeout if 0 or None
+        :param timeout_callback: a callback function when timeout expires
+        :param start_time: float start time in seconds, defaults to current time and is used
+            for calculating timeout
+        :param wakeup: a function called with the event, or None when the timeout expires, by the
+            poller thread before the callbacks are scheduled. It must not block, it is meant to
+            wake up a thread waiting for the event without using a worker of the pool.
+        """
+        self.address = address
+        self.event_abi = event_abi
+        self.event_name = event_abi['name']
+        self.topic = bytes(event_abi_to_log_topic(event_abi))
+        self.callback = callback
+        self.filters = filters if filters else {}
+        self.args = args if args else []
+        self.from_block = from_block
+        self.to_block = to_block
+        self.timeout = timeout
+        self.timeout_callback = timeout_callback
+        self.wakeup = wakeup
+        if timeout and not start_time:
+            start_time = int(datetime.now().timestamp())
+        self.start_time = start_time
+        self.subscription_id = None
+        # first block of the events delivered, resolved from `from_block` by the poller
+        self.start_block = None
+        self.done = False
+
+    @property
+    def cursor_name(self):
+        """Name of the cursor of this subscription, made of the event name and filters, str."""
+        filters = ','.join(f'{name}={_format_filter_value(value)}'
+                           for name, value in sorted(self.filters.items()))
+        return f'{self.event_name}({filters})'
+
+    def match(self, log):
+        """
+        Decode the log and check it against the event arguments filters.
+
+        :param log: raw log entry as returned by `eth_getLogs`
+        :return: the decoded event if it matches this subscription, None otherwise
+        """
+        if self.to_block != 'latest' and log['blockNumber'] > self.to_block:
+            return None
+        if self.start_block is not None and log['blockNumber'] < self.start_block:
+            return None
+
+        try:
+            event = get_event_data(self.event_abi, log)
+        except (MismatchedABI, ValueError):
+            return None
+
+        for name, value in self.filters.items():
+            expected = value if isinstance(value, (list, tuple)) else [value]
+            if _normalize(event.args.get(name)) not in [_normalize(v) for v in expected]:
+                return None
+
+        return event
+
+    def is_expired(self, now):
+        """
+        True if the timeout of this subscription has elapsed.
+
+        :param now: int current time in seconds
+        :return: bool
+        """
+        return bool(self.timeout) and (now - self.start_time) > self.timeout
+
+    def fire(self, event):
+        """Call the callback with the event."""
+        if self.callback:
+            self.callback(event, *self.args)
+
+    def fire_timeout(self):
+        """Call the timeout callback or the callback without event."""
+        if self.timeout_callback:
+            self.timeout_callback(*self.args)
+        else:
+            self.fire(None)
+
+
+class EventPoller(object):
+    """
+    Watch the keeper network for the events of every subscription in the process.
+
+    A single daemon thread checks the block number every `poll_interval` seconds. For every
+    new range of blocks the logs of all the subscribed contracts are fetched with one
+    `eth_getLogs` call and fanned out to the matching subscriptions, the past events of the
+    subscriptions added since the previous poll are fetched together the same way. Callbacks
+    run in a bounded pool of `max_workers` workers, so the number of threads and of RPC calls
+    stays flat as the number of subscriptions grows. Blocking listeners are woken up by the
+    poller thread and run their callbacks in their own thread, so a callback waiting for another
+    event does not take a worker needed to deliver it.
+
+    When `Web3Provider` uses a `WebsocketProvider` the logs are pushed by the node through an
+    `eth_subscribe('logs')` subscription instead, so the callbacks fire as soon as the block is
+    received. Polling is used while the websocket connection is down.
+
+    The last block processed for each subscription, identified by its contract event and
+    filters, is recorded in the sqlite database at `storage_path`, subscriptions created with
+    `from_block=None` resume from there. The record of a subscription is deleted once its
+    callback, or its timeout callback, has succeeded, or once it is unsubscribed. So the event
+    is delivered again after a restart if the callback did not complete, and the subscriptions
+    completed before the restart are not resumed.
+
+    Events are only handled once `confirmations` blocks have been mined on top of them. Pushed
+    logs are held until then and dropped if the node reports them as removed by a chain
+    reorganisation, or if the websocket connection is lost. When polling, the hashes of the
+    processed blocks are checked so a reorganisation deeper than `confirmations` rewinds the
+    poller to the common ancestor.
+    """
+    _instance = None
+    _instance_lock = Lock()
+    _MAX_BLOCK_HASHES = 64
+
+    def __init__(self, poll_interval=0.5, max_workers=8, storage_path=None, confirmations=0):
+        self.poll_interval = poll_interval
+        self.confirmations = confirmations
+        self._storage_path = storage_path
+        self._recorded_block = None
+        self._subscriptions = dict()
+        self._new_subscriptions = dict()
+        self._unsubscribed = []
+        self._ids = count()
+        self._lock = Lock()
+        self._last_block = None
+        self._block_hashes = OrderedDict()
+        self._pending_logs = OrderedDict()
+        self._thread = None
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+
+    @staticmethod
+    def get_instance():
+        """Return the EventPoller instance (singleton)."""
+        with EventPoller._instance_lock:
+            if EventPoller._instance is None:
+                config = ConfigProvider.get_config()
+                EventPoller._instance = EventPoller(
+                    max_workers=config.event_max_workers,
+                    storage_path=config.storage_path,
+                    confirmations=config.event_confirmations
+                )
+            return EventPoller._instance
+
+    @property
+    def last_block(self):
+        """Number of the last block processed by the poller."""
+        return self._last_block
+
+    def subscribe(self, subscription):
+        """
+        Register a subscription and start the poller thread if it is not running.
+
+        Past events (from `subscription.from_block`) are looked up in the next poll.
+
+        :param subscription: EventSubscription
+        :return: subscription id, int
+        """
+        if subscription.from_block == 'latest':
+            subscription.start_block = self._get_next_block()
+
+        with self._lock:
+            subscription_id = next(self._ids)
+            subscription.subscription_id = subscription_id
+            self._new_subscriptions[subscription_id] = subscription
+            if self._thread is None:
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+        return subscription_id
+
+    def unsubscribe(self, subscription_id):
+        """
+        Remove a subscription, its callbacks will not be called.
+
+        :param subscription_id: int
+        """
+        with self._lock:
+            subscription = self._subscriptions.pop(subscription_id, None) or \
+                self._new_subscriptions.pop(subscription_id, None)
+            if subscription:
+                subscription.done = True
+                # its cursor is deleted by the poller thread, after recording the cursors
+                self._unsubscribed.append(subscription)
+
+    def _run(self):
+        endpoint_uri = self._get_websocket_endpoint()
+        if endpoint_uri:
+            self._run_push(endpoint_uri)
+        else:
+            self._run_poll()
+
+    def _run_poll(self):
+        while True:
+            self._try_poll()
+            time.sleep(self.poll_interval)
+
+    def _run_push(self, endpoint_uri):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        while True:
+            try:
+                loop.run_until_complete(self._push(endpoint_uri, loop))
+            except Exception as err:
+                logger.warning(f'Keeper events websocket subscription failed, polling until '
+                               f'it is restored: {str(err)}')
+                # the held logs may be from blocks orphaned while the connection is down, the
+                # node does not report them as removed. They are fetched again on reconnection.
+                self._pending_logs.clear()
+
+            self._try_poll()
+            time.sleep(self.poll_interval)
+
+    async def _push(self, endpoint_uri, loop):
+        async with websockets.connect(endpoint_uri, loop=loop) as websocket:
+            logs_subscription = _LogsSubscription(websocket)
+            while True:
+                addresses = self._get_addresses()
+                if addresses != logs_subscription.addresses:
+                    await logs_subscription.subscribe(addresses)
+                    # catch up with the blocks mined before the subscription
+                    self._poll()
+                    if self.confirmations and self._last_block is not None:
+                        self._hold_logs(self._get_logs(self._last_block + 1, 'latest'))
+
+                if self._new_subscriptions:
+                    block_number = self._get_confirmed_block()
+                    self._activate_new_subscriptions(block_number)
+                    self._advance(block_number)
+
+                self._check_timeouts()
+                logs = await logs_subscription.get_logs(self.poll_interval)
+                if not self.confirmations:
+                    if logs:
+                        self._process_logs(logs)
+                        # blocks before the last pushed log are complete
+                        self._advance(max(log['blockNumber'] for log in logs) - 1)
+                else:
+                    self._hold_logs(logs)
+                    if self._pending_logs:
+                        self._process_confirmed_logs()
+
+                self._record_cursors()
+
+    def _try_poll(self):
+        try:
+            self._poll()
+        except Exception as err:
+            # ignore error, but log it
+            logger.debug(f'Got error grabbing keeper events: {str(err)}')
+
+        # the subscriptions time out even if the keeper can not be reached
+        self._check_timeouts()
+
+    def _poll(self):
+        with self._lock:
+            idle = not (self._subscriptions or self._new_subscriptions)
+
+        if idle:
+            self._last_block = None
+            self._block_hashes.clear()
+            # delete the cursors of the last unsubscribed subscriptions
+            self._record_cursors()
+            return
+
+        block_number = self._get_confirmed_block()
+        if self._last_block is None:
+            self._last_block = block_number
+            self._remember_block_hash(block_number)
+
+        self._activate_new_subscriptions(self._last_block)
+        if block_number > self._last_block:
+            self._check_reorg()
+            self._process_blocks(self._last_block + 1, block_number)
+            self._last_block = block_number
+            self._remember_block_hash(block_number)
+
+        self._record_cursors()
+
+    def _get_next_block(self):
+        """Return the first block not processed yet, None if it can not be read."""
+        if self._last_block is not None:
+            return self._last_block + 1
+
+        try:
+            return self._get_confirmed_block() + 1
+        except Exception as err:
+            logger.debug(f'Got error getting the keeper block number: {str(err)}')
+            return None
+
+    def _get_confirmed_block(self):
+        return max(Web3Provider.get_web3().eth.blockNumber - self.confirmations, 0)
+
+    def _advance(self, block_number):
+        if self._last_block is None or block_number > self._last_block:
+            self._last_block = block_number
+
+    def _remember_block_hash(self, block_number):
+        if not self.confirmations:
+            return
+
+        block = Web3Provider.get_web3().eth.getBlock(block_number)
+        self._block_hashes[block_number] = bytes(block['hash'])
+        while len(self._block_hashes) > self._MAX_BLOCK_HASHES:
+            self._block_hashes.popitem(last=False)
+
+    def _check_reorg(self):
+        """Rewind to the last processed block still in the chain after a reorganisation."""
+        if not self._block_hashes:
+            return
+
+        web3 = Web3Provider.get_web3()
+        for block_number in reversed(list(self._block_hashes)):
+            if bytes(web3.eth.getBlock(block_number)['hash']) == self._block_hashes[block_number]:
+                break
+            del self._block_hashes[block_number]
+        else:
+            block_number -= 1
+
+        if block_number == self._last_block:
+            return
+
+        logger.warning(f'Chain reorganisation deeper than {self.confirmations} confirmations, '
+                       f'processing the keeper events again from block {block_number + 1}.')
+        self._last_block = block_number
+        self._recorded_block = None
+
+    def _hold_logs(self, logs):
+        for log in logs:
+            key = (bytes(log['blockHash']), log['logIndex'])
+            if not log.get('removed'):
+                self._pending_logs[key] = log
+            elif self._pending_logs.pop(key, None) is None:
+                logger.warning(f'Chain reorganisation deeper than {self.confirmations} '
+                               f'confirmations removed a handled event in block '
+                               f'{log["blockNumber"]}.')
+
+    def _process_confirmed_logs(self):
+        block_number = self._get_confirmed_block()
+        confirmed = [log for log in self._pending_logs.values()
+                     if log['blockNumber'] <= block_number]
+        for log in confirmed:
+            del self._pending_logs[(bytes(log['blockHash']), log['logIndex'])]
+
+        self._process_logs(sorted(confirmed, key=lambda log: (log['blockNumber'], log['logIndex'])))
+        self._advance(block_number)
+
+    def _activate_new_subscriptions(self, to_block):
+        with self._lock:
+            new_subscriptions = self._new_subscriptions
+            self._new_subscriptions = dict()
+
+        backfilled = []
+        for subscription in new_subscriptions.values():
+            start_block = self._get_start_block(subscription, to_block)
+            if start_block is None:
+                logger.debug(f'No recorded block to resume {subscription.cursor_name} from, '
+                             f'it completed before.')
+                self._done(subscription)
+                continue
+
+            subscription.start_block = start_block
+            if start_block <= to_block:
+                backfilled.append(subscription)
+
+        try:
+            if backfilled:
+                # the past events of all the new subscriptions in one `eth_getLogs` call
+                self._process_logs(
+                    self._get_logs(min(s.start_block for s in backfilled), to_block, backfilled),
+                    backfilled
+                )
+        except Exception as err:
+            logger.debug(f'Got error grabbing past keeper events: {str(err)}')
+            # queue the subscriptions again for the next poll
+            with self._lock:
+                for subscription_id, subscription in new_subscriptions.items():
+                    if not subscription.done:
+                        self._new_subscriptions[subscription_id] = subscription
+            return
+
+        for subscription_id, subscription in new_subscriptions.items():
+            if not subscription.done:
+                with self._lock:
+                    self._subscriptions[subscription_id] = subscription
+                self._record_cursor(subscription, to_block)
+
+    def _get_addresses(self):
+        with self._lock:
+            subscriptions = list(self._subscriptions.values()) + list(
+                self._new_subscriptions.values())
+
+        return sorted({s.address for s in subscriptions})
+
+    @staticmethod
+    def _get_websocket_endpoint():
+        for provider in Web3Provider.get_web3().providers:
+            if isinstance(provider, WebsocketProvider):
+                return provider.endpoint_uri
+
+        return None
+
+    def _record_cursors(self):
+        if not self._storage_path:
+            return
+
+        with self._lock:
+            cursors = {(s.address, s.cursor_name) for s in self._subscriptions.values()}
+            unsubscribed, self._unsubscribed = self._unsubscribed, []
+
+        try:
+            if self._last_block not in (None, self._recorded_block):
+                record_event_cursors(
+                    self._storage_path,
+                    [(address, cursor_name, self._last_block)
+                     for address, cursor_name in cursors]
+                )
+                self._recorded_block = self._last_block
+            if unsubscribed:
+                delete_event_cursors(
+                    self._storage_path, [(s.address, s.cursor_name) for s in unsubscribed])
+        except sqlite3.Error as err:
+            logger.warning(f'Could not record the keeper events cursors: {str(err)}')
+
+    def _record_cursor(self, subscription, block_number):
+        if not self._storage_path:
+            return
+
+        try:
+            record_event_cursors(
+                self._storage_path,
+                [(subscription.address, subscription.cursor_name, block_number)]
+            )
+        except sqlite3.Error as err:
+            logger.warning(f'Could not record the keeper events cursor of '
+                           f'{subscription.cursor_name}: {str(err)}')
+
+    def _delete_cursor(self, subscription):
+        if not self._storage_path:
+            return
+
+        try:
+            delete_event_cursors(
+                self._storage_path, [(subscription.address, subscription.cursor_name)])
+        except sqlite3.Error as err:
+            logger.warning(f'Could not delete the keeper events cursor of '
+                           f'{subscription.cursor_name}: {str(err)}')
+
+    def _get_resume_block(self, subscription):
+        """Return the block to resume a subscription from, None if it has no recorded block."""
+        if not self._storage_path:
+            return None
+
+        block_number = get_event_cursor(
+            self._storage_path, subscription.address, subscription.cursor_name)
+        return block_number + 1 if block_number is not None else None
+
+    def _get_start_block(self, subscription, to_block):
+        """
+        Return the first block to look for the events of a new subscription in, None if it
+        resumes with no recorded block.
+        """
+        from_block = subscription.from_block
+        if from_block in (None, 'latest'):
+            resume_block = self._get_resume_block(subscription)
+            if resume_block is not None or from_block is None:
+                return resume_block
+            if subscription.start_block is None:
+                # the block number could not be read when subscribing
+                return to_block
+            return subscription.start_block
+        if from_block == 'earliest':
+            return 0
+        return from_block
+
+    def _process_blocks(self, from_block, to_block):
+        self._process_logs(self._get_logs(from_block, to_block))
+
+    def _get_logs(self, from_block, to_block, subscriptions=None):
+        if subscriptions is None:
+            with self._lock:
+                subscriptions = list(self._subscriptions.values())
+
+        if not subscriptions:
+            return []
+
+        addresses = sorted({s.address for s in subscriptions})
+        topics = sorted({s.topic for s in subscriptions})
+        return Web3Provider.get_web3().eth.getLogs({
+            'fromBlock': from_block,
+            'toBlock': to_block,
+            'address': addresses,
+            'topics': [[Web3Provider.get_web3().toHex(topic) for topic in topics]]
+        })
+
+    def _process_logs(self, logs, subscriptions=None):
+        if subscriptions is None:
+            with self._lock:
+                subscriptions = list(self._subscriptions.values())
+
+        by_address_and_topic = dict()
+        for subscription in subscriptions:
+            key = (subscription.address.lower(), subscription.topic)
+            by_address_and_topic.setdefault(key, []).append(subscription)
+
+        for log in logs:
+            if not log['topics'] or log.get('removed'):
+                continue
+
+            key = (log['address'].lower(), bytes(log['topics'][0]))
+            for subscription in by_address_and_topic.get(key, []):
+                if subscription.done:
+                    continue
+
+                event = subscription.match(log)
+                if event:
+                    self._dispatch(subscription, event)
+
+    def _check_timeouts(self):
+        now = int(datetime.now().timestamp())
+        with self._lock:
+            subscriptions = list(self._subscriptions.values()) + list(
+                self._new_subscriptions.values())
+
+        for subscription in subscriptions:
+            if not subscription.done and subscription.is_expired(now):
+                self._done(subscription)
+                if subscription.wakeup:
+                    subscription.wakeup(None)
+                self._executor.submit(self._fire_timeout, subscription)
+
+    def _dispatch(self, subscription, event):
+        if subscription.done:
+            return
+
+        self._done(subscription)
+        if subscription.wakeup:
+            subscription.wakeup(event)
+        self._executor.submit(self._fire, subscription, event)
+
+    def _fire(self, subscription, event):
+        if self._call(subscription.fire, event):
+            self._delete_cursor(subscription)
+
+    def _fire_timeout(self, subscription):
+        if self._call(subscription.fire_timeout):
+            self._delete_cursor(subscription)
+
+    def _done(self, subscription):
+        subscription.done = True
+        with self._lock:
+            self._subscriptions.pop(subscription.subscription_id, None)
+            self._new_subscriptions.pop(subscription.subscription_id, None)
+
+    @staticmethod
+    def _call(fn, *args):
+        try:
+            fn(*args)
+            return True
+        except Exception as err:
+            logger.error(f'Error in event callback {fn}: {str(err)}')
+            return False
+
+
+class _LogsSubscription(object):
+    """`eth_subscribe('logs')` subscription over a websocket connection."""
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self.addresses = []
+        self.subscription_id = None
+        self._ids = count()
+        self._logs = []
+
+    async def subscribe(self, addresses):
+        """
+        Replace the current subscription with one for the logs of `addresses`.
+
+        :param addresses: list of contract addresses
+        """
+        if self.subscription_id:
+            await self._request('eth_unsubscribe', [self.subscription_id])
+            self.subscription_id = None
+
+        if addresses:
+            self.subscription_id = await self._request(
+                'eth_subscribe', ['logs', {'address': addresses}])
+        self.addresses = addresses
+
+    async def get_logs(self, timeout):
+        """
+        Return the logs pushed by the node, waiting up to `timeout` seconds for one.
+
+        :param timeout: float timeout in seconds
+        :return: list of log entries
+        """
+        if not self._logs:
+            try:
+                message = await asyncio.wait_for(self.websocket.recv(), timeout)
+                self._on_message(json.loads(message))
+            except asyncio.TimeoutError:
+                pass
+
+        logs, self._logs = self._logs, []
+        return logs
+
+    async def _request(self, method, params):
+        request_id = next(self._ids)
+        await self.websocket.send(json.dumps(
+            {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': params}))
+        while True:
+            message = json.loads(await self.websocket.recv())
+            if message.get('id') != request_id:
+                self._on_message(message)
+                continue
+
+            if 'error' in message:
+                raise ValueError(f'{method} failed: {message["error"]}')
+            return message['result']
+
+    def _on_message(self, message):
+        if message.get('method') != 'eth_subscription':
+            return
+
+        params = message['params']
+        if params['subscription'] == self.subscription_id:
+            self._logs.append(log_entry_formatter(params['result']))
+
+
+def _format_filter_value(value):
+    if isinstance(value, (list, tuple)):
+        return '|'.join(_format_filter_value(v) for v in value)
+    if isinstance(value, bytes):
+        return '0x' + value.hex()
+    return str(_normalize(value))
+
+
+def _normalize(value):
+    if isinstance(value, str):
+        return value.lower()
+    if isinstance(value, bytes):
+        return bytes(value)
+    return value
@@ -0,0 +1,226 @@
+"""Keeper module to set the gas limit and gas price of the transactions."""
+
+import logging
+from collections import OrderedDict
+from threading import Lock
+
+from squid_py.config_provider import ConfigProvider
+from squid_py.keeper.batch_call import batch_request
+from squid_py.keeper.web3_provider import Web3Provider
+
+logger = logging.getLogger(__name__)
+
+
+class GasStrategy(object):
+    """Sets the gas of the keeper transactions, this one leaves it to the keeper node."""
+
+    def fill_transaction(self, contract, function_name, args, transact):
+        """
+        Set the gas limit and gas price of a transaction.
+
+        :param contract: ContractBase
+        :param function_name: name of the contract function, str
+        :param args: list of the args of the function
+        :param transact: dict of the transaction parameters
+        :return: dict of the transaction parameters
+        """
+        return transact
+
+    def record_receipt(self, contract, function_name, args, transact, receipt):
+        """
+        Learn from the receipt of a transaction sent with the parameters filled by the strategy.
+
+        :param contract: ContractBase
+        :param function_name: name of the contract function, str
+        :param args: list of the args of the function
+        :param transact: dict of the transaction parameters
+        :param receipt: the transaction receipt
+        """
+
+    def get_stats(self):
+        """
+        Return the gas stats of the transactions of each contract function.
+
+        :return: dict of `<contract name>.<function name>` and dict of stats
+        """
+        return dict()
+
+
+class EstimatingGasStrategy(GasStrategy):
+    """
+    Sets the gas limit to the estimated gas of the function plus a safety margin, and the gas
+    price to a percentile of the gas prices of the transactions of the last blocks.
+
+    The gas of a function is estimated once per length of its dynamic args and raised to the
+    highest gas used by its transactions, so the estimate is not requested for each
+    transaction. When the estimation fails, e.g. because the transaction depends on a pending
+    one, the `gas_limit` of the config is used.
+    """
+
+    def __init__(self, gas_margin=1.2, gas_price_percentile=50, gas_price_blocks=20):
+        """
+
+        :param gas_margin: float factor applied to the estimated gas
+        :param gas_price_percentile: percentile of the gas prices of the recent transactions to
+            use, int between 0 and 100
+        :param gas_price_blocks: number of blocks to get the gas prices of the transactions of
+        """
+        self.gas_margin = gas_margin
+        self.gas_price_percentile = gas_price_percentile
+        self.gas_price_blocks = gas_price_blocks
+        self._gas = dict()
+        self._stats = dict()
+        self._block_gas_prices = OrderedDict()
+        self._gas_price = None
+        self._gas_price_block = None
+        self._lock = Lock()
+
+    def fill_transaction(self, contract, function_name, args, transact):
+        transact = dict(transact)
+        if 'gas' not in transact:
+            transact['gas'] = self.get_gas(contract, function_name, args, transact.get('from'))
+        if 'gasPrice' not in transact:
+            gas_price = self.get_gas_price()
+            if gas_price:
+                transact['gasPrice'] = gas_price
+
+        with self._lock:
+            stats = self._get_function_stats(contract, function_name)
+            stats['transactions'] += 1
+        return transact
+
+    def record_receipt(self, contract, function_name, args, transact, receipt):
+        key = _gas_key(contract, function_name, args)
+        with self._lock:
+            stats = self._get_function_stats(contract, function_name)
+            stats['gas_used'] += receipt.gasUsed
+            stats['gas_used_max'] = max(stats['gas_used_max'], receipt.gasUsed)
+            if receipt.status == 1:
+                self._gas[key] = max(self._gas.get(key, 0), receipt.gasUsed)
+                return
+
+            stats['failed'] += 1
+            if receipt.gasUsed >= transact.get('gas', 0):
+                # out of gas, estimate the gas again next time
+                self._gas.pop(key, None)
+
+    def get_stats(self):
+        with self._lock:
+            return {name: dict(stats) for name, stats in self._stats.items()}
+
+    def get_gas(self, contract, function_name, args, from_address):
+        """
+        Return the gas limit of a call of a contract function.
+
+        :param contract: ContractBase
+        :param function_name: name of the contract function, str
+        :param args: list of the args of the function
+        :param from_address: address sending the transaction, str
+        :return: gas limit, int
+        """
+        max_gas = _get_max_gas()
+        key = _gas_key(contract, function_name, args)
+        with self._lock:
+            gas = self._gas.get(key)
+
+        if gas is None:
+            try:
+                gas = getattr(contract.contract.functions, function_name)(*args).estimateGas(
+                    {'from': from_address} if from_address else {})
+            except ValueError as err:
+                logger.debug(f'Could not estimate the gas of {key[0]}, using the gas limit: '
+                             f'{str(err)}')
+                return max_gas
+
+            with self._lock:
+                self._gas[key] = max(self._gas.get(key, 0), gas)
+                self._get_function_stats(contract, function_name)['gas_estimate'] = gas
+
+        return min(int(gas * self.gas_margin), max_gas)
+
+    def get_gas_price(self):
+        """
+        Return the `gas_price_percentile` percentile of the gas prices of the transactions of the
+        last `gas_price_blocks` blocks, the gas price of the keeper node if they have no
+        transaction.
+
+        :return: gas price in wei, int
+        """
+        web3 = Web3Provider.get_web3()
+        block_number = web3.eth.blockNumber
+        with self._lock:
+            if block_number == self._gas_price_block:
+                return self._gas_price
+
+            first_block = max(block_number - self.gas_price_blocks + 1, 0)
+            new_blocks = [number for number in range(first_block, block_number + 1)
+                          if number not in self._block_gas_prices]
+
+        blocks = batch_request(
+            'eth_getBlockByNumber', [[hex(number), True] for number in new_blocks])
+        with self._lock:
+            for number, block in zip(new_blocks, blocks):
+                if block is None:
+                    # the block could not be read, it is requested again on the next call
+                    continue
+                self._block_gas_prices[number] = [
+                    int(transaction['gasPrice'], 16) for transaction in block['transactions']
+                ]
+            for number in list(self._block_gas_prices):
+                if number < first_block:
+                    del self._block_gas_prices[number]
+
+            gas_prices = sorted(
+                price for prices in self._block_gas_prices.values() for price in prices)
+
+        if gas_prices:
+            index = min(len(gas_prices) * self.gas_price_percentile // 100, len(gas_prices) - 1)
+            gas_price = gas_prices[index]
+        else:
+            gas_price = web3.eth.gasPrice
+
+        with self._lock:
+            self._gas_price = gas_price
+            self._gas_price_block = block_number
+        return gas_price
+
+    def _get_function_stats(self, contract, function_name):
+        name = f'{contract.name}.{function_name}'
+        if name not in self._stats:
+            self._stats[name] = {'transactions': 0, 'failed': 0, 'gas_estimate': None,
+                                 'gas_used': 0, 'gas_used_max': 0}
+        return self._stats[name]
+
+
+class GasStrategyProvider(object):
+    """Provides the GasStrategy of the keeper transactions."""
+    _strategy = None
+
+    @staticmethod
+    def get_strategy():
+        """Get the GasStrategy, an `EstimatingGasStrategy` unless another one was set."""
+        if GasStrategyProvider._strategy is None:
+            GasStrategyProvider._strategy = EstimatingGasStrategy()
+
+        return GasStrategyProvider._strategy
+
+    @staticmethod
+    def set_strategy(strategy):
+        """
+         Set the GasStrategy.
+
+        :param strategy: GasStrategy, None to use the default one
+        """
+        GasStrategyProvider._strategy = strategy
+
+
+def _get_max_gas():
+    return ConfigProvider.get_config().gas_limit
+
+
+def _gas_key(contract, function_name, args):
+    # the gas used depends on the size of the strings, bytes and arrays args
+    return (
+        f'{contract.name}.{function_name}',
+        tuple(len(arg) if isinstance(arg, (str, bytes, list, tuple)) else None for arg in args)
+    )
@@ -0,0 +1,26 @@
+"""Keeper module with the web3 http provider using the shared http session."""
+
+import logging
+
+from web3 import HTTPProvider
+from web3.utils.datastructures import NamedElementOnion
+
+from squid_py.http_session_provider import HttpSessionProvider
+
+logger = logging.getLogger(__name__)
+
+
+class KeeperHTTPProvider(HTTPProvider):
+    """`HTTPProvider` sending the requests through the `HttpSessionProvider` session."""
+    # the failed connections are retried by the session
+    _middlewares = NamedElementOnion([])
+
+    def make_request(self, method, params):
+        logger.debug(f'Making request HTTP. URI: {self.endpoint_uri}, Method: {method}')
+        return self.decode_rpc_response(self._post(self.encode_rpc_request(method, params)))
+
+    def _post(self, request_data):
+        response = HttpSessionProvider.get_session().post(
+            self.endpoint_uri, data=request_data, **dict(self.get_request_kwargs()))
+        response.raise_for_status()
+        return response.content
@@ -2,9 +2,11 @@
 
 import logging
 import os
+from threading import Lock
 
 from squid_py.config_provider import ConfigProvider
 from squid_py.keeper.agreements.agreement_manager import AgreementStoreManager
+from squid_py.keeper.artifacts_loader import ArtifactsLoader
 from squid_py.keeper.conditions.access import AccessSecretStoreCondition
 from squid_py.keeper.conditions.condition_manager import ConditionStoreManager
 from squid_py.keeper.conditions.escrow_reward import EscrowRewardCondition
@@ -19,8 +21,45 @@ from squid_py.keeper.token import Token
 from squid_py.keeper.web3_provider import Web3Provider
 
 
+class _LazyAttribute(object):
+    """Keeper attribute computed by `factory` the first time it is read on an instance."""
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.name = None
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        value = self.factory()
+        # the instance attribute takes precedence over this descriptor from now on
+        instance.__dict__[self.name] = value
+        return value
+
+
+def _get_network_name():
+    return Keeper.get_network_name(Keeper.get_network_id())
+
+
+def _get_artifacts_path():
+    return ConfigProvider.get_config().keeper_path
+
+
 class Keeper(object):
-    """The Keeper class aggregates all contracts in the Ocean Protocol node."""
+    """
+    The Keeper class aggregates all contracts in the Ocean Protocol node.
+
+    The contracts are loaded the first time they are used, so a process only pays for the
+    artifacts of the contracts it calls. `get_instance` returns the same Keeper to every caller
+    of the process, so the contracts are loaded once. The accounts are read from the node on
+    every access, so the accounts added to the node later are seen.
+    """
+    _instance = None
+    _instance_lock = Lock()
 
     DEFAULT_NETWORK_NAME = 'development'
     _network_name_map = {
@@ -35,28 +74,60 @@ class Keeper(object):
         8996: 'spree',
     }
 
-    def __init__(self):
-        self.network_name = Keeper.get_network_name(Keeper.get_network_id())
-        self.artifacts_path = ConfigProvider.get_config().keeper_path
-        self.accounts = Web3Provider.get_web3().eth.accounts
-
-        self.dispenser = Dispenser.get_instance()
-        self.token = Token.get_instance()
-        self.did_registry = DIDRegistry.get_instance()
-        self.template_manager = TemplateStoreManager.get_instance()
-        self.escrow_access_secretstore_template = EscrowAccessSecretStoreTemplate.get_instance()
-        self.agreement_manager = AgreementStoreManager.get_instance()
-        self.condition_manager = ConditionStoreManager.get_instance()
-        self.sign_condition = SignCondition.get_instance()
-        self.lock_reward_condition = LockRewardCondition.get_instance()
-        self.escrow_reward_condition = EscrowRewardCondition.get_instance()
-        self.access_secret_store_condition = AccessSecretStoreCondition.get_instance()
-        self.hash_lock_condition = HashLockCondition.get_instance()
+    network_name = _LazyAttribute(_get_network_name)
+    artifacts_path = _LazyAttribute(_get_artifacts_path)
+
+    dispenser = _LazyAttribute(Dispenser.get_instance)
+    token = _LazyAttribute(Token.get_instance)
+    did_registry = _LazyAttribute(DIDRegistry.get_instance)
+    template_manager = _LazyAttribute(TemplateStoreManager.get_instance)
+    escrow_access_secretstore_template = _LazyAttribute(
+        EscrowAccessSecretStoreTemplate.get_instance)
+    agreement_manager = _LazyAttribute(AgreementStoreManager.get_instance)
+    condition_manager = _LazyAttribute(ConditionStoreManager.get_instance)
+    sign_condition = _LazyAttribute(SignCondition.get_instance)
+    lock_reward_condition = _LazyAttribute(LockRewardCondition.get_instance)
+    escrow_reward_condition = _LazyAttribute(EscrowRewardCondition.get_instance)
+    access_secret_store_condition = _LazyAttribute(AccessSecretStoreCondition.get_instance)
+    hash_lock_condition = _LazyAttribute(HashLockCondition.get_instance)
+
+    @property
+    def accounts(self):
+        """Addresses of the accounts of the keeper node, list of str."""
+        return Web3Provider.get_web3().eth.accounts
 
     @staticmethod
     def get_instance():
         """Return the Keeper instance (singleton)."""
-        return Keeper()
+        with Keeper._instance_lock:
+            if Keeper._instance is None:
+                Keeper._instance = Keeper()
+
+            return Keeper._instance
+
+    @staticmethod
+    def set_instance(keeper):
+        """
+        Set the Keeper instance returned by `get_instance`.
+
+        :param keeper: Keeper, None to create a new one on the next `get_instance` call
+        """
+        with Keeper._instance_lock:
+            Keeper._instance = keeper
+
+    @staticmethod
+    def reset_instance():
+        """
+        Drop the Keeper instance, e.g. after the config changed, to reload the contracts.
+
+        The loaded contracts, artifacts and web3 instance are dropped too, so the next Keeper
+        uses the keeper url and artifacts path of the current config.
+        """
+        from squid_py.keeper.contract_handler import ContractHandler
+        Keeper.set_instance(None)
+        ContractHandler.reset()
+        ArtifactsLoader.reset_loaders()
+        Web3Provider.reset_web3()
 
     @staticmethod
     def get_network_name(network_id):
@@ -91,16 +162,32 @@ class Keeper(object):
         :param account: Account
         :return:
         """
+        if account.is_local:
+            return account.sign_hash(msg_hash)
+
         return Web3Provider.get_web3().eth.sign(account.address, msg_hash).hex()
 
+    def has_account(self, account):
+        """
+        Check if the account can send transactions, because it signs locally or it is managed
+        by the keeper node.
+
+        :param account: Account
+        :return: bool
+        """
+        return account.is_local or account.address in self.accounts
+
     @staticmethod
     def unlock_account(account):
         """
-        Unlock the account.
+        Unlock the account, the accounts signing locally do not need to be unlocked.
 
         :param account: Account
         :return:
         """
+        if account.is_local:
+            return True
+
         return Web3Provider.get_web3().personal.unlockAccount(account.address, account.password)
 
     @staticmethod
@@ -0,0 +1,97 @@
+"""Keeper module to assign the nonces of the transactions locally."""
+
+import logging
+from threading import Lock
+
+from squid_py.keeper.web3_provider import Web3Provider
+
+logger = logging.getLogger(__name__)
+
+
+class NonceManager(object):
+    """
+    Assigns the nonces of the transactions sent from an account, so several transactions of the
+    account can be in flight at the same time.
+
+    The first nonce is the `pending` transaction count of the account, the next ones are counted
+    locally. The nonces of the transactions that could not be sent are assigned again before
+    new ones. When the keeper rejects a nonce, e.g. because another process sent transactions
+    from the account, the manager is `reset` to read the nonces from the keeper again.
+    """
+    _managers = dict()
+    _managers_lock = Lock()
+
+    def __init__(self, address):
+        """
+
+        :param address: address of the account, str
+        """
+        self.address = address
+        self._next_nonce = None
+        self._released = set()
+        self._lock = Lock()
+
+    @staticmethod
+    def get_nonce_manager(address):
+        """Return the NonceManager of the account `address`."""
+        key = address.lower()
+        with NonceManager._managers_lock:
+            if key not in NonceManager._managers:
+                NonceManager._managers[key] = NonceManager(address)
+            return NonceManager._managers[key]
+
+    def get_nonce(self):
+        """
+        Assign the nonce of the next transaction of the account.
+
+        :return: nonce, int
+        """
+        with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = Web3Provider.get_web3().eth.getTransactionCount(
+                    self.address, 'pending')
+            if self._released:
+                nonce = min(self._released)
+                self._released.remove(nonce)
+                return nonce
+
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            return nonce
+
+    def release_nonce(self, nonce):
+        """
+        Give back the nonce of a transaction that could not be sent.
+
+        The nonce is assigned again to the next transaction, before the new nonces, so the
+        transactions already assigned the next nonces are not left waiting for it.
+
+        :param nonce: int
+        """
+        with self._lock:
+            if self._next_nonce is None or nonce >= self._next_nonce:
+                # assigned before a reset
+                return
+
+            self._released.add(nonce)
+            while self._next_nonce - 1 in self._released:
+                self._next_nonce -= 1
+                self._released.remove(self._next_nonce)
+
+    def reset(self):
+        """Read the next nonce from the keeper on the next `get_nonce` call."""
+        with self._lock:
+            self._next_nonce = None
+            self._released.clear()
+
+
+def is_nonce_error(error):
+    """
+    Check if the keeper rejected a transaction because of its nonce.
+
+    :param error: Exception raised sending the transaction
+    :return: bool
+    """
+    message = str(error).lower()
+    return any(text in message for text in (
+        'nonce', 'replacement transaction', 'known transaction', 'already imported'))
@@ -0,0 +1,137 @@
+"""Keeper module to wait for the receipts of the transactions."""
+
+import logging
+import time
+from concurrent.futures import Future
+from threading import Lock, Thread
+
+from hexbytes import HexBytes
+from web3.middleware.pythonic import receipt_formatter
+from web3.utils.datastructures import AttributeDict
+
+from squid_py.keeper.batch_call import batch_request
+from squid_py.keeper.web3_provider import Web3Provider
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RECEIPT_TIMEOUT = 120
+
+
+class ReceiptTracker(object):
+    """
+    Waits for the receipts of the transactions sent to the keeper.
+
+    One thread checks the receipts of all the pending transactions once per new block, in one
+    JSON-RPC batch request, and resolves the futures of the transactions mined. The receipts are
+    requested again on the next check if the keeper can not be reached, the futures only fail
+    when their timeout expires. The thread stops when there is no pending transaction.
+    """
+    _instance = None
+    _instance_lock = Lock()
+
+    def __init__(self, poll_interval=0.5, timeout=DEFAULT_RECEIPT_TIMEOUT):
+        """
+
+        :param poll_interval: float time in seconds between two checks of the block number
+        :param timeout: float default time in seconds to wait for a receipt
+        """
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self._pending = dict()
+        self._unchecked = set()
+        self._last_block = None
+        self._last_error = None
+        self._lock = Lock()
+        self._thread = None
+
+    @staticmethod
+    def get_instance():
+        """Return the ReceiptTracker instance (singleton)."""
+        with ReceiptTracker._instance_lock:
+            if ReceiptTracker._instance is None:
+                ReceiptTracker._instance = ReceiptTracker()
+            return ReceiptTracker._instance
+
+    def track(self, tx_hash, timeout=None):
+        """
+        Wait for the receipt of a transaction.
+
+        :param tx_hash: hash of the transaction, bytes or hex str
+        :param timeout: float time in seconds to wait for the receipt, the tracker default if None
+        :return: `concurrent.futures.Future` of the receipt, failing with `TimeoutError` if the
+            transaction is not mined in time
+        """
+        tx_hash = HexBytes(tx_hash).hex()
+        future = Future()
+        deadline = time.monotonic() + (timeout or self.timeout)
+        with self._lock:
+            self._pending.setdefault(tx_hash, []).append((future, deadline))
+            self._unchecked.add(tx_hash)
+            if self._thread is None:
+                self._thread = Thread(target=self._run, daemon=True)
+                self._thread.start()
+
+        return future
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+
+            try:
+                self._check_receipts()
+                self._last_error = None
+            except Exception as err:
+                # the transactions may still be mined, check them again on the next tick
+                logger.debug(f'Got error checking the transaction receipts: {str(err)}')
+                self._last_error = err
+
+            self._expire()
+            time.sleep(self.poll_interval)
+
+    def _check_receipts(self):
+        block_number = Web3Provider.get_web3().eth.blockNumber
+        with self._lock:
+            if block_number != self._last_block:
+                tx_hashes = list(self._pending)
+            else:
+                # the transactions tracked since the last check may be mined already
+                tx_hashes = list(self._unchecked)
+
+        if not tx_hashes:
+            return
+
+        receipts = batch_request('eth_getTransactionReceipt', [[tx_hash] for tx_hash in tx_hashes])
+        with self._lock:
+            self._last_block = block_number
+            self._unchecked.difference_update(tx_hashes)
+        for tx_hash, receipt in zip(tx_hashes, receipts):
+            if receipt is None or receipt.get('blockNumber') is None:
+                continue
+
+            receipt = AttributeDict.recursive(receipt_formatter(receipt))
+            with self._lock:
+                waiters = self._pending.pop(tx_hash, [])
+            for future, _ in waiters:
+                future.set_result(receipt)
+
+    def _expire(self):
+        now = time.monotonic()
+        expired = []
+        with self._lock:
+            for tx_hash, waiters in list(self._pending.items()):
+                expired.extend((tx_hash, future) for future, deadline in waiters
+                               if deadline < now)
+                waiters = [(future, deadline) for future, deadline in waiters if deadline >= now]
+                if waiters:
+                    self._pending[tx_hash] = waiters
+                else:
+                    del self._pending[tx_hash]
+                    self._unchecked.discard(tx_hash)
+
+        last_error = f', last error: {str(self._last_error)}' if self._last_error else ''
+        for tx_hash, future in expired:
+            future.set_exception(TimeoutError(
+                f'Transaction {tx_hash} is not mined after waiting for its receipt{last_error}'))
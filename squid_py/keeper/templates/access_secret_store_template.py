@@ -1,4 +1,3 @@
-from squid_py.config import DEFAULT_GAS_LIMIT
 from squid_py.keeper import ContractBase
 from squid_py.keeper.web3_provider import Web3Provider
 
@@ -21,17 +20,32 @@ class EscrowAccessSecretStoreTemplate(ContractBase):
         :param publisher_account:
         :return:
         """
+        return self.submit_create_agreement(
+            agreement_id, did, condition_ids, time_locks, time_outs, consumer_address,
+            publisher_account
+        ).result().status == 1
+
+    def submit_create_agreement(self, agreement_id, did, condition_ids, time_locks, time_outs,
+                                consumer_address, publisher_account):
+        """
+        Send the transaction creating the agreement without waiting for it to be mined, so the
+        agreements of a publisher can be created in the same block.
+
+        :param agreement_id:
+        :param did:
+        :param condition_ids:
+        :param time_locks:
+        :param time_outs:
+        :param consumer_address:
+        :param publisher_account:
+        :return: `concurrent.futures.Future` of the transaction receipt
+        """
         publisher_account.unlock()
-        tx_hash = self.contract_concise.createAgreement(
-            agreement_id,
-            did,
-            condition_ids,
-            time_locks,
-            time_outs,
-            consumer_address,
-            transact={'from': publisher_account.address, 'gas': DEFAULT_GAS_LIMIT}
+        return self.submit_transaction(
+            'createAgreement',
+            [agreement_id, did, condition_ids, time_locks, time_outs, consumer_address],
+            account=publisher_account
         )
-        return self.get_tx_receipt(tx_hash).status == 1
 
     def get_condition_types(self):
         """
@@ -58,7 +72,8 @@ class EscrowAccessSecretStoreTemplate(ContractBase):
         data = self.get_agreement_data(agreement_id)
         return data[0] if data and len(data) > 1 else None
 
-    def subscribe_agreement_created(self, agreement_id, timeout, callback, args, wait=False):
+    def subscribe_agreement_created(self, agreement_id, timeout, callback, args, wait=False,
+                                    from_block='latest'):
         """
         Subscribe to an agreement created.
 
@@ -67,6 +82,9 @@ class EscrowAccessSecretStoreTemplate(ContractBase):
         :param callback:
         :param args:
         :param wait:
+        :param from_block: first block to look for the event, int. 'latest' starts after the
+            last block processed for this event, or at the current block. None resumes after the
+            last block processed for this event before a restart
         :return:
         """
         return self.subscribe_to_event(
@@ -75,5 +93,20 @@ class EscrowAccessSecretStoreTemplate(ContractBase):
             {'_agreementId': Web3Provider.get_web3().toBytes(hexstr=agreement_id)},
             callback=callback,
             args=args,
-            wait=wait
+            wait=wait,
+            from_block=from_block
+        )
+
+    async def subscribe_agreement_created_async(self, agreement_id, timeout):
+        """
+        Wait for an agreement created event without blocking the asyncio event loop.
+
+        :param agreement_id:
+        :param timeout:
+        :return: the event dict, or None if the timeout expires
+        """
+        return await self.subscribe_to_event_async(
+            self.AGREEMENT_CREATED_EVENT,
+            timeout,
+            {'_agreementId': Web3Provider.get_web3().toBytes(hexstr=agreement_id)}
         )
@@ -1,6 +1,5 @@
 from collections import namedtuple
 
-from squid_py.config import DEFAULT_GAS_LIMIT
 from squid_py.keeper import ContractBase
 
 AgreementTemplate = namedtuple(
@@ -34,8 +33,11 @@ class TemplateStoreManager(ContractBase):
         :return:
         """
         from_account.unlock()
-        tx_hash = self.contract_concise.proposeTemplate(
-            template_id, transact={'from': from_account.address, 'gas': DEFAULT_GAS_LIMIT})
+        tx_hash = self.send_transaction(
+            'proposeTemplate',
+            [template_id],
+            account=from_account
+        )
         return self.get_tx_receipt(tx_hash).status == 1
 
     def approve_template(self, template_id, from_account):
@@ -47,8 +49,11 @@ class TemplateStoreManager(ContractBase):
         :return:
         """
         from_account.unlock()
-        tx_hash = self.contract_concise.approveTemplate(
-            template_id, transact={'from': from_account.address, 'gas': DEFAULT_GAS_LIMIT})
+        tx_hash = self.send_transaction(
+            'approveTemplate',
+            [template_id],
+            account=from_account
+        )
         return self.get_tx_receipt(tx_hash).status == 1
 
     def revoke_template(self, template_id, from_account):
@@ -60,8 +65,11 @@ class TemplateStoreManager(ContractBase):
         :return:
         """
         from_account.unlock()
-        tx_hash = self.contract_concise.revokeTemplate(
-            template_id, transact={'from': from_account.address, 'gas': DEFAULT_GAS_LIMIT})
+        tx_hash = self.send_transaction(
+            'revokeTemplate',
+            [template_id],
+            account=from_account
+        )
         return self.get_tx_receipt(tx_hash).status == 1
 
     def is_template_approved(self, template_id):
@@ -39,10 +39,10 @@ class Token(ContractBase):
             spender_address = Web3Provider.get_web3().toChecksumAddress(spender_address)
 
         from_account.unlock()
-        tx_hash = self.contract_concise.approve(
-            spender_address,
-            price,
-            transact={'from': from_account.address}
+        tx_hash = self.send_transaction(
+            'approve',
+            [spender_address, price],
+            account=from_account
         )
         return self.get_tx_receipt(tx_hash).status == 1
 
@@ -55,10 +55,10 @@ class Token(ContractBase):
         :param from_account: Sender account, Account
         :return: bool
         """
-        tx_hash = self.contract_concise.transfer(
-            receiver_address,
-            amount,
-            transact={'from': from_account.address}
+        tx_hash = self.send_transaction(
+            'transfer',
+            [receiver_address, amount],
+            account=from_account
         )
         return self.get_tx_receipt(tx_hash).status == 1
 
@@ -77,10 +77,10 @@ class Token(ContractBase):
         :param owner_account:
         :return:
         """
-        tx_hash = self.contract_concise.increaseAllowance(
-            spender_address,
-            added_value,
-            transact={'from': owner_account.address}
+        tx_hash = self.send_transaction(
+            'increaseAllowance',
+            [spender_address, added_value],
+            account=owner_account
         )
         return self.get_tx_receipt(tx_hash).status == 1
 
@@ -92,9 +92,9 @@ class Token(ContractBase):
         :param owner_account:
         :return:
         """
-        tx_hash = self.contract_concise.decreaseAllowance(
-            spender_address,
-            subtracted_value,
-            transact={'from': owner_account.address}
+        tx_hash = self.send_transaction(
+            'decreaseAllowance',
+            [spender_address, subtracted_value],
+            account=owner_account
         )
         return self.get_tx_receipt(tx_hash).status == 1
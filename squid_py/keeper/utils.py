@@ -2,6 +2,7 @@
 
 import logging
 
+from squid_py.keeper.receipt_tracker import ReceiptTracker
 from squid_py.keeper.web3_provider import Web3Provider
 
 logger = logging.getLogger(__name__)
@@ -33,9 +34,7 @@ def process_tx_receipt(tx_hash, event, event_name):
     :param event_name:
     :return:
     """
-    web3 = Web3Provider.get_web3()
-    web3.eth.waitForTransactionReceipt(tx_hash)
-    receipt = web3.eth.getTransactionReceipt(tx_hash)
+    receipt = ReceiptTracker.get_instance().track(tx_hash).result()
     event = event().processReceipt(receipt)
     if event:
         logger.info(f'Success: got {event_name} event after fulfilling condition.')
@@ -1,6 +1,8 @@
-from web3 import HTTPProvider, Web3
+from web3 import Web3, WebsocketProvider
 
 from squid_py.config_provider import ConfigProvider
+from squid_py.keeper.batching_http_provider import BatchingHTTPProvider
+from squid_py.keeper.http_provider import KeeperHTTPProvider
 
 
 class Web3Provider(object):
@@ -12,8 +14,8 @@ class Web3Provider(object):
         """Return the web3 instance to interact with the ethereum client."""
         if Web3Provider._web3 is None:
             config = ConfigProvider.get_config()
-            provider = config.web3_provider if config.web3_provider else HTTPProvider(
-                config.keeper_url)
+            provider = config.web3_provider if config.web3_provider else Web3Provider.get_provider(
+                config.keeper_url, config.keeper_batch_size, config.keeper_batch_latency)
             Web3Provider._web3 = Web3(provider)
             # Reset attributes to avoid lint issue about no attribute
             Web3Provider._web3.eth = getattr(Web3Provider._web3, 'eth')
@@ -27,3 +29,30 @@ class Web3Provider(object):
             Web3Provider._web3.testing = getattr(Web3Provider._web3, 'testing')
 
         return Web3Provider._web3
+
+    @staticmethod
+    def reset_web3():
+        """Drop the web3 instance, the next `get_web3` call creates it from the current config."""
+        Web3Provider._web3 = None
+
+    @staticmethod
+    def get_provider(keeper_url, batch_size=0, batch_latency=0.0):
+        """
+        Return the web3 provider for the keeper url, a `WebsocketProvider` for `ws://` and
+        `wss://` urls or a `KeeperHTTPProvider` otherwise.
+
+        :param keeper_url: Url of the keeper node, str
+        :param batch_size: max number of concurrent calls sent in one JSON-RPC batch request,
+            int. The calls are not batched if 0
+        :param batch_latency: float max time in seconds to wait for concurrent calls to join
+            a batch
+        :return: web3 provider
+        """
+        if keeper_url.startswith('ws://') or keeper_url.startswith('wss://'):
+            return WebsocketProvider(keeper_url)
+
+        if batch_size:
+            return BatchingHTTPProvider(keeper_url, max_batch_size=batch_size,
+                                        max_latency=batch_latency)
+
+        return KeeperHTTPProvider(keeper_url)
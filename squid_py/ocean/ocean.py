@@ -60,8 +60,9 @@ class Ocean:
         """
         # Configuration information for the market is stored in the Config class
         # config = Config(filename=config_file, options_dict=config_dict)
-        if config:
+        if config and config is not ConfigProvider._config:
             ConfigProvider.set_config(config)
+            Keeper.reset_instance()
 
         self._config = ConfigProvider.get_config()
         self._keeper = Keeper.get_instance()
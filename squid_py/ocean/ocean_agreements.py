@@ -120,7 +120,7 @@ class OceanAgreements:
         """
         assert consumer_address and Web3Provider.get_web3().isChecksumAddress(
             consumer_address), f'Invalid consumer address {consumer_address}'
-        assert publisher_account.address in self._keeper.accounts, \
+        assert self._keeper.has_account(publisher_account), \
             f'Unrecognized publisher address {publisher_account.address}'
         asset = self._asset_resolver.resolve(did)
         asset_id = asset.asset_id
@@ -198,6 +198,42 @@ class OceanAgreements:
             document_id, consumer_address
         )
 
+    def get_agreements_status(self, agreement_ids):
+        """
+        Get the agreements and the state of their conditions.
+
+        All the values are read from the same block, with one batch of JSON-RPC calls for the
+        agreements and one for their conditions.
+
+        :param agreement_ids: list of agreement ids, list of str
+        :return: dict mapping each agreement id to None if the agreement can not be read, or
+            to a dict with the `agreement` values and a `conditions` dict mapping each
+            condition id to its state
+        """
+        block_number = Web3Provider.get_web3().eth.blockNumber
+        agreements = self._keeper.agreement_manager.get_agreements(agreement_ids, block_number)
+        condition_ids = [condition_id for agreement in agreements if agreement
+                         for condition_id in agreement.condition_ids]
+        conditions = dict(zip(
+            condition_ids,
+            self._keeper.condition_manager.get_conditions(condition_ids, block_number)
+        ))
+
+        status = dict()
+        for agreement_id, agreement in zip(agreement_ids, agreements):
+            if not agreement:
+                status[agreement_id] = None
+                continue
+
+            condition_states = dict()
+            for condition_id in agreement.condition_ids:
+                condition = conditions[condition_id]
+                condition_states[condition_id] = condition.state if condition else None
+
+            status[agreement_id] = {'agreement': agreement, 'conditions': condition_states}
+
+        return status
+
     def _verify_service_agreement_signature(self, did, agreement_id, service_definition_id,
                                             consumer_address, signature, publisher_account,
                                             ddo=None):
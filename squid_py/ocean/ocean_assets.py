@@ -1,18 +1,24 @@
 """Ocean module."""
+import asyncio
 import copy
 import json
 import logging
 import os
+import uuid
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from squid_py.agreements.service_factory import ServiceDescriptor, ServiceFactory
 from squid_py.agreements.service_types import ACCESS_SERVICE_TEMPLATE_ID, ServiceTypes
+from squid_py.agreements.storage import get_published_assets, record_published_asset
 from squid_py.agreements.utils import (
     make_public_key_and_authentication,
 )
 from squid_py.aquarius.aquarius_provider import AquariusProvider
+from squid_py.aquarius.async_aquarius import AsyncAquarius
 from squid_py.aquarius.exceptions import AquariusGenericError
 from squid_py.brizo.brizo_provider import BrizoProvider
-from squid_py.ddo.ddo import DDO
+from squid_py.ddo.ddo import DDO, generate_private_key
 from squid_py.ddo.metadata import Metadata, MetadataBase
 from squid_py.ddo.public_key_rsa import PUBLIC_KEY_TYPE_RSA
 from squid_py.did import DID, did_to_id
@@ -25,6 +31,8 @@ from squid_py.secret_store.secret_store_provider import SecretStoreProvider
 
 logger = logging.getLogger('ocean')
 
+PublishResult = namedtuple('PublishResult', ('did', 'status', 'error'))
+
 
 class OceanAssets:
     """Ocean assets class."""
@@ -62,6 +70,151 @@ class OceanAssets:
             item is a dict of parameters and values required by the service
         :return: DDO instance
         """
+        self._keeper.unlock_account(publisher_account)
+        ddo, checksum, ddo_service_endpoint = self._build_ddo(
+            metadata, publisher_account, service_descriptors)
+
+        response = None
+        try:
+            # publish the new ddo in ocean-db/Aquarius
+            response = self._get_aquarius().publish_asset_ddo(ddo)
+            logger.debug('Asset/ddo published successfully in aquarius.')
+        except ValueError as ve:
+            raise ValueError(f'Invalid value to publish in the metadata: {str(ve)}')
+        except Exception as e:
+            logger.error(f'Publish asset in aquarius failed: {str(e)}')
+
+        if not response:
+            return None
+
+        # register on-chain
+        self._keeper.did_registry.register(
+            ddo.did,
+            checksum=Web3Provider.get_web3().sha3(text=checksum),
+            url=ddo_service_endpoint,
+            account=publisher_account
+        )
+        logger.info(f'DDO with DID {ddo.did} successfully registered on chain.')
+        return ddo
+
+    def create_many(self, metadata_iter, publisher_account, service_descriptors=None,
+                    batch_id=None, max_workers=8, key_workers=None):
+        """
+        Register many assets in both the keeper's DIDRegistry (on-chain) and in the Metadata
+        store (Aquarius).
+
+        The assets are published in a pipeline: the signature keys are generated in a process
+        pool while the previous assets are encrypted and published in aquarius by a thread pool,
+        and their registration transactions are sent without waiting for the previous ones to be
+        mined.
+
+        The progress of each asset is recorded in the local database under `batch_id`, keyed by
+        its index in `metadata_iter`. Calling `create_many` again with the same `batch_id` and the
+        metadata in the same order resumes the batch: the assets already registered are skipped,
+        and the assets already published in aquarius are only registered on-chain.
+
+        :param metadata_iter: iterable of dict conforming to the Metadata accepted by Ocean
+            Protocol
+        :param publisher_account: Account of the publisher registering the assets
+        :param service_descriptors: list of ServiceDescriptor tuples of the assets, see `create`
+        :param batch_id: id of the batch to resume, str. A new batch is started if None.
+        :param max_workers: number of assets encrypted and published in aquarius concurrently
+        :param key_workers: number of processes generating the keys, the number of cpus if None
+        :return: list of PublishResult in the order of `metadata_iter`, with the DID of the asset,
+            its status 'registered', 'skipped' if it was registered by a previous call or
+            'failed', and the error message
+        """
+        batch_id = batch_id or uuid.uuid4().hex
+        storage_path = self._config.storage_path
+        journal = get_published_assets(storage_path, batch_id)
+        logger.info(f'Publishing the assets of batch {batch_id}.')
+        self._keeper.unlock_account(publisher_account)
+
+        results = []
+        pending = deque()
+        registrations = []
+
+        def _collect_registrations(wait):
+            for registration in list(registrations):
+                index, item_key, did, checksum, url, receipt_future = registration
+                if not wait and not receipt_future.done():
+                    continue
+
+                registrations.remove(registration)
+                try:
+                    registered = receipt_future.result().status == 1
+                    error = None if registered else 'The registration transaction failed.'
+                except Exception as e:
+                    registered, error = False, str(e)
+
+                if registered:
+                    record_published_asset(
+                        storage_path, batch_id, item_key, did, checksum, url, 'registered')
+                    results[index] = PublishResult(did, 'registered', None)
+                else:
+                    logger.error(f'Registering DID {did} on-chain failed: {error}')
+                    results[index] = PublishResult(did, 'failed', error)
+
+        def _collect_next():
+            index, item_key, future = pending.popleft()
+            try:
+                registrations.append((index, item_key) + future.result())
+            except Exception as e:
+                logger.error(f'Publishing asset {index} of batch {batch_id} failed: {str(e)}')
+                results[index] = PublishResult(None, 'failed', str(e))
+            _collect_registrations(wait=False)
+
+        with ProcessPoolExecutor(max_workers=key_workers) as key_executor, \
+                ThreadPoolExecutor(max_workers=max_workers) as executor:
+            try:
+                for index, metadata in enumerate(metadata_iter):
+                    item_key = str(index)
+                    record = journal.get(item_key)
+                    if record and record[3] == 'registered':
+                        results.append(PublishResult(record[0], 'skipped', None))
+                        continue
+
+                    results.append(None)
+                    key_future = key_executor.submit(generate_private_key) if not record else None
+                    pending.append((index, item_key, executor.submit(
+                        self._publish_item, metadata, publisher_account, service_descriptors,
+                        key_future, record, batch_id, item_key
+                    )))
+                    # bound the number of assets in memory
+                    while len(pending) >= 2 * max_workers:
+                        _collect_next()
+            finally:
+                # record the assets already submitted even if `metadata_iter` raised
+                while pending:
+                    _collect_next()
+                _collect_registrations(wait=True)
+
+        logger.info(f'Published {sum(r.status == "registered" for r in results)} assets of '
+                    f'batch {batch_id}, {sum(r.status == "failed" for r in results)} failed.')
+        return results
+
+    def _publish_item(self, metadata, publisher_account, service_descriptors, key_future,
+                      record, batch_id, item_key):
+        if record:
+            did, checksum, ddo_service_endpoint, _ = record
+        else:
+            ddo, checksum, ddo_service_endpoint = self._build_ddo(
+                metadata, publisher_account, service_descriptors, key_future.result())
+            did = ddo.did
+            self._get_aquarius().publish_asset_ddo(ddo)
+            record_published_asset(self._config.storage_path, batch_id, item_key, did,
+                                   checksum, ddo_service_endpoint, 'published')
+
+        receipt_future = self._keeper.did_registry.submit_register(
+            did,
+            checksum=Web3Provider.get_web3().sha3(text=checksum),
+            url=ddo_service_endpoint,
+            account=publisher_account
+        )
+        return did, checksum, ddo_service_endpoint, receipt_future
+
+    def _build_ddo(self, metadata, publisher_account, service_descriptors=None,
+                   private_key_pem=None):
         assert isinstance(metadata, dict), f'Expected metadata of type dict, got {type(metadata)}'
         if not metadata or not Metadata.validate(metadata):
             raise OceanInvalidMetadata('Metadata seems invalid. Please make sure'
@@ -74,20 +227,21 @@ class OceanAssets:
         did = DID.did()
         logger.debug(f'Generating new did: {did}')
         # Check if it's already registered first!
-        if did in self._get_aquarius().list_assets():
+        if self._get_aquarius().asset_exists(did):
             raise OceanDIDAlreadyExist(
                 f'Asset id {did} is already registered to another asset.')
 
         ddo = DDO(did)
 
         # Add public key and authentication
-        self._keeper.unlock_account(publisher_account)
-        pub_key, auth = make_public_key_and_authentication(did, publisher_account.address,
-                                                           Web3Provider.get_web3())
+        pub_key, auth = make_public_key_and_authentication(
+            did, publisher_account.address, Web3Provider.get_web3(), self._config.storage_path,
+            publisher_account.private_key if publisher_account.is_local else None
+        )
         ddo.add_public_key(pub_key)
         ddo.add_authentication(auth, PUBLIC_KEY_TYPE_RSA)
 
-        priv_key = ddo.add_signature()
+        priv_key = ddo.add_signature(private_key_pem=private_key_pem)
         ddo.add_proof(1, priv_key)
 
         # Setup metadata service
@@ -129,6 +283,7 @@ class OceanAssets:
                 ACCESS_SERVICE_TEMPLATE_ID
             )]
         else:
+            service_descriptors = list(service_descriptors)
             service_types = set(map(lambda x: x[0], service_descriptors))
             if ServiceTypes.AUTHORIZATION not in service_types:
                 service_descriptors += [ServiceDescriptor.authorization_service_descriptor(
@@ -152,29 +307,7 @@ class OceanAssets:
             f'Generated ddo and services, DID is {ddo.did},'
             f' metadata service @{ddo_service_endpoint}, '
             f'`Access` service purchase @{ddo.services[0].endpoints.service}.')
-        response = None
-        try:
-            # publish the new ddo in ocean-db/Aquarius
-            response = self._get_aquarius().publish_asset_ddo(ddo)
-            logger.debug('Asset/ddo published successfully in aquarius.')
-        except ValueError as ve:
-            raise ValueError(f'Invalid value to publish in the metadata: {str(ve)}')
-        except Exception as e:
-            logger.error(f'Publish asset in aquarius failed: {str(e)}')
-
-        if not response:
-            return None
-
-        # register on-chain
-        self._keeper.unlock_account(publisher_account)
-        self._keeper.did_registry.register(
-            did,
-            checksum=Web3Provider.get_web3().sha3(text=metadata_copy['base']['checksum']),
-            url=ddo_service_endpoint,
-            account=publisher_account
-        )
-        logger.info(f'DDO with DID {did} successfully registered on chain.')
-        return ddo
+        return ddo, metadata_copy['base']['checksum'], ddo_service_endpoint
 
     def retire(self, did):
         """
@@ -187,6 +320,7 @@ class OceanAssets:
             ddo = self.resolve(did)
             metadata_service = ddo.find_service_by_type(ServiceTypes.METADATA)
             self._get_aquarius(metadata_service.endpoints.service).retire_asset_ddo(did)
+            self._did_resolver.invalidate(did)
             return True
         except AquariusGenericError as err:
             logger.error(err)
@@ -201,6 +335,15 @@ class OceanAssets:
         """
         return self._did_resolver.resolve(did)
 
+    def resolve_many(self, dids):
+        """
+        Retrieve the ddos associated to many dids, reading the keeper and Aquarius in bulk.
+
+        :param dids: list of DID, str
+        :return: list of DDO instances in the order of `dids`, None for the dids not found
+        """
+        return self._did_resolver.resolve_many(dids)
+
     def search(self, text, sort=None, offset=100, page=0, aquarius_url=None):
         """
         Search an asset in oceanDB using aquarius.
@@ -236,6 +379,71 @@ class OceanAssets:
         aquarius = self._get_aquarius(aquarius_url)
         return [DDO(dictionary=ddo_dict) for ddo_dict in aquarius.query_search(query)]
 
+    def federated_search(self, aquarius_urls, text=None, query=None, sort=None, offset=100,
+                         page=0, timeout=10):
+        """
+        Search assets in several aquarius instances concurrently.
+
+        See `federated_search_async`.
+
+        :return: List of assets that match with the search, without duplicates.
+        """
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(self.federated_search_async(
+                aquarius_urls, text, query, sort, offset, page, timeout))
+        finally:
+            loop.close()
+
+    async def federated_search_async(self, aquarius_urls, text=None, query=None, sort=None,
+                                     offset=100, page=0, timeout=10):
+        """
+        Search assets in several aquarius instances concurrently, with a text or a query.
+
+        The results are merged in the order of `aquarius_urls`, an asset found in several
+        instances is returned once. The instances failing or not answering within `timeout` are
+        left out of the results.
+
+        :param aquarius_urls: list of the urls of the aquarius instances to search in
+        :param text: String with the value that you are searching, see `search`
+        :param query: dict with query parameters, see `query`
+        :param sort: Dictionary to choose order base in some value, used with `text`
+        :param offset: Number of elements shows by page, used with `text`
+        :param page: Page number, used with `text`
+        :param timeout: float time in seconds to wait for each aquarius instance
+        :return: List of assets that match with the search, without duplicates.
+        """
+        if (text is None) == (query is None):
+            raise ValueError('Expected either a text or a query to search with.')
+
+        async def _search(aquarius_url):
+            aquarius = AsyncAquarius(aquarius_url)
+            if text is not None:
+                search = aquarius.text_search(text, sort, offset, page)
+            else:
+                search = aquarius.query_search(query)
+
+            try:
+                return await asyncio.wait_for(search, timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f'Search in aquarius {aquarius_url} timed out after {timeout}s.')
+            except Exception as e:
+                logger.warning(f'Search in aquarius {aquarius_url} failed: {str(e)}')
+            return []
+
+        logger.info(f'Searching asset in {len(aquarius_urls)} aquarius instances: '
+                    f'{text if text is not None else query}')
+        results = await asyncio.gather(*[_search(url) for url in aquarius_urls])
+
+        ddos = []
+        dids = set()
+        for ddo_dict in (ddo_dict for ddo_list in results for ddo_dict in ddo_list):
+            if ddo_dict.get('id') in dids:
+                continue
+            dids.add(ddo_dict.get('id'))
+            ddos.append(DDO(dictionary=ddo_dict))
+        return ddos
+
     def order(self, did, service_definition_id, consumer_account):
         """
         Sign service agreement.
@@ -253,7 +461,7 @@ class OceanAssets:
         :return: tuple(agreement_id, signature) the service agreement id (can be used to query
             the keeper-contracts for the status of the service agreement) and signed agreement hash
         """
-        assert consumer_account.address in self._keeper.accounts, f'Unrecognized consumer ' \
+        assert self._keeper.has_account(consumer_account), f'Unrecognized consumer ' \
             f'address `consumer_account`'
 
         agreement_id, signature = self._agreements.prepare(
@@ -0,0 +1,78 @@
+"""Bounded in-memory cache."""
+import time
+from collections import OrderedDict
+from threading import Lock
+
+
+class LRUCache:
+    """
+    Thread safe cache keeping the `max_size` most recently used items.
+
+    Items older than `ttl` seconds are evicted when they are read.
+    """
+
+    def __init__(self, max_size=1000, ttl=None):
+        """
+
+        :param max_size: max number of items in the cache, int
+        :param ttl: float time to live of the items in seconds, no expiration if 0 or None
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key, default=None):
+        """
+        Return the value cached for `key`.
+
+        :param key: hashable key
+        :param default: value to return if the key is not cached or expired
+        :return: the cached value or `default`
+        """
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return default
+
+            value, expires_at = item
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._items[key]
+                return default
+
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value):
+        """
+        Cache the `value` of `key`, evicting the least recently used item if the cache is full.
+
+        :param key: hashable key
+        :param value: value to cache
+        """
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._items[key] = (value, expires_at)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def pop(self, key, default=None):
+        """
+        Remove `key` from the cache.
+
+        :param key: hashable key
+        :param default: value to return if the key is not cached
+        :return: the cached value or `default`
+        """
+        with self._lock:
+            item = self._items.pop(key, None)
+            return item[0] if item else default
+
+    def clear(self):
+        """Remove all the items."""
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
@@ -3,13 +3,18 @@ import uuid
 from collections import namedtuple
 
 from eth_keys import KeyAPI
-from eth_utils import big_endian_to_int
+from eth_utils import big_endian_to_int, to_bytes
+from hexbytes import HexBytes
 
+from squid_py.agreements.storage import get_public_key, record_public_key
 from squid_py.keeper.utils import generate_multi_value_hash
 from squid_py.keeper.web3_provider import Web3Provider
+from squid_py.utils.cache import LRUCache
 
 Signature = namedtuple('Signature', ('v', 'r', 's'))
 
+_public_keys = LRUCache(max_size=1000)
+
 
 def generate_new_id():
     """
@@ -41,13 +46,42 @@ def prepare_prefixed_hash(msg_hash):
     )
 
 
-def get_public_key_from_address(web3, address):
+def get_public_key_from_address(web3, address, storage_path=None, private_key=None):
     """
+    Return the public key of an address, recovered from a signature of the address, or derived
+    from its private key when it is given.
+
+    The public keys are cached in memory and, when `storage_path` is given, in the sqlite
+    database of the agreements, so the keeper is asked for the signature once per address.
 
     :param web3:
     :param address:
+    :param storage_path: path of the sqlite database to persist the public keys in, str
+    :param private_key: private key of the address for the accounts signing locally, hex str
+        or bytes
     :return:
     """
+    pub_key = _public_keys.get(address.lower())
+    if pub_key is None and storage_path:
+        pub_key_hex = get_public_key(storage_path, address)
+        if pub_key_hex:
+            pub_key = KeyAPI.PublicKey(to_bytes(hexstr=pub_key_hex))
+
+    if pub_key is None and private_key:
+        pub_key = KeyAPI.PrivateKey(HexBytes(private_key)).public_key
+        if storage_path:
+            record_public_key(storage_path, address, pub_key.to_hex())
+
+    if pub_key is None:
+        pub_key = _recover_public_key(web3, address)
+        if storage_path:
+            record_public_key(storage_path, address, pub_key.to_hex())
+
+    _public_keys.set(address.lower(), pub_key)
+    return pub_key
+
+
+def _recover_public_key(web3, address):
     _hash = Web3Provider.get_web3().sha3(text='verify signature.')
     signature = split_signature(web3, web3.eth.sign(address, _hash))
     signature_vrs = Signature(signature.v % 27,
@@ -1,5 +1,16 @@
 """Test the Account object."""
+import json
+from unittest.mock import Mock
+
+from eth_account import Account as EthAccount
+from eth_account.messages import defunct_hash_message
+from web3 import Web3
+
 from squid_py.accounts.account import Account
+from squid_py.keeper import Keeper
+from squid_py.keeper.contract_base import ContractBase
+from squid_py.keeper.gas_strategy import GasStrategy, GasStrategyProvider
+from tests.resources.tiers import unit_test
 
 
 def test_create_account():
@@ -7,3 +18,55 @@ def test_create_account():
     assert isinstance(account, Account)
     assert account.address == '0x213123123'
     assert account.password == 'pass'
+
+
+@unit_test
+def test_local_account_signs_hash(tmp_path):
+    eth_account = EthAccount.create('entropy')
+    key_file = tmp_path.joinpath('key.json')
+    key_file.write_text(json.dumps(EthAccount.encrypt(eth_account.privateKey, 'pass')))
+    account = Account(eth_account.address, 'pass', key_file=str(key_file))
+    assert account.is_local
+    assert account.unlock()
+    assert Keeper.unlock_account(account)
+    assert Keeper().has_account(account)
+
+    msg_hash = Web3.sha3(text='agreement')
+    signature = Keeper.sign_hash(msg_hash, account)
+    assert EthAccount.recoverHash(
+        defunct_hash_message(primitive=msg_hash), signature=signature) == eth_account.address
+    assert not Account(eth_account.address).is_local
+
+
+@unit_test
+def test_local_account_sends_raw_transaction(set_web3):
+    eth_account = EthAccount.create('entropy')
+    account = Account(eth_account.address, private_key=eth_account.privateKey)
+    contract = ContractBase('OceanToken', {'ContractHandler': Mock()})
+    build_transaction = contract.contract.functions.transfer.return_value.buildTransaction
+    build_transaction.return_value = {
+        'to': eth_account.address, 'data': '0x', 'value': 0, 'gas': 21000, 'gasPrice': 1,
+        'nonce': 3, 'chainId': None, 'from': eth_account.address}
+    web3 = set_web3(Mock(providers=[]))
+    web3.eth.sendRawTransaction.return_value = b'\x01' * 32
+    GasStrategyProvider.set_strategy(GasStrategy())
+    try:
+        contract.send_transaction('transfer', [eth_account.address, 1], {'nonce': 3},
+                                  account=account)
+        raw_transaction = web3.eth.sendRawTransaction.call_args[0][0]
+        assert EthAccount.recoverTransaction(raw_transaction) == eth_account.address
+        assert not contract.contract_concise.transfer.called
+    finally:
+        GasStrategyProvider.set_strategy(None)
+
+
+@unit_test
+def test_keeper_accounts_read_from_the_node(set_web3):
+    web3 = set_web3(Mock())
+    keeper = Keeper()
+    web3.eth.accounts = ['0x00Bd138aBD70e2F00903268F3Db08f2D25677C9e']
+    assert not keeper.has_account(Account('0x068Ed00cF0441e4829D9784fCBe7b9e26D4BD8d0'))
+
+    # an account added to the node later
+    web3.eth.accounts = web3.eth.accounts + ['0x068Ed00cF0441e4829D9784fCBe7b9e26D4BD8d0']
+    assert keeper.has_account(Account('0x068Ed00cF0441e4829D9784fCBe7b9e26D4BD8d0'))
@@ -1,9 +1,12 @@
+from unittest.mock import Mock
+
 from squid_py import ConfigProvider
+from squid_py.agreements.register_service_agreement import _is_agreement_pending
 from squid_py.agreements.service_agreement import ServiceAgreement
 from squid_py.keeper import Keeper
 from squid_py.keeper.web3_provider import Web3Provider
 from tests.resources.helper_functions import get_ddo_sample, log_event, get_consumer_account, get_publisher_account
-from tests.resources.tiers import e2e_test
+from tests.resources.tiers import e2e_test, unit_test
 
 
 def setup_things():
@@ -210,3 +213,15 @@ def test_agreement_hash(publisher_ocean_instance):
     expected = '0x96732b390dacec0f19ad304ac176b3407968a0184d01b3262687fd23a3f0995e'
     print('expected hash: ', expected)
     assert agreement_hash.hex() == expected, 'hash does not match.'
+
+
+@unit_test
+def test_agreement_pending_while_a_condition_is_unfulfilled():
+    keeper = Mock()
+    keeper.condition_manager.get_conditions.return_value = [Mock(state=2), Mock(state=1)]
+    assert _is_agreement_pending(keeper, ('0x01', '0x02'))
+    keeper.condition_manager.get_conditions.return_value = [Mock(state=2), Mock(state=3)]
+    assert not _is_agreement_pending(keeper, ('0x01', '0x02'))
+    # a condition that can not be read
+    keeper.condition_manager.get_conditions.return_value = [Mock(state=2), None]
+    assert _is_agreement_pending(keeper, ('0x01', '0x02'))
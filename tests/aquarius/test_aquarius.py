@@ -1,13 +1,16 @@
 import json
+from unittest.mock import Mock
 
 import pytest
 
 from squid_py import ConfigProvider
 from squid_py.aquarius.aquarius import Aquarius
+from squid_py.aquarius.exceptions import AquariusGenericError
+from squid_py.aquarius.search_cache import SearchCache
 from squid_py.ddo.ddo import DDO
 from squid_py.did import DID
 from tests.resources.helper_functions import get_resource_path
-from tests.resources.tiers import e2e_test, should_run_test
+from tests.resources.tiers import e2e_test, should_run_test, unit_test
 
 if should_run_test('e2e'):
     aquarius = Aquarius(ConfigProvider.get_config().aquarius_url)
@@ -191,3 +194,75 @@ def test_validate_metadata():
 @e2e_test
 def test_validate_invalid_metadata():
     assert not aquarius.validate_metadata({})
+
+
+@unit_test
+def test_iter_assets_ddo_pages(config):
+    ddo_dict = json.loads(_get_asset('ddo_sample1.json').as_text())
+    ddo_dicts = [dict(ddo_dict, id=DID.did()) for _ in range(5)]
+    requested_pages = []
+
+    def post(url, data, headers):
+        query = json.loads(data)
+        requested_pages.append(query['page'])
+        start = query['page'] * query['offset']
+        response = Mock(status_code=200)
+        response.content = json.dumps(ddo_dicts[start:start + query['offset']]).encode()
+        return response
+
+    metadata_store = Aquarius('http://localhost:5000')
+    metadata_store._session = Mock(post=Mock(side_effect=post))
+
+    assets = metadata_store.iter_assets_ddo(page_size=2)
+    assert next(assets).did == ddo_dicts[0]['id']
+    assert requested_pages == [0]
+    assert [asset.did for asset in assets] == [d['id'] for d in ddo_dicts[1:]]
+    assert requested_pages == [0, 1, 2]
+    assert list(metadata_store.iter_assets(page_size=5)) == [d['id'] for d in ddo_dicts]
+
+
+@unit_test
+def test_asset_exists(config):
+    metadata_store = Aquarius('http://localhost:5000')
+    metadata_store._session = Mock(head=Mock(return_value=Mock(status_code=200)))
+    assert metadata_store.asset_exists('did:op:test') is True
+    metadata_store._session.head.assert_called_once_with(f'{metadata_store.url}/did:op:test')
+
+    metadata_store._session.head.return_value = Mock(status_code=404)
+    assert metadata_store.asset_exists('did:op:test') is False
+
+    metadata_store._session.head.return_value = Mock(status_code=500, text='error')
+    with pytest.raises(AquariusGenericError):
+        metadata_store.asset_exists('did:op:test')
+
+
+@unit_test
+def test_search_cache(config):
+    responses = []
+
+    def get(url, params, headers):
+        etag = '"v1"'
+        if headers.get('If-None-Match') == etag:
+            response = Mock(status_code=304, content=b'')
+        else:
+            response = Mock(status_code=200, content=json.dumps([{'id': params['text']}]).encode())
+        response.headers = {'ETag': etag}
+        responses.append(response.status_code)
+        return response
+
+    metadata_store = Aquarius('http://localhost:5000')
+    metadata_store._session = Mock(get=Mock(side_effect=get))
+    metadata_store.set_search_cache(SearchCache(max_size=10, ttl=60))
+
+    assert metadata_store.text_search('Office') == [{'id': 'Office'}]
+    assert metadata_store.text_search('Office') == [{'id': 'Office'}]
+    assert responses == [200]
+    assert metadata_store.text_search('Office', page=1) == [{'id': 'Office'}]
+    assert responses == [200, 200]
+
+    metadata_store.search_cache.ttl = 0
+    assert metadata_store.text_search('Weather') == [{'id': 'Weather'}]
+    assert metadata_store.text_search('Weather') == [{'id': 'Weather'}]
+    assert responses == [200, 200, 200, 304]
+    assert metadata_store.search_cache.get_stats() == {
+        'hits': 1, 'revalidations': 1, 'misses': 3, 'size': 3}
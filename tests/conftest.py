@@ -1,7 +1,9 @@
 import pytest
 from web3 import HTTPProvider, Web3
 
+from squid_py.config import Config
 from squid_py.config_provider import ConfigProvider
+from squid_py.keeper.web3_provider import Web3Provider
 from examples import ExampleConfig
 from tests.resources.helper_functions import (
     get_consumer_ocean_instance,
@@ -16,6 +18,29 @@ if should_run_test('e2e'):
     ConfigProvider.set_config(ExampleConfig.get_config())
 
 
+@pytest.fixture
+def config():
+    """Set a `Config` with the default options during the test, the original is restored after."""
+    original = ConfigProvider._config
+    config = Config()
+    ConfigProvider.set_config(config)
+    yield config
+    ConfigProvider.set_config(original)
+
+
+@pytest.fixture
+def set_web3():
+    """Set the web3 instance of the `Web3Provider` during the test, it is restored after."""
+    original = Web3Provider._web3
+
+    def _set_web3(web3):
+        Web3Provider._web3 = web3
+        return web3
+
+    yield _set_web3
+    Web3Provider._web3 = original
+
+
 @pytest.fixture
 def secret_store():
     return SecretStoreMock
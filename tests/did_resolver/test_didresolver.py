@@ -1,11 +1,14 @@
 import logging
 import secrets
+from unittest.mock import Mock
 
 import pytest
 from web3 import Web3
 
+from squid_py.aquarius.aquarius import Aquarius
+from squid_py.aquarius.aquarius_provider import AquariusProvider
 from squid_py.ddo.ddo import DDO
-from squid_py.did import DID, did_to_id
+from squid_py.did import DID, did_to_id, did_to_id_bytes
 from squid_py.did_resolver.did_resolver import (
     DIDResolver,
 )
@@ -13,8 +16,9 @@ from squid_py.exceptions import (
     OceanDIDNotFound,
 )
 from squid_py.keeper import Keeper
+from squid_py.utils.cache import LRUCache
 from tests.resources.helper_functions import get_resource_path
-from tests.resources.tiers import e2e_test
+from tests.resources.tiers import e2e_test, unit_test
 
 logger = logging.getLogger()
 
@@ -111,3 +115,61 @@ def test_get_did_not_valid(publisher_ocean_instance):
     did_resolver = DIDResolver(keeper().did_registry)
     with pytest.raises(TypeError):
         did_resolver.get_resolve_url('not valid')
+
+
+@unit_test
+def test_resolve_is_cached_until_did_is_updated():
+    did = DID.did()
+    did_registry = Mock()
+    did_registry.address = '0x86DF95937ec3761588e6DEbAB6E3508e271cC4dc'
+    did_registry.get_block_number_updated.return_value = 10
+    did_registry.get_registered_attribute.return_value = {'value': 'http://localhost:5000'}
+    aquarius = Mock()
+    aquarius.get_asset_ddo.return_value = DDO(did)
+    AquariusProvider.set_aquarius_class(lambda url: aquarius)
+    try:
+        resolver = DIDResolver(did_registry, LRUCache())
+        ddo = resolver.resolve(did)
+        assert resolver.resolve(did) is ddo
+        assert aquarius.get_asset_ddo.call_count == 1
+        assert did_registry.get_registered_attribute.call_count == 1
+
+        did_registry.get_block_number_updated.return_value = 12
+        resolver.resolve(did)
+        assert aquarius.get_asset_ddo.call_count == 2
+        did_registry.get_registered_attribute.assert_called_with(did_to_id_bytes(did), 12)
+
+        resolver.invalidate(did)
+        resolver.resolve(did)
+        assert aquarius.get_asset_ddo.call_count == 3
+    finally:
+        AquariusProvider.set_aquarius_class(Aquarius)
+
+
+@unit_test
+def test_resolve_many():
+    dids = [DID.did() for _ in range(4)]
+    did_registry = Mock()
+    did_registry.address = '0x86DF95937ec3761588e6DEbAB6E3508e271cC4dc'
+    did_registry.get_block_number_updated.return_value = 10
+    did_registry.get_registered_attribute.return_value = {'value': 'http://aquarius0:5000'}
+    did_registry.get_block_numbers_updated.return_value = [10, 11, 0, 12]
+    did_registry.get_registered_attributes.side_effect = lambda dids_bytes, _: {
+        did_bytes: {'value': f'http://aquarius{i % 2}:5000'}
+        for i, did_bytes in enumerate(dids_bytes)
+    }
+    aquarius = Mock()
+    aquarius.get_asset_ddo.side_effect = lambda did: DDO(did)
+    AquariusProvider.set_aquarius_class(lambda url: aquarius)
+    try:
+        resolver = DIDResolver(did_registry, LRUCache())
+        resolver.resolve(dids[0])
+        assert aquarius.get_asset_ddo.call_count == 1
+
+        ddos = resolver.resolve_many(dids)
+        assert [ddo.did if ddo else None for ddo in ddos] == [dids[0], dids[1], None, dids[3]]
+        assert aquarius.get_asset_ddo.call_count == 3
+        assert did_registry.get_registered_attributes.call_count == 1
+        assert did_registry.get_registered_attributes.call_args[0][1] == [11, 12]
+    finally:
+        AquariusProvider.set_aquarius_class(Aquarius)
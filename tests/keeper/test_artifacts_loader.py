@@ -0,0 +1,42 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from squid_py.keeper.artifacts_loader import ArtifactsLoader
+from tests.resources.tiers import unit_test
+
+
+def _write_artifact(path, file_name, address):
+    artifact = {'address': address, 'abi': [{'name': 'f'}], 'bytecode': '0x00', 'ast': {}}
+    path.joinpath(file_name).write_text(json.dumps(artifact))
+
+
+@unit_test
+def test_artifacts_loader_keeps_address_and_abi(tmp_path):
+    _write_artifact(tmp_path, 'DIDRegistry.Nile.json', '0x1')
+    _write_artifact(tmp_path, 'Dispenser.development.json', '0x2')
+    loader = ArtifactsLoader(tmp_path, 'nile')
+
+    with patch('os.listdir', wraps=os.listdir) as listdir:
+        assert loader.get_contract_definition('DIDRegistry') == {
+            'address': '0x1', 'abi': [{'name': 'f'}]}
+        assert loader.get_contract_definition('Dispenser')['address'] == '0x2'
+        with pytest.raises(FileNotFoundError):
+            loader.get_contract_definition('Token')
+        assert listdir.call_count == 1
+
+
+@unit_test
+def test_artifacts_loader_bundle(tmp_path):
+    _write_artifact(tmp_path, 'DIDRegistry.nile.json', '0x1')
+    _write_artifact(tmp_path, 'Dispenser.nile.json', '0x2')
+    _write_artifact(tmp_path, 'Dispenser.kovan.json', '0x3')
+    bundle_path = ArtifactsLoader(tmp_path, 'nile').write_bundle()
+
+    assert set(json.loads(open(bundle_path).read())) == {'DIDRegistry', 'Dispenser'}
+    tmp_path.joinpath('DIDRegistry.nile.json').unlink()
+    loader = ArtifactsLoader(tmp_path, 'nile')
+    assert loader.get_contract_definition('DIDRegistry') == {
+        'address': '0x1', 'abi': [{'name': 'f'}]}
@@ -0,0 +1,124 @@
+"""Test batch_call."""
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from eth_abi import encode_abi
+from web3 import HTTPProvider, Web3
+
+from squid_py.http_session_provider import HttpSessionProvider
+from squid_py.keeper.agreements.agreement_manager import AgreementStoreManager
+from squid_py.keeper.batch_call import batch_call
+from squid_py.keeper.conditions.condition_manager import ConditionStoreManager, ConditionValues
+from tests.resources.tiers import unit_test
+
+CONTRACT_ADDRESS = '0x86DF95937ec3761588e6DEbAB6E3508e271cC4dc'
+CONDITION_STATE_ABI = [{
+    'constant': True,
+    'name': 'getConditionState',
+    'type': 'function',
+    'stateMutability': 'view',
+    'payable': False,
+    'inputs': [{'name': '_id', 'type': 'bytes32'}],
+    'outputs': [{'name': '', 'type': 'uint8'}],
+}]
+
+
+@pytest.fixture
+def web3(set_web3):
+    return set_web3(Web3(HTTPProvider('http://localhost:8545')))
+
+
+@pytest.fixture
+def session():
+    original = HttpSessionProvider._session
+    session = Mock()
+    HttpSessionProvider.set_session(session)
+    yield session
+    HttpSessionProvider.set_session(original)
+
+
+def _reply(states):
+    def _post(endpoint_uri, data, **kwargs):
+        responses = []
+        for request in reversed(json.loads(data)):
+            state = states[int(request['params'][0]['data'][-2:], 16)]
+            responses.append({'jsonrpc': '2.0', 'id': request['id'],
+                              'result': Web3.toHex(encode_abi(['uint8'], [state]))})
+        return Mock(json=Mock(return_value=responses))
+
+    return _post
+
+
+@unit_test
+def test_batch_call(web3, session):
+    contract = web3.eth.contract(address=CONTRACT_ADDRESS, abi=CONDITION_STATE_ABI)
+    states = {1: 1, 2: 2, 3: 0}
+    calls = [(contract, 'getConditionState', [bytes([i]).rjust(32, b'\x00')]) for i in states]
+    session.post.side_effect = _reply(states)
+    assert batch_call(calls, batch_size=2) == [1, 2, 0]
+
+    assert session.post.call_count == 2
+    requests = json.loads(session.post.call_args_list[0][1]['data'])
+    assert len(requests) == 2
+    assert requests[0]['method'] == 'eth_call'
+    assert requests[0]['params'][0]['to'] == CONTRACT_ADDRESS
+    assert requests[0]['params'][1] == 'latest'
+
+
+@unit_test
+def test_batch_call_error(web3, session):
+    contract = web3.eth.contract(address=CONTRACT_ADDRESS, abi=CONDITION_STATE_ABI)
+    calls = [(contract, 'getConditionState', [bytes([i]).rjust(32, b'\x00')]) for i in (1, 2)]
+
+    def _post(endpoint_uri, data, **kwargs):
+        requests = json.loads(data)
+        return Mock(json=Mock(return_value=[
+            {'jsonrpc': '2.0', 'id': requests[0]['id'],
+             'result': Web3.toHex(encode_abi(['uint8'], [1]))},
+            {'jsonrpc': '2.0', 'id': requests[1]['id'],
+             'error': {'code': -32000, 'message': 'reverted'}},
+        ]))
+
+    session.post.side_effect = _post
+    assert batch_call(calls, block_identifier=5) == [1, None]
+
+    # the whole batch is rejected
+    session.post.side_effect = lambda *args, **kwargs: Mock(json=Mock(return_value={
+        'jsonrpc': '2.0', 'id': None, 'error': {'code': -32600, 'message': 'invalid request'}}))
+    with pytest.raises(ValueError):
+        batch_call(calls)
+
+
+@unit_test
+def test_get_agreements():
+    manager = AgreementStoreManager('AgreementStoreManager', {'ContractHandler': Mock()})
+    agreement = (b'\x01' * 32, '0xowner', '0xtemplate', [b'\x02' * 32, b'\x03' * 32],
+                 '0xupdater', 7)
+    with patch('squid_py.keeper.batch_call.batch_call') as _batch_call:
+        _batch_call.return_value = [agreement, None]
+        agreements = manager.get_agreements(['0x01', '0x04'], 7)
+
+    calls, block_identifier = _batch_call.call_args[0]
+    assert [call[1:] for call in calls] == [('getAgreement', ['0x01']), ('getAgreement', ['0x04'])]
+    assert block_identifier == 7
+    assert agreements[0].did == '0x' + '01' * 32
+    assert agreements[0].condition_ids == ['0x' + '02' * 32, '0x' + '03' * 32]
+    assert agreements[0].block_number_updated == 7
+    # the call that failed
+    assert agreements[1] is None
+
+
+@unit_test
+def test_get_conditions():
+    manager = ConditionStoreManager('ConditionStoreManager', {'ContractHandler': Mock()})
+    condition = ('0xtype', 2, 0, 0, 5, '0xupdater', 6)
+    with patch('squid_py.keeper.batch_call.batch_call') as _batch_call:
+        _batch_call.return_value = [None, condition]
+        conditions = manager.get_conditions(['0x01', '0x02'])
+
+    calls, block_identifier = _batch_call.call_args[0]
+    assert [call[1:] for call in calls] == [('getCondition', ['0x01']),
+                                            ('getCondition', ['0x02'])]
+    assert block_identifier == 'latest'
+    assert conditions == [None, ConditionValues(*condition)]
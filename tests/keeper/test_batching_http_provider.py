@@ -0,0 +1,54 @@
+"""Test BatchingHTTPProvider."""
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from squid_py.http_session_provider import HttpSessionProvider
+from squid_py.keeper.batching_http_provider import BatchingHTTPProvider
+from tests.resources.tiers import unit_test
+
+
+def _post(endpoint_uri, data, **kwargs):
+    time.sleep(0.01)
+    requests = json.loads(data)
+    if isinstance(requests, dict):
+        content = {'jsonrpc': '2.0', 'id': requests['id'], 'result': requests['params'][0]}
+    else:
+        content = [{'jsonrpc': '2.0', 'id': request['id'], 'result': request['params'][0]}
+                   for request in reversed(requests)]
+    return Mock(content=json.dumps(content).encode('utf-8'))
+
+
+@pytest.fixture
+def session():
+    original = HttpSessionProvider._session
+    session = Mock()
+    session.post.side_effect = _post
+    HttpSessionProvider.set_session(session)
+    yield session
+    HttpSessionProvider.set_session(original)
+
+
+@unit_test
+def test_concurrent_calls_are_batched(session):
+    provider = BatchingHTTPProvider('http://localhost:8545', max_batch_size=4, max_latency=0.05)
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        responses = list(executor.map(
+            lambda i: provider.make_request('eth_getBalance', [i, 'latest']), range(10)))
+
+    assert [response['result'] for response in responses] == list(range(10))
+    assert 3 <= session.post.call_count < 10
+    assert not provider._sending
+
+
+@unit_test
+def test_single_call_is_not_batched(session):
+    provider = BatchingHTTPProvider('http://localhost:8545', max_batch_size=4)
+    assert provider.make_request('eth_getBalance', [1, 'latest'])['result'] == 1
+    assert provider.make_request('eth_getBalance', [2, 'latest'])['result'] == 2
+
+    assert session.post.call_count == 2
+    assert isinstance(json.loads(session.post.call_args[1]['data']), dict)
@@ -0,0 +1,54 @@
+"""Test the compiled contract functions."""
+from unittest.mock import Mock
+
+from eth_abi import encode_abi
+from web3 import HTTPProvider, Web3
+from web3.contract import ConciseContract
+
+from squid_py.keeper.compiled_function import CompiledConciseMethod
+from tests.resources.tiers import unit_test
+
+CONTRACT_ADDRESS = '0x86DF95937ec3761588e6DEbAB6E3508e271cC4dc'
+ACCOUNT_ADDRESS = '0x00Bd138aBD70e2F00903268F3Db08f2D25677C9e'
+TOKEN_ABI = [
+    {'constant': True, 'name': 'balanceOf', 'type': 'function', 'stateMutability': 'view',
+     'payable': False, 'inputs': [{'name': 'owner', 'type': 'address'}],
+     'outputs': [{'name': '', 'type': 'uint256'}]},
+    {'constant': False, 'name': 'transfer', 'type': 'function',
+     'stateMutability': 'nonpayable', 'payable': False,
+     'inputs': [{'name': 'to', 'type': 'address'}, {'name': 'value', 'type': 'uint256'}],
+     'outputs': [{'name': '', 'type': 'bool'}]},
+]
+
+
+def _concise_contract():
+    web3 = Web3(HTTPProvider('http://localhost:8545'))
+    web3.eth.call = Mock(return_value=encode_abi(['uint256'], [42]))
+    web3.eth.sendTransaction = Mock(return_value=b'\x01' * 32)
+    contract = web3.eth.contract(address=CONTRACT_ADDRESS, abi=TOKEN_ABI)
+    return web3, contract, ConciseContract(contract, CompiledConciseMethod)
+
+
+@unit_test
+def test_compiled_call():
+    web3, contract, concise = _concise_contract()
+
+    assert concise.balanceOf(ACCOUNT_ADDRESS) == 42
+    transaction = web3.eth.call.call_args[0][0]
+    assert transaction == {
+        'to': CONTRACT_ADDRESS,
+        'data': contract.encodeABI(fn_name='balanceOf', args=[ACCOUNT_ADDRESS])
+    }
+
+
+@unit_test
+def test_compiled_transact():
+    web3, contract, concise = _concise_contract()
+
+    assert concise.transfer(ACCOUNT_ADDRESS, 5, transact={'from': ACCOUNT_ADDRESS}) == \
+        b'\x01' * 32
+    web3.eth.sendTransaction.assert_called_once_with({
+        'from': ACCOUNT_ADDRESS,
+        'to': CONTRACT_ADDRESS,
+        'data': contract.encodeABI(fn_name='transfer', args=[ACCOUNT_ADDRESS, 5])
+    })
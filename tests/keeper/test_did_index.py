@@ -0,0 +1,87 @@
+"""Test DIDIndex."""
+from unittest.mock import Mock
+
+import pytest
+
+from squid_py.keeper.did_index import DIDIndex
+from squid_py.keeper.didregistry import DIDRegistry
+from tests.resources.tiers import unit_test
+
+OWNER = '0x00Bd138aBD70e2F00903268F3Db08f2D25677C9e'
+
+
+@pytest.fixture
+def web3(set_web3):
+    web3 = Mock()
+    web3.eth.blockNumber = 25000
+    return set_web3(web3)
+
+
+def _attribute(did_bytes, url, block_number):
+    return {'checksum': b'\x01' * 32, 'value': url, 'block_number': block_number,
+            'did_bytes': did_bytes, 'owner': OWNER}
+
+
+@unit_test
+def test_did_index(web3, tmpdir):
+    did_bytes = b'\x02' * 32
+    did_registry = Mock()
+    did_registry.address = '0x86DF95937ec3761588e6DEbAB6E3508e271cC4dc'
+    did_registry.get_attribute_events.side_effect = lambda from_block, to_block: [
+        _attribute(did_bytes, f'http://aquarius{block_number}', block_number)
+        for block_number in (120, 21000) if from_block <= block_number <= to_block
+    ]
+    index = DIDIndex(did_registry, str(tmpdir.join('squid.db')), from_block=100)
+    assert index.get(did_bytes) is None
+    assert index.last_block is None
+    assert not index.is_ready
+
+    assert index.update() == 25000
+    assert index.is_ready
+    assert [call[0] for call in did_registry.get_attribute_events.call_args_list] == [
+        (100, 10099), (10100, 20099), (20100, 25000)]
+    attribute = index.get(did_bytes)
+    assert attribute['value'] == 'http://aquarius21000'
+    assert attribute['block_number'] == 21000
+    assert attribute['owner'] == OWNER
+    assert attribute['checksum'] == b'\x01' * 32
+
+    web3.eth.blockNumber = 25010
+    index.update()
+    assert did_registry.get_attribute_events.call_args[0] == (25001, 25010)
+    assert index.last_block == 25010
+
+    # a new process resumes from the recorded block
+    index = DIDIndex(did_registry, str(tmpdir.join('squid.db')), from_block=100)
+    assert index.last_block == 25010
+    assert index.get(did_bytes)['block_number'] == 21000
+
+
+@unit_test
+def test_indexed_attribute_lookup(web3, tmpdir):
+    did_bytes = b'\x02' * 32
+    did_registry = Mock()
+    did_registry.address = '0x86DF95937ec3761588e6DEbAB6E3508e271cC4dc'
+    did_registry.get_attribute_events.return_value = [
+        _attribute(did_bytes, 'http://aquarius', 21000)]
+    index = DIDIndex(did_registry, str(tmpdir.join('squid.db')), from_block=20000)
+    did_registry._get_index.return_value = index
+
+    # the index is built in the background, the lookups fall back until it is ready
+    assert DIDRegistry._get_indexed_attribute(did_registry, did_bytes) is None
+    index.update_in_background().join()
+    assert index.is_ready
+    attribute = DIDRegistry._get_indexed_attribute(did_registry, did_bytes, 21000)
+    assert attribute['value'] == 'http://aquarius'
+    assert did_registry.get_attribute_events.call_count == 1
+
+    # the indexed dids are looked up without calling the keeper
+    eth = web3.eth
+    web3.eth = None
+    assert DIDRegistry._get_indexed_attribute(did_registry, did_bytes)['block_number'] == 21000
+    web3.eth = eth
+
+    # the keeper can not be reached
+    web3.eth.blockNumber = 25010
+    did_registry.get_attribute_events.side_effect = ConnectionError('connection refused')
+    assert DIDRegistry._get_indexed_attribute(did_registry, b'\x03' * 32) is None
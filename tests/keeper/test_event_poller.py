@@ -0,0 +1,474 @@
+"""Test EventPoller."""
+import asyncio
+import json
+import time
+from threading import Event
+from unittest.mock import MagicMock, Mock
+
+import pytest
+from eth_utils import event_abi_to_log_topic
+from hexbytes import HexBytes
+from web3 import Web3
+
+from squid_py.keeper.contract_handler import ContractHandler
+from squid_py.keeper.event_cursors import get_event_cursor, record_event_cursors
+from squid_py.keeper.event_listener import EventListener
+from squid_py.keeper.event_poller import EventPoller, EventSubscription, _LogsSubscription
+from tests.resources.tiers import unit_test
+
+CONTRACT_ADDRESS = '0x86DF95937ec3761588e6DEbAB6E3508e271cC4dc'
+FULFILLED_ABI = {
+    'anonymous': False,
+    'name': 'Fulfilled',
+    'type': 'event',
+    'inputs': [
+        {'indexed': True, 'name': '_agreementId', 'type': 'bytes32'},
+        {'indexed': False, 'name': '_conditionId', 'type': 'bytes32'},
+    ]
+}
+
+
+def _make_log(agreement_id, block_number):
+    return {
+        'address': CONTRACT_ADDRESS,
+        'topics': [HexBytes(event_abi_to_log_topic(FULFILLED_ABI)), HexBytes(agreement_id)],
+        'data': Web3.toHex(b'\x02' * 32),
+        'blockNumber': block_number,
+        'blockHash': HexBytes(b'\x03' * 32),
+        'logIndex': 0,
+        'transactionIndex': 0,
+        'transactionHash': HexBytes(b'\x04' * 32),
+    }
+
+
+@pytest.fixture
+def web3(set_web3):
+    web3 = Mock()
+    web3.toHex = Web3.toHex
+    web3.eth.blockNumber = 10
+    web3.eth.getLogs = MagicMock(return_value=[])
+    return set_web3(web3)
+
+
+def _make_poller():
+    poller = EventPoller()
+    # poll manually instead of in the background thread
+    poller._thread = Mock()
+    return poller
+
+
+def _wait_for(events, count=1):
+    for _ in range(50):
+        if len(events) >= count:
+            return
+        time.sleep(0.01)
+
+
+@unit_test
+def test_one_get_logs_per_block_range_for_all_subscriptions(web3):
+    poller = _make_poller()
+    events = []
+    agreement_ids = [bytes([i]) * 32 for i in range(1, 6)]
+    for agreement_id in agreement_ids:
+        poller.subscribe(EventSubscription(
+            CONTRACT_ADDRESS, FULFILLED_ABI, lambda e, _id: events.append(_id),
+            filters={'_agreementId': agreement_id}, args=[agreement_id], from_block='latest'))
+
+    poller._poll()
+    assert web3.eth.getLogs.call_count == 0
+
+    web3.eth.blockNumber = 12
+    web3.eth.getLogs.return_value = [_make_log(agreement_ids[1], 11)]
+    poller._poll()
+    assert web3.eth.getLogs.call_count == 1
+    _wait_for(events)
+    assert events == [agreement_ids[1]]
+    assert len(poller._subscriptions) == 4
+
+
+@unit_test
+def test_subscription_finds_past_events(web3):
+    poller = _make_poller()
+    events = []
+    agreement_id = b'\x01' * 32
+    web3.eth.getLogs.return_value = [_make_log(agreement_id, 5)]
+    poller.subscribe(EventSubscription(
+        CONTRACT_ADDRESS, FULFILLED_ABI, lambda e: events.append(e),
+        filters={'_agreementId': agreement_id}, from_block=0))
+
+    poller._poll()
+    _wait_for(events)
+    assert len(events) == 1
+    assert events[0].args['_agreementId'] == agreement_id
+    assert not poller._subscriptions
+
+
+@unit_test
+def test_one_get_logs_for_the_past_events_of_new_subscriptions(web3):
+    poller = _make_poller()
+    events = []
+    agreement_a, agreement_b = b'\x01' * 32, b'\x02' * 32
+    web3.eth.getLogs.return_value = [_make_log(agreement_a, 2), _make_log(agreement_b, 2),
+                                     _make_log(agreement_b, 5)]
+    for agreement_id, from_block in ((agreement_a, 0), (agreement_b, 3)):
+        poller.subscribe(EventSubscription(
+            CONTRACT_ADDRESS, FULFILLED_ABI, lambda e: events.append(e),
+            filters={'_agreementId': agreement_id}, from_block=from_block))
+
+    poller._poll()
+    assert web3.eth.getLogs.call_count == 1
+    filter_params = web3.eth.getLogs.call_args[0][0]
+    assert (filter_params['fromBlock'], filter_params['toBlock']) == (0, 10)
+    assert filter_params['address'] == [CONTRACT_ADDRESS]
+    _wait_for(events, 2)
+    # the event of agreement b before its `from_block` is skipped
+    assert sorted((e.args['_agreementId'], e.blockNumber) for e in events) == [
+        (agreement_a, 2), (agreement_b, 5)]
+
+
+@unit_test
+def test_subscription_timeout(web3):
+    poller = _make_poller()
+    timed_out = []
+    poller.subscribe(EventSubscription(
+        CONTRACT_ADDRESS, FULFILLED_ABI, None, from_block='latest', timeout=1,
+        timeout_callback=lambda: timed_out.append(True), start_time=int(time.time()) - 5))
+
+    poller._try_poll()
+    _wait_for(timed_out)
+    assert timed_out == [True]
+
+
+@unit_test
+def test_subscriptions_kept_when_past_events_lookup_fails(web3):
+    poller = _make_poller()
+    timed_out = []
+    web3.eth.getLogs.side_effect = ConnectionError('keeper is down')
+    for timeout in (None, 1):
+        poller.subscribe(EventSubscription(
+            CONTRACT_ADDRESS, FULFILLED_ABI, None, from_block=0, timeout=timeout,
+            timeout_callback=lambda: timed_out.append(True), start_time=int(time.time()) - 5))
+
+    poller._try_poll()
+    _wait_for(timed_out)
+    assert timed_out == [True]
+    assert len(poller._new_subscriptions) == 1
+
+    web3.eth.getLogs.side_effect = None
+    poller._try_poll()
+    assert not poller._new_subscriptions
+    assert len(poller._subscriptions) == 1
+
+
+@unit_test
+def test_wakeup_does_not_need_a_worker(web3):
+    poller = EventPoller(max_workers=1)
+    poller._thread = Mock()
+    agreement_a, agreement_b = b'\x01' * 32, b'\x02' * 32
+    events = []
+
+    def _wait_for_b(event):
+        # a callback blocking on another event, as a blocking `listen_once` does
+        received = Event()
+        poller.subscribe(EventSubscription(
+            CONTRACT_ADDRESS, FULFILLED_ABI, None, filters={'_agreementId': agreement_b},
+            from_block='latest', wakeup=lambda e: received.set()))
+        received.wait(2)
+        events.append(received.is_set())
+
+    poller.subscribe(EventSubscription(
+        CONTRACT_ADDRESS, FULFILLED_ABI, _wait_for_b, filters={'_agreementId': agreement_a},
+        from_block='latest'))
+    poller._poll()
+    web3.eth.blockNumber = 11
+    web3.eth.getLogs.return_value = [_make_log(agreement_a, 11)]
+    poller._poll()
+    time.sleep(0.05)
+
+    web3.eth.blockNumber = 12
+    web3.eth.getLogs.return_value = [_make_log(agreement_b, 12)]
+    poller._poll()
+    _wait_for(events)
+    assert events == [True]
+
+
+@unit_test
+def test_listen_once_async(web3):
+    poller = _make_poller()
+    original_poller = EventPoller._instance
+    EventPoller._instance = poller
+    contract = Mock()
+    contract.events.Fulfilled.address = CONTRACT_ADDRESS
+    contract.events.Fulfilled.return_value.abi = FULFILLED_ABI
+    ContractHandler._contracts['TestCondition'] = (contract, Mock())
+    agreement_id = b'\x01' * 32
+
+    async def _wait_for_event():
+        future = EventListener(
+            'TestCondition', 'Fulfilled', filters={'_agreementId': agreement_id}
+        ).listen_once_async(timeout=10)
+        # mined after the subscription
+        web3.eth.blockNumber = 11
+        web3.eth.getLogs.return_value = [_make_log(agreement_id, 11)]
+        await asyncio.get_event_loop().run_in_executor(None, poller._poll)
+        return await asyncio.wait_for(future, 1)
+
+    try:
+        event = asyncio.new_event_loop().run_until_complete(_wait_for_event())
+        assert event.args['_agreementId'] == agreement_id
+    finally:
+        EventPoller._instance = original_poller
+        ContractHandler._contracts.pop('TestCondition')
+
+
+@unit_test
+def test_event_cursors(tmpdir):
+    storage_path = str(tmpdir.join('squid.db'))
+    assert get_event_cursor(storage_path, CONTRACT_ADDRESS, 'Fulfilled') is None
+    record_event_cursors(storage_path, [(CONTRACT_ADDRESS, 'Fulfilled', 7)])
+    record_event_cursors(storage_path, [(CONTRACT_ADDRESS, 'Fulfilled', 9)])
+    assert get_event_cursor(storage_path, CONTRACT_ADDRESS.lower(), 'Fulfilled') == 9
+    assert get_event_cursor(storage_path, CONTRACT_ADDRESS, 'Created') is None
+
+
+@unit_test
+def test_subscription_resumes_from_recorded_block(web3, tmpdir):
+    storage_path = str(tmpdir.join('squid.db'))
+    poller = EventPoller(storage_path=storage_path)
+    poller._thread = Mock()
+    poller.subscribe(EventSubscription(
+        CONTRACT_ADDRESS, FULFILLED_ABI, None, from_block='latest'))
+    poller._poll()
+    assert get_event_cursor(storage_path, CONTRACT_ADDRESS, 'Fulfilled()') == 10
+
+    # a new poller, as after a restart
+    web3.eth.blockNumber = 15
+    poller = EventPoller(storage_path=storage_path)
+    poller._thread = Mock()
+    poller.subscribe(EventSubscription(
+        CONTRACT_ADDRESS, FULFILLED_ABI, None, from_block=None))
+    poller._poll()
+    filter_params = web3.eth.getLogs.call_args[0][0]
+    assert filter_params['fromBlock'] == 11
+    assert filter_params['toBlock'] == 15
+
+    # the default `from_block` also starts after the recorded block
+    web3.eth.blockNumber = 20
+    poller = EventPoller(storage_path=storage_path)
+    poller._thread = Mock()
+    poller.subscribe(EventSubscription(CONTRACT_ADDRESS, FULFILLED_ABI, None))
+    poller._poll()
+    filter_params = web3.eth.getLogs.call_args[0][0]
+    assert (filter_params['fromBlock'], filter_params['toBlock']) == (16, 20)
+
+
+@unit_test
+def test_subscription_cursor_deleted_after_its_callback(web3, tmpdir):
+    storage_path = str(tmpdir.join('squid.db'))
+    poller = EventPoller(storage_path=storage_path)
+    poller._thread = Mock()
+    agreement_a, agreement_b = b'\x01' * 32, b'\x02' * 32
+    release = Event()
+    events = []
+
+    def _callback(event):
+        release.wait(1)
+        events.append(event)
+
+    subscriptions = [
+        EventSubscription(CONTRACT_ADDRESS, FULFILLED_ABI, _callback,
+                          filters={'_agreementId': agreement_id}, from_block='latest')
+        for agreement_id in (agreement_a, agreement_b)
+    ]
+    for subscription in subscriptions:
+        poller.subscribe(subscription)
+    poller._poll()
+
+    web3.eth.blockNumber = 20
+    web3.eth.getLogs.return_value = [_make_log(agreement_a, 11)]
+    poller._poll()
+    cursor_a, cursor_b = [s.cursor_name for s in subscriptions]
+    assert get_event_cursor(storage_path, CONTRACT_ADDRESS, cursor_b) == 20
+    assert get_event_cursor(storage_path, CONTRACT_ADDRESS, cursor_a) == 10
+
+    release.set()
+    _wait_for(events)
+    time.sleep(0.05)
+    # the subscription is complete, it is not resumed after a restart
+    assert get_event_cursor(storage_path, CONTRACT_ADDRESS, cursor_a) is None
+    resumed = EventSubscription(CONTRACT_ADDRESS, FULFILLED_ABI, _callback,
+                                filters={'_agreementId': agreement_a}, from_block=None,
+                                timeout=0.01, start_time=1)
+    poller.subscribe(resumed)
+    poller._try_poll()
+    assert resumed.done
+    time.sleep(0.05)
+    assert len(events) == 1
+
+
+@unit_test
+def test_subscription_cursor_deleted_after_timeout(web3, tmpdir):
+    storage_path = str(tmpdir.join('squid.db'))
+    poller = EventPoller(storage_path=storage_path)
+    poller._thread = Mock()
+    timeouts = []
+    subscription = EventSubscription(
+        CONTRACT_ADDRESS, FULFILLED_ABI, None, from_block='latest', timeout=60,
+        timeout_callback=lambda: timeouts.append(True))
+    poller.subscribe(subscription)
+    poller._try_poll()
+    assert get_event_cursor(storage_path, CONTRACT_ADDRESS, 'Fulfilled()') == 10
+
+    subscription.start_time = 1
+    poller._try_poll()
+    _wait_for(timeouts)
+    time.sleep(0.05)
+    assert get_event_cursor(storage_path, CONTRACT_ADDRESS, 'Fulfilled()') is None
+
+    # the cursor of an unsubscribed subscription is deleted by the next poll
+    subscription_id = poller.subscribe(EventSubscription(
+        CONTRACT_ADDRESS, FULFILLED_ABI, None, from_block='latest'))
+    poller._try_poll()
+    assert get_event_cursor(storage_path, CONTRACT_ADDRESS, 'Fulfilled()') == 10
+    poller.unsubscribe(subscription_id)
+    poller._try_poll()
+    assert get_event_cursor(storage_path, CONTRACT_ADDRESS, 'Fulfilled()') is None
+
+
+@unit_test
+def test_events_wait_for_confirmations(web3):
+    poller = EventPoller(confirmations=3)
+    poller._thread = Mock()
+    web3.eth.getBlock = lambda block_number: {'hash': bytes([block_number]) * 32}
+    events = []
+    agreement_id = b'\x01' * 32
+    poller.subscribe(EventSubscription(
+        CONTRACT_ADDRESS, FULFILLED_ABI, lambda e: events.append(e),
+        filters={'_agreementId': agreement_id}, from_block='latest'))
+    poller._poll()
+    assert poller.last_block == 7
+
+    web3.eth.blockNumber = 12
+    web3.eth.getLogs.return_value = [_make_log(agreement_id, 9)]
+    poller._poll()
+    filter_params = web3.eth.getLogs.call_args[0][0]
+    assert (filter_params['fromBlock'], filter_params['toBlock']) == (8, 9)
+    _wait_for(events)
+    assert len(events) == 1
+
+
+@unit_test
+def test_poller_rewinds_after_reorg(web3):
+    poller = EventPoller(confirmations=1)
+    poller._thread = Mock()
+    hashes = {block_number: bytes([block_number]) * 32 for block_number in range(20)}
+    web3.eth.getBlock = lambda block_number: {'hash': hashes[block_number]}
+    poller.subscribe(EventSubscription(
+        CONTRACT_ADDRESS, FULFILLED_ABI, None, from_block='latest'))
+    poller._poll()
+    web3.eth.blockNumber = 12
+    poller._poll()
+    assert poller.last_block == 11
+
+    # blocks 10 and 11 are replaced
+    hashes[10] = hashes[11] = b'\xff' * 32
+    web3.eth.blockNumber = 13
+    poller._poll()
+    filter_params = web3.eth.getLogs.call_args[0][0]
+    assert (filter_params['fromBlock'], filter_params['toBlock']) == (10, 12)
+    assert poller.last_block == 12
+
+
+@unit_test
+def test_pushed_logs_held_until_confirmed(web3):
+    poller = EventPoller(confirmations=2)
+    poller._thread = Mock()
+    events = []
+    agreement_id = b'\x01' * 32
+    poller.subscribe(EventSubscription(
+        CONTRACT_ADDRESS, FULFILLED_ABI, lambda e: events.append(e),
+        filters={'_agreementId': agreement_id}, from_block='latest'))
+    poller._activate_new_subscriptions(8)
+
+    removed_log = dict(_make_log(agreement_id, 10), blockHash=HexBytes(b'\x05' * 32))
+    poller._hold_logs([removed_log, _make_log(agreement_id, 11)])
+    poller._hold_logs([dict(removed_log, removed=True)])
+    poller._process_confirmed_logs()
+    assert len(poller._pending_logs) == 1
+    assert poller.last_block == 8
+
+    web3.eth.blockNumber = 13
+    poller._process_confirmed_logs()
+    _wait_for(events)
+    assert len(events) == 1
+    assert events[0].blockNumber == 11
+    assert not poller._pending_logs
+    assert poller.last_block == 11
+
+
+@unit_test
+def test_held_logs_dropped_when_websocket_fails(web3):
+    class _Stop(Exception):
+        pass
+
+    async def _push(endpoint_uri, loop):
+        raise ConnectionError('connection closed')
+
+    poller = EventPoller(confirmations=2)
+    poller._thread = Mock()
+    poller._hold_logs([_make_log(b'\x01' * 32, 11)])
+    poller._push = _push
+    poller._try_poll = Mock(side_effect=_Stop)
+    with pytest.raises(_Stop):
+        poller._run_push('ws://localhost:8546')
+    assert not poller._pending_logs
+
+
+class _FakeWebsocket:
+    def __init__(self, messages):
+        self.sent = []
+        self.messages = messages
+
+    async def send(self, message):
+        self.sent.append(json.loads(message))
+
+    async def recv(self):
+        if not self.messages:
+            await asyncio.sleep(10)
+        return json.dumps(self.messages.pop(0))
+
+
+@unit_test
+def test_logs_subscription_pushes_logs():
+    agreement_id = b'\x01' * 32
+    raw_log = {
+        'address': CONTRACT_ADDRESS.lower(),
+        'topics': [Web3.toHex(event_abi_to_log_topic(FULFILLED_ABI)), Web3.toHex(agreement_id)],
+        'data': Web3.toHex(b'\x02' * 32),
+        'blockNumber': '0xb',
+        'blockHash': Web3.toHex(b'\x03' * 32),
+        'logIndex': '0x0',
+        'transactionIndex': '0x0',
+        'transactionHash': Web3.toHex(b'\x04' * 32),
+    }
+    websocket = _FakeWebsocket([
+        {'jsonrpc': '2.0', 'id': 0, 'result': '0xabc'},
+        {'jsonrpc': '2.0', 'method': 'eth_subscription',
+         'params': {'subscription': '0xabc', 'result': raw_log}},
+    ])
+
+    async def _get_logs():
+        logs_subscription = _LogsSubscription(websocket)
+        await logs_subscription.subscribe([CONTRACT_ADDRESS])
+        logs = await logs_subscription.get_logs(1)
+        assert not await logs_subscription.get_logs(0.01)
+        return logs
+
+    logs = asyncio.new_event_loop().run_until_complete(_get_logs())
+    assert websocket.sent[0]['method'] == 'eth_subscribe'
+    assert websocket.sent[0]['params'] == ['logs', {'address': [CONTRACT_ADDRESS]}]
+    assert len(logs) == 1
+    assert logs[0]['blockNumber'] == 11
+    event = EventSubscription(CONTRACT_ADDRESS, FULFILLED_ABI, None,
+                              filters={'_agreementId': agreement_id}).match(logs[0])
+    assert event.args['_agreementId'] == agreement_id
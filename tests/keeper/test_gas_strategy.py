@@ -0,0 +1,64 @@
+"""Test the EstimatingGasStrategy."""
+from unittest.mock import Mock
+
+import pytest
+
+from squid_py.keeper.gas_strategy import EstimatingGasStrategy
+from tests.resources.tiers import unit_test
+
+ADDRESS = '0x00Bd138aBD70e2F00903268F3Db08f2D25677C9e'
+
+
+@pytest.fixture
+def web3(set_web3):
+    return set_web3(Mock(providers=[Mock()]))
+
+
+def _block(gas_prices):
+    return {'transactions': [{'gasPrice': hex(price)} for price in gas_prices]}
+
+
+@unit_test
+def test_gas_price_percentile(web3):
+    blocks = {0: _block([1, 2]), 1: _block([3]), 2: _block([4, 5, 6]), 3: _block([])}
+    web3.providers[0].make_request.side_effect = lambda method, params: {
+        'result': blocks[int(params[0], 16)]}
+    strategy = EstimatingGasStrategy(gas_price_percentile=50, gas_price_blocks=3)
+
+    web3.eth.blockNumber = 2
+    assert strategy.get_gas_price() == 4
+    assert strategy.get_gas_price() == 4
+    assert web3.providers[0].make_request.call_count == 3
+
+    web3.eth.blockNumber = 3
+    assert strategy.get_gas_price() == 5
+    assert web3.providers[0].make_request.call_count == 4
+
+
+@unit_test
+def test_gas_estimate_cached(web3, config):
+    strategy = EstimatingGasStrategy(gas_margin=1.5)
+    contract = Mock()
+    contract.name = 'DIDRegistry'
+    estimate = contract.contract.functions.registerAttribute.return_value.estimateGas
+    estimate.return_value = 100000
+
+    args = [b'\x01' * 32, b'\x02' * 32, 'http://localhost:5000']
+    assert strategy.get_gas(contract, 'registerAttribute', args, ADDRESS) == 150000
+    assert strategy.get_gas(contract, 'registerAttribute', args, ADDRESS) == 150000
+    assert estimate.call_count == 1
+
+    strategy.record_receipt(contract, 'registerAttribute', args, {'gas': 150000},
+                            Mock(status=1, gasUsed=120000))
+    assert strategy.get_gas(contract, 'registerAttribute', args, ADDRESS) == 180000
+
+    args[2] = 'http://localhost:5000/a/longer/url'
+    strategy.get_gas(contract, 'registerAttribute', args, ADDRESS)
+    assert estimate.call_count == 2
+
+    estimate.side_effect = ValueError('reverted')
+    assert strategy.get_gas(contract, 'registerAttribute', args[:2] + [''], ADDRESS) == 4000000
+
+    stats = strategy.get_stats()['DIDRegistry.registerAttribute']
+    assert stats['gas_estimate'] == 100000
+    assert stats['gas_used_max'] == 120000
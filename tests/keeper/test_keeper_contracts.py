@@ -5,8 +5,14 @@
     that the contact can be loaded and used
 
 """
+from unittest.mock import Mock
+
 from squid_py.keeper import Keeper
-from tests.resources.tiers import e2e_test
+from squid_py.keeper.artifacts_loader import ArtifactsLoader
+from squid_py.keeper.contract_handler import ContractHandler
+from squid_py.keeper.didregistry import DIDRegistry
+from squid_py.keeper.web3_provider import Web3Provider
+from tests.resources.tiers import e2e_test, unit_test
 
 
 @e2e_test
@@ -30,3 +36,56 @@ def test_keeper_networks():
     assert keeper.get_network_name(8995) == Keeper._network_name_map.get(8995)
     assert keeper.get_network_name(8996) == Keeper._network_name_map.get(8996)
     assert keeper.get_network_name(0) == 'development'
+
+
+@unit_test
+def test_keeper_loads_contracts_on_demand():
+    original = ContractHandler._contracts.get('DIDRegistry')
+    ContractHandler._contracts['DIDRegistry'] = (Mock(), Mock())
+    try:
+        keeper = Keeper()
+        assert not keeper.__dict__
+        did_registry = keeper.did_registry
+        assert isinstance(did_registry, DIDRegistry)
+        assert keeper.did_registry is did_registry
+        assert list(keeper.__dict__) == ['did_registry']
+    finally:
+        if original:
+            ContractHandler._contracts['DIDRegistry'] = original
+        else:
+            ContractHandler._contracts.pop('DIDRegistry')
+
+
+@unit_test
+def test_keeper_get_instance_is_cached():
+    Keeper.reset_instance()
+    try:
+        keeper = Keeper.get_instance()
+        assert Keeper.get_instance() is keeper
+
+        other = Keeper()
+        Keeper.set_instance(other)
+        assert Keeper.get_instance() is other
+
+        Keeper.reset_instance()
+        assert Keeper.get_instance() not in (keeper, other)
+    finally:
+        Keeper.reset_instance()
+
+
+@unit_test
+def test_keeper_reset_instance_drops_the_cached_contracts(set_web3):
+    contracts = dict(ContractHandler._contracts)
+    loaders = dict(ArtifactsLoader._loaders)
+    try:
+        ContractHandler._contracts['DIDRegistry'] = (Mock(), Mock())
+        ArtifactsLoader.get_loader('artifacts')
+        set_web3(Mock())
+
+        Keeper.reset_instance()
+        assert not ContractHandler.has('DIDRegistry')
+        assert not ArtifactsLoader._loaders
+        assert Web3Provider._web3 is None
+    finally:
+        ContractHandler._contracts.update(contracts)
+        ArtifactsLoader._loaders.update(loaders)
@@ -0,0 +1,82 @@
+"""Test the local nonce assignment of the transactions."""
+from unittest.mock import Mock
+
+import pytest
+
+from squid_py.keeper.contract_base import ContractBase
+from squid_py.keeper.gas_strategy import GasStrategy, GasStrategyProvider
+from squid_py.keeper.nonce_manager import NonceManager
+from tests.resources.tiers import unit_test
+
+ADDRESS = '0x00Bd138aBD70e2F00903268F3Db08f2D25677C9e'
+
+
+@pytest.fixture
+def web3(set_web3):
+    web3 = set_web3(Mock())
+    web3.eth.getTransactionCount.return_value = 7
+    GasStrategyProvider.set_strategy(GasStrategy())
+    yield web3
+    GasStrategyProvider.set_strategy(None)
+
+
+@unit_test
+def test_nonce_manager(web3):
+    manager = NonceManager(ADDRESS)
+    assert [manager.get_nonce() for _ in range(3)] == [7, 8, 9]
+    web3.eth.getTransactionCount.assert_called_once_with(ADDRESS, 'pending')
+
+    manager.release_nonce(9)
+    assert manager.get_nonce() == 9
+
+    # the gap of a nonce released out of order is filled first
+    assert [manager.get_nonce() for _ in range(2)] == [10, 11]
+    manager.release_nonce(8)
+    manager.release_nonce(10)
+    assert [manager.get_nonce() for _ in range(3)] == [8, 10, 12]
+    assert web3.eth.getTransactionCount.call_count == 1
+
+    manager.reset()
+    web3.eth.getTransactionCount.return_value = 20
+    manager.release_nonce(12)
+    assert manager.get_nonce() == 20
+
+
+@unit_test
+def test_submit_transaction(web3):
+    NonceManager._managers.pop(ADDRESS.lower(), None)
+    handler = Mock()
+    contract = ContractBase('Token', {'ContractHandler': handler})
+    web3.providers = [Mock()]
+    web3.providers[0].make_request.return_value = {
+        'result': {'blockNumber': '0x1', 'status': '0x1'}}
+    contract.contract_concise.transfer.side_effect = [b'\x01', b'\x02', ValueError('gas'), b'\x03']
+
+    futures = [contract.submit_transaction('transfer', [ADDRESS, i], {'from': ADDRESS})
+               for i in range(2)]
+    assert [future.result().status for future in futures] == [1, 1]
+    with pytest.raises(ValueError):
+        contract.send_transaction('transfer', [ADDRESS, 2], {'from': ADDRESS})
+    contract.send_transaction('transfer', [ADDRESS, 3], {'from': ADDRESS})
+
+    nonces = [kwargs['transact']['nonce']
+              for _, kwargs in contract.contract_concise.transfer.call_args_list]
+    assert nonces == [7, 8, 9, 9]
+
+
+@unit_test
+def test_nonce_rejected_by_keeper(web3):
+    NonceManager._managers.pop(ADDRESS.lower(), None)
+    contract = ContractBase('Token', {'ContractHandler': Mock()})
+    contract.contract_concise.transfer.side_effect = [
+        ValueError({'code': -32000, 'message': 'nonce too low'}), b'\x01']
+
+    with pytest.raises(ValueError):
+        contract.send_transaction('transfer', [ADDRESS, 1], {'from': ADDRESS})
+    web3.eth.getTransactionCount.return_value = 9
+    web3.providers = []
+    contract.send_transaction('transfer', [ADDRESS, 1], {'from': ADDRESS})
+
+    nonces = [kwargs['transact']['nonce']
+              for _, kwargs in contract.contract_concise.transfer.call_args_list]
+    assert nonces == [7, 9]
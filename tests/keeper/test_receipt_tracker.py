@@ -0,0 +1,63 @@
+"""Test the ReceiptTracker."""
+from unittest.mock import Mock
+
+import pytest
+
+from squid_py.keeper.receipt_tracker import ReceiptTracker
+from squid_py.keeper.web3_provider import Web3Provider
+from tests.resources.tiers import unit_test
+
+TX_HASH = '0x' + '01' * 32
+
+
+def _receipt(tx_hash):
+    return {'transactionHash': tx_hash, 'blockNumber': '0x2', 'blockHash': '0x' + '02' * 32,
+            'transactionIndex': '0x0', 'status': '0x1', 'gasUsed': '0x5208',
+            'cumulativeGasUsed': '0x5208', 'contractAddress': None, 'logs': []}
+
+
+@pytest.fixture
+def provider(set_web3):
+    provider = Mock()
+    set_web3(Mock(providers=[provider])).eth.blockNumber = 1
+    return provider
+
+
+@unit_test
+def test_receipt_tracker(provider):
+    mined = set()
+
+    def _make_request(method, params):
+        assert method == 'eth_getTransactionReceipt'
+        return {'result': _receipt(params[0]) if params[0] in mined else None}
+
+    provider.make_request.side_effect = _make_request
+    tracker = ReceiptTracker(poll_interval=0.01)
+    future = tracker.track(TX_HASH)
+    other_future = tracker.track(TX_HASH)
+    pending_future = tracker.track('0x' + '03' * 32, timeout=0.1)
+
+    mined.add(TX_HASH)
+    Web3Provider._web3.eth.blockNumber = 2
+    receipt = future.result(timeout=5)
+    assert receipt.status == 1
+    assert receipt.blockNumber == 2
+    assert other_future.result(timeout=5) is receipt
+
+    with pytest.raises(TimeoutError):
+        pending_future.result(timeout=5)
+    # one receipt request per block and per newly tracked transaction
+    assert provider.make_request.call_count <= 6
+
+
+@unit_test
+def test_receipt_tracker_error(provider):
+    provider.make_request.side_effect = [
+        ConnectionError('keeper is down'), {'result': _receipt(TX_HASH)}]
+    tracker = ReceiptTracker(poll_interval=0.01)
+    # the transaction is mined after the keeper could not be reached
+    assert tracker.track(TX_HASH).result(timeout=5).status == 1
+
+    provider.make_request.side_effect = ConnectionError('keeper is down')
+    with pytest.raises(TimeoutError, match='keeper is down'):
+        tracker.track(TX_HASH, timeout=0.1).result(timeout=5)
@@ -7,10 +7,12 @@ from squid_py.agreements.service_agreement_template import ServiceAgreementTempl
 from squid_py.agreements.service_types import ServiceTypes
 from squid_py.assets.asset_consumer import AssetConsumer
 from squid_py.keeper import Keeper
+from squid_py.keeper.agreements.agreement_manager import AgreementValues
+from squid_py.keeper.conditions.condition_manager import ConditionValues
 from squid_py.keeper.web3_provider import Web3Provider
 from squid_py.ocean.ocean_agreements import OceanAgreements
 from tests.resources.helper_functions import get_consumer_account, get_ddo_sample
-from tests.resources.tiers import e2e_test
+from tests.resources.tiers import e2e_test, unit_test
 
 
 @pytest.fixture
@@ -42,6 +44,30 @@ def test_prepare_agreement(ocean_agreements):
     # :TODO:
 
 
+@unit_test
+def test_get_agreements_status(set_web3):
+    set_web3(Mock(eth=Mock(blockNumber=10)))
+    keeper = Mock()
+    keeper.agreement_manager.get_agreements.return_value = [
+        AgreementValues('0xdid', '0xowner', '0xtemplate', ['0xc1', '0xc2'], '0xowner', 8),
+        None,
+    ]
+    keeper.condition_manager.get_conditions.return_value = [
+        ConditionValues('0xtype', 2, 0, 0, 8, '0xowner', 9),
+        None,
+    ]
+    status = OceanAgreements(keeper, Mock(), Mock(), Mock()).get_agreements_status(
+        ['0xa1', '0xa2'])
+
+    keeper.agreement_manager.get_agreements.assert_called_once_with(['0xa1', '0xa2'], 10)
+    keeper.condition_manager.get_conditions.assert_called_once_with(['0xc1', '0xc2'], 10)
+    assert status['0xa1']['agreement'].did == '0xdid'
+    # the condition that can not be read has no state
+    assert status['0xa1']['conditions'] == {'0xc1': 2, '0xc2': None}
+    # the agreement that can not be read
+    assert status['0xa2'] is None
+
+
 def test_send_agreement(ocean_agreements):
     pass
 
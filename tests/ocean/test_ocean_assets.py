@@ -1,3 +1,20 @@
+import json
+import os
+import time
+from concurrent.futures import Future
+from unittest.mock import Mock
+
+import pytest
+from web3 import Web3
+
+from squid_py.aquarius.aquarius import Aquarius
+from squid_py.aquarius.aquarius_provider import AquariusProvider
+from squid_py.ddo.ddo import DDO
+from squid_py.did import DID
+from squid_py.ocean.ocean_assets import OceanAssets
+from tests.resources.helper_functions import get_resource_path
+from tests.resources.tiers import unit_test
+
 
 def test_assets_create():
     pass
@@ -11,6 +28,109 @@ def test_assets_query():
     pass
 
 
+@unit_test
+def test_assets_federated_search(config):
+    ddo_dict = json.loads(
+        DDO(json_filename=get_resource_path('ddo', 'ddo_sample1.json')).as_text())
+    ddo_dicts = [dict(ddo_dict, id=DID.did()) for _ in range(3)]
+    results = {
+        'http://aquarius1': ddo_dicts[:2],
+        'http://aquarius2': ddo_dicts[1:],
+        'http://slow': [dict(ddo_dict, id=DID.did())],
+    }
+
+    def text_search(url, text, *args):
+        if url == 'http://slow':
+            time.sleep(1)
+        if url == 'http://failing':
+            raise Exception('Unable to search for DDO')
+        return results[url]
+
+    def _aquarius(url):
+        return Mock(text_search=Mock(side_effect=lambda *args: text_search(url, *args)),
+                    query_search=Mock(return_value=results.get(url, [])))
+
+    AquariusProvider.set_aquarius_class(_aquarius)
+    try:
+        ocean_assets = OceanAssets(
+            None, None, None, None,
+            Mock(aquarius_url='http://aquarius1', has_option=Mock(return_value=False)))
+        aquarius_urls = ['http://aquarius1', 'http://slow', 'http://failing', 'http://aquarius2']
+
+        start = time.time()
+        ddos = ocean_assets.federated_search(aquarius_urls, text='Office', timeout=0.2)
+        assert time.time() - start < 0.9
+        assert [ddo.did for ddo in ddos] == [d['id'] for d in ddo_dicts]
+
+        ddos = ocean_assets.federated_search(['http://aquarius2', 'http://aquarius1'],
+                                             query={'query': {}})
+        assert [ddo.did for ddo in ddos] == [d['id'] for d in ddo_dicts[1:] + ddo_dicts[:1]]
+    finally:
+        AquariusProvider.set_aquarius_class(Aquarius)
+
+
+@unit_test
+def test_assets_create_many(tmpdir, set_web3):
+    set_web3(Mock(sha3=Web3.sha3))
+    did_registry = Mock()
+    receipt_statuses = [1, 0, 1, 1, 1, 1, 1]
+
+    def submit_register(did, checksum, url, account):
+        future = Future()
+        future.set_result(Mock(status=receipt_statuses.pop(0)))
+        return future
+
+    did_registry.submit_register.side_effect = submit_register
+    aquarius = Mock()
+    AquariusProvider.set_aquarius_class(lambda url: aquarius)
+    try:
+        ocean_assets = OceanAssets(
+            Mock(did_registry=did_registry), None, None, None,
+            Mock(aquarius_url='http://aquarius', has_option=Mock(return_value=False),
+                 storage_path=os.path.join(str(tmpdir), 'squid.db')))
+        ocean_assets._build_ddo = Mock(side_effect=lambda metadata, *args: (
+            Mock(did=f'did:op:{metadata["index"]}'), 'checksum', 'http://aquarius/ddo'))
+        metadata_list = [{'index': index} for index in range(3)]
+
+        results = ocean_assets.create_many(
+            iter(metadata_list), Mock(), batch_id='batch', max_workers=2, key_workers=1)
+        assert [(r.did, r.status) for r in results] == [
+            ('did:op:0', 'registered'), ('did:op:1', 'failed'), ('did:op:2', 'registered')]
+        assert aquarius.publish_asset_ddo.call_count == 3
+        assert len(ocean_assets._build_ddo.call_args[0][3]) > 0
+
+        # resuming the batch only registers the asset already published in aquarius
+        results = ocean_assets.create_many(
+            metadata_list, Mock(), batch_id='batch', max_workers=2, key_workers=1)
+        assert [(r.did, r.status) for r in results] == [
+            ('did:op:0', 'skipped'), ('did:op:1', 'registered'), ('did:op:2', 'skipped')]
+        assert aquarius.publish_asset_ddo.call_count == 3
+        assert ocean_assets._build_ddo.call_count == 3
+        assert did_registry.submit_register.call_args[0][0] == 'did:op:1'
+
+        # identical metadata items are published as separate assets
+        ocean_assets._build_ddo.side_effect = lambda metadata, *args: (
+            Mock(did=DID.did()), 'checksum', 'http://aquarius/ddo')
+        results = ocean_assets.create_many(
+            [{'index': 0}] * 2, Mock(), batch_id='duplicates', max_workers=2, key_workers=1)
+        assert [r.status for r in results] == ['registered', 'registered']
+        assert results[0].did != results[1].did
+
+        # the assets submitted before `metadata_iter` raises are recorded
+        def failing_iter():
+            yield {'index': 0}
+            raise ValueError('unreadable metadata')
+
+        with pytest.raises(ValueError):
+            ocean_assets.create_many(
+                failing_iter(), Mock(), batch_id='failing', max_workers=2, key_workers=1)
+        results = ocean_assets.create_many(
+            [{'index': 0}], Mock(), batch_id='failing', max_workers=2, key_workers=1)
+        assert [r.status for r in results] == ['skipped']
+    finally:
+        AquariusProvider.set_aquarius_class(Aquarius)
+
+
 def test_assets_retire():
     pass
 
@@ -0,0 +1,23 @@
+from squid_py.aquarius.aquarius import Aquarius
+from squid_py.aquarius.aquarius_provider import AquariusProvider
+from squid_py.http_session_provider import HttpSessionProvider, create_session
+from tests.resources.tiers import unit_test
+
+
+@unit_test
+def test_create_session():
+    session = create_session(pool_size=4, max_retries=2, timeout=5)
+    adapter = session.get_adapter('https://aquarius.example.com')
+    assert adapter._pool_maxsize == 4
+    assert adapter.max_retries.total == 2
+    assert session.timeout == 5
+    assert session.get_adapter('http://localhost:5000') is adapter
+
+
+@unit_test
+def test_aquarius_instances_share_the_session(config):
+    AquariusProvider.set_aquarius_class(Aquarius)
+    aquarius = AquariusProvider.get_aquarius('http://localhost:5000')
+    assert AquariusProvider.get_aquarius('http://localhost:5000') is aquarius
+    assert AquariusProvider.get_aquarius('http://localhost:5001') is not aquarius
+    assert aquarius._session is HttpSessionProvider.get_session()
@@ -1,9 +1,15 @@
+import time
+from unittest.mock import Mock
+
 import pytest
-from web3 import Web3
+from eth_account import Account as EthAccount
+from eth_account.messages import defunct_hash_message
+from web3 import HTTPProvider, Web3
 
 from squid_py.keeper.web3_provider import Web3Provider
 from squid_py.utils import utilities
-from tests.resources.tiers import e2e_test
+from squid_py.utils.cache import LRUCache
+from tests.resources.tiers import e2e_test, unit_test
 
 
 @e2e_test
@@ -40,3 +46,55 @@ def test_convert():
                                                     utilities.convert_to_bytes(Web3, input_text)))
     assert utilities.convert_to_text(Web3,
                                      utilities.convert_to_bytes(Web3, input_text)) == input_text
+
+
+@unit_test
+def test_lru_cache():
+    cache = LRUCache(max_size=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.pop('c') == 3
+    assert len(cache) == 1
+
+    cache = LRUCache(ttl=0.01)
+    cache.set('a', 1)
+    time.sleep(0.02)
+    assert cache.get('a', 'expired') == 'expired'
+
+
+@unit_test
+def test_get_public_key_from_address_cached(tmp_path, set_web3):
+    eth_account = EthAccount.create('entropy')
+    web3 = set_web3(Web3(HTTPProvider('http://localhost:8545')))
+    web3.eth.sign = Mock(side_effect=lambda address, msg_hash: EthAccount.signHash(
+        defunct_hash_message(primitive=msg_hash), eth_account.privateKey).signature)
+    storage_path = str(tmp_path.joinpath('storage.db'))
+    try:
+        pub_key = utilities.get_public_key_from_address(web3, eth_account.address, storage_path)
+        assert pub_key.to_checksum_address() == eth_account.address
+        assert utilities.get_public_key_from_address(web3, eth_account.address) == pub_key
+        assert web3.eth.sign.call_count == 1
+
+        utilities._public_keys.clear()
+        assert utilities.get_public_key_from_address(
+            web3, eth_account.address, storage_path) == pub_key
+        assert web3.eth.sign.call_count == 1
+    finally:
+        utilities._public_keys.clear()
+
+
+@unit_test
+def test_get_public_key_from_private_key():
+    eth_account = EthAccount.create('entropy')
+    web3 = Mock()
+    try:
+        pub_key = utilities.get_public_key_from_address(
+            web3, eth_account.address, private_key=eth_account.privateKey.hex())
+        assert pub_key.to_checksum_address() == eth_account.address
+        assert not web3.eth.sign.called
+    finally:
+        utilities._public_keys.clear()